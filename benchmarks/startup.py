@@ -0,0 +1,289 @@
+"""Measures the startup costs of the tracker.
+
+Every measurement runs in a new Python process started in an empty
+temporary directory, so that no module is already imported and the
+user files (configs, notes, data cache) are not reused unless the
+measurement is labeled as warm.
+
+The time to the first output of the tkinter ui needs a display,
+on headless hosts a virtual one is started with Xvfb if it is
+installed.
+
+Usage:
+    python -m benchmarks.startup [--repeat N] [--budgets FILE] [--json FILE]
+                                 [--allow-skipped]
+
+The exit code is 1 if any median time exceeds its budget or if
+a measurement was skipped, unless --allow-skipped is used.
+Budgets are in seconds, a json file can be used to override them.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from statistics import median
+
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED = 3556394350
+TIMEOUT = 120
+
+DATA_MODULES = (
+    'actions',
+    'actor',
+    'autoabilities',
+    'cache',
+    'characters',
+    'constants',
+    'encounter_formations',
+    'encounters',
+    'equipment',
+    'equipment_shops',
+    'file_functions',
+    'items',
+    'macros',
+    'magus_sister',
+    'monsters',
+    'notes',
+    'seeds',
+    'statuses',
+    'symbols',
+    'text_characters',
+)
+
+DEFAULT_BUDGETS = {
+    'import ffx_rng_tracker': 0.1,
+    'import ffx_rng_tracker.data.monsters (cold cache)': 1.5,
+    'import ffx_rng_tracker.data.encounter_formations (cold cache)': 1.5,
+    'Configs.init_configs': 0.5,
+    'get_monsters_dict (cold cache)': 2.0,
+    'get_monsters_dict (warm cache)': 0.5,
+    'ui_tkinter.main first output (warm cache)': 5.0,
+}
+# budget used for the measurements not in DEFAULT_BUDGETS
+DEFAULT_BUDGET = 1.0
+
+# the code is run in a new process and has to print the elapsed time
+_IMPORT_CODE = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+_CONFIGS_CODE = """
+import time
+from ffx_rng_tracker.configs import Configs
+start = time.perf_counter()
+Configs.init_configs()
+print(time.perf_counter() - start)
+"""
+
+_MONSTERS_CODE = """
+import time
+from ffx_rng_tracker.configs import Configs
+Configs.init_configs()
+start = time.perf_counter()
+import ffx_rng_tracker.data.encounter_formations
+from ffx_rng_tracker.data.monsters import get_monsters_dict
+get_monsters_dict()
+print(time.perf_counter() - start)
+"""
+
+_FIRST_OUTPUT_CODE = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+try:
+    tk.Tk().destroy()
+except tk.TclError:
+    print('skipped')
+    raise SystemExit
+from ffx_rng_tracker.configs import Configs
+from ffx_rng_tracker.ui_tkinter.main import main
+from ffx_rng_tracker.ui_tkinter.output_widget import TkVirtualOutputWidget
+
+print_output = TkVirtualOutputWidget.print_output
+
+def patched_print_output(self, output):
+    print_output(self, output)
+    if not output:
+        return
+    self.update_idletasks()
+    print(time.perf_counter() - start)
+    self.winfo_toplevel().quit()
+
+TkVirtualOutputWidget.print_output = patched_print_output
+Configs.init_configs()
+Configs.seed = {seed}
+main()
+"""
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    times: list[float]
+    budget: float
+    skipped: bool = False
+
+    @property
+    def median(self) -> float | None:
+        if not self.times:
+            return None
+        return median(self.times)
+
+    @property
+    def over_budget(self) -> bool:
+        return not self.skipped and self.median > self.budget
+
+    def to_dict(self) -> dict[str, object]:
+        data = asdict(self)
+        data['median'] = self.median
+        data['over_budget'] = self.over_budget
+        return data
+
+
+@contextmanager
+def virtual_display() -> Iterator[str | None]:
+    """Starts an Xvfb display and sets DISPLAY to it if there is
+    no display on an X11 platform, yields the display name or None
+    if no display was started.
+    """
+    if (sys.platform in ('win32', 'darwin')
+            or os.environ.get('DISPLAY')
+            or shutil.which('Xvfb') is None):
+        yield None
+        return
+    # Xvfb writes the number of a free display to the pipe
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(
+        ['Xvfb', '-displayfd', str(write_fd), '-nolisten', 'tcp'],
+        pass_fds=(write_fd,),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        )
+    os.close(write_fd)
+    try:
+        with os.fdopen(read_fd) as file_object:
+            display = f':{file_object.readline().strip()}'
+        os.environ['DISPLAY'] = display
+        yield display
+    finally:
+        os.environ.pop('DISPLAY', None)
+        process.terminate()
+        process.wait()
+
+
+def run_python_code(code: str, cwd: str) -> str:
+    """Run code in a new Python process and return its last output line."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        p for p in (REPOSITORY_PATH, env.get('PYTHONPATH')) if p)
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+    # keep the data cache in the temporary directory
+    env['FFX_RNG_TRACKER_CACHE'] = os.path.join(cwd, 'ffx_rng_tracker_cache')
+    completed = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=TIMEOUT,
+        check=True,
+        )
+    return completed.stdout.strip().splitlines()[-1]
+
+
+def get_measurements() -> dict[str, tuple[str, bool]]:
+    """Returns the code of every measurement and whether
+    it should be run with a warm data cache.
+    """
+    measurements = {
+        'import ffx_rng_tracker': (
+            _IMPORT_CODE.format(module='ffx_rng_tracker'), False),
+    }
+    for module in DATA_MODULES:
+        module = f'ffx_rng_tracker.data.{module}'
+        code = _IMPORT_CODE.format(module=module)
+        measurements[f'import {module} (cold cache)'] = (code, False)
+        measurements[f'import {module} (warm cache)'] = (code, True)
+    measurements['Configs.init_configs'] = (_CONFIGS_CODE, False)
+    measurements['get_monsters_dict (cold cache)'] = (_MONSTERS_CODE, False)
+    measurements['get_monsters_dict (warm cache)'] = (_MONSTERS_CODE, True)
+    measurements['ui_tkinter.main first output (warm cache)'] = (
+        _FIRST_OUTPUT_CODE.format(seed=SEED), True)
+    return measurements
+
+
+def run_benchmarks(repeat: int,
+                   budgets: dict[str, float],
+                   ) -> list[BenchmarkResult]:
+    results = []
+    for name, (code, warm_cache) in get_measurements().items():
+        result = BenchmarkResult(
+            name, [], budgets.get(name, DEFAULT_BUDGET))
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as directory:
+                if warm_cache:
+                    run_python_code(_MONSTERS_CODE, directory)
+                output = run_python_code(code, directory)
+            if output == 'skipped':
+                result.skipped = True
+                break
+            result.times.append(float(output))
+        results.append(result)
+    return results
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    width = max(len(r.name) for r in results)
+    for result in results:
+        if result.skipped:
+            status = 'skipped'
+            time = '-'
+        else:
+            status = 'OVER BUDGET' if result.over_budget else 'ok'
+            time = f'{result.median:.3f}s'
+        print(f'{result.name:<{width}}  {time:>8}  '
+              f'(budget {result.budget:.3f}s)  {status}')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--budgets', help='json file with the budgets in seconds')
+    parser.add_argument('--json', help='file to save the results to')
+    parser.add_argument(
+        '--allow-skipped', action='store_true',
+        help='do not fail when a measurement is skipped')
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    if args.budgets:
+        with open(args.budgets) as file_object:
+            budgets.update(json.load(file_object))
+
+    with virtual_display():
+        results = run_benchmarks(max(1, args.repeat), budgets)
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w') as file_object:
+            json.dump([r.to_dict() for r in results], file_object, indent=2)
+    if any(r.over_budget for r in results):
+        return 1
+    if not args.allow_skipped and any(r.skipped for r in results):
+        print('Some measurements were skipped, use --allow-skipped '
+              'to ignore them')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
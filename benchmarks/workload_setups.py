@@ -0,0 +1,283 @@
+"""Workloads measured by benchmarks.workloads.
+
+Importing this module loads the data of the tracker, so it is only
+imported once the user files are redirected to a temporary directory.
+"""
+import os
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from functools import partial
+from statistics import median
+
+from ffx_rng_tracker.configs import Configs
+from ffx_rng_tracker.data.constants import (DamageFormula, GameVersion,
+                                           SpeedrunCategory)
+from ffx_rng_tracker.data.encounter_formations import ZONES
+from ffx_rng_tracker.data.monsters import get_monsters_dict
+from ffx_rng_tracker.data.seeds import (FRAMES_FROM_BOOT,
+                                        POSSIBLE_XORED_DATETIMES,
+                                        SEEDS_DIRECTORY_PATH,
+                                        SEEDS_FILE_PATHS,
+                                        damage_rolls_to_values,
+                                        datetime_to_seed, get_damage_rolls,
+                                        get_seed, make_seeds_file)
+from ffx_rng_tracker.events.character_action import CharacterAction
+from ffx_rng_tracker.events.parser import EventParser
+from ffx_rng_tracker.gamestate import GameState
+from ffx_rng_tracker.tracker import FFXRNGTracker
+from ffx_rng_tracker.ui_abstract.actions_tracker import ActionsTracker
+from ffx_rng_tracker.ui_abstract.base_tracker import TrackerUI
+from ffx_rng_tracker.ui_abstract.drops_tracker import DropsTracker
+from ffx_rng_tracker.ui_abstract.encounters_planner import EncountersPlanner
+from ffx_rng_tracker.ui_abstract.encounters_tracker import EncountersTracker
+from ffx_rng_tracker.ui_abstract.seedfinder import SeedFinder
+from ffx_rng_tracker.ui_abstract.steps_tracker import StepsTracker
+from ffx_rng_tracker.ui_abstract.yojimbo_tracker import YojimboTracker
+from ffx_rng_tracker.ui_functions import (format_monster_data,
+                                          get_status_chance_table)
+
+SEED = 3556394350
+GAME_VERSIONS = (GameVersion.HD, GameVersion.PS2NA)
+PARSED_TRACKERS: tuple[type[TrackerUI], ...] = (
+    DropsTracker,
+    EncountersTracker,
+    StepsTracker,
+    ActionsTracker,
+    YojimboTracker,
+)
+# frames used to benchmark make_seeds_file
+SEEDS_FILE_FRAMES = 60
+
+type Workload = Callable[[], object]
+
+
+class BenchmarkWidget:
+    """Widget used in place of the ui widgets."""
+
+    def __init__(self) -> None:
+        self.tags = {}
+        self.text = ''
+
+    def get_input(self) -> str:
+        return self.text
+
+    def set_input(self, text: str) -> None:
+        self.text = text
+
+    def print_output(self, output: str) -> bool:
+        self.text = output
+        return True
+
+    def register_callback(self, callback_func: Callable[[], None]) -> None:
+        return
+
+    def register_tag(self, tag_name: str, tag=None) -> None:
+        if tag is None:
+            tag = Configs.ui_tags.get(tag_name)
+            if tag is None:
+                return
+        self.tags[tag_name] = tag
+
+    def highlight_pattern(self, tag_name: str, pattern) -> None:
+        return
+
+    def clean_tag(self, tag_name: str) -> None:
+        return
+
+    def seek(self, text: str) -> None:
+        return
+
+
+@dataclass
+class WorkloadResult:
+    name: str
+    times: list[float]
+
+    @property
+    def median(self) -> float:
+        return median(self.times)
+
+    def to_dict(self) -> dict[str, object]:
+        data = asdict(self)
+        data['median'] = self.median
+        data['min'] = min(self.times)
+        return data
+
+
+def make_tracker[T: TrackerUI](tracker_type: type[T], seed: int) -> T:
+    return tracker_type(
+        configs=Configs.ui_widgets[tracker_type.name],
+        parser=EventParser(GameState(FFXRNGTracker(seed))),
+        input_widget=BenchmarkWidget(),
+        output_widget=BenchmarkWidget(),
+        search_bar=BenchmarkWidget(),
+        warning_popup=BenchmarkWidget(),
+        confirmation_popup=BenchmarkWidget(),
+        )
+
+
+def setup_parse(tracker_type: type[TrackerUI]) -> Workload:
+    tracker = make_tracker(tracker_type, SEED)
+    edited_input = tracker.edit_input(tracker.input_widget.get_input())
+
+    def workload() -> object:
+        tracker.parser.gamestate.reset()
+        return tracker.parser.parse(edited_input)
+    return workload
+
+
+def setup_find_seed() -> Workload:
+    """Searches a seed from the last xored datetime of frame 0,
+    so every seed of the HD version is tested.
+    """
+    date_time = POSSIBLE_XORED_DATETIMES[Configs.game_version][-1]
+    seed = datetime_to_seed(date_time, 0)
+    tracker = make_tracker(SeedFinder, seed)
+    actions = tracker.input_widget.get_input()
+    damage_values = []
+    for event in tracker.parser.parse(tracker.edit_input(actions)):
+        if (isinstance(event, CharacterAction)
+                and event.action.damage_formula is not DamageFormula.NO_DAMAGE
+                and event.action.damages_hp):
+            damage_values.extend(r.hp.damage for r in event.results)
+    tracker.input_widget.set_input(
+        f'{' '.join(map(str, damage_values))}\n///\n{actions}')
+
+    def workload() -> object:
+        return tracker.find_seed()
+    return workload
+
+
+def setup_get_seed() -> Workload:
+    """Finds the seed of the last xored datetime of the last frame
+    in the seeds file, the file is created before measuring.
+    """
+    date_time = POSSIBLE_XORED_DATETIMES[Configs.game_version][-1]
+    frame = FRAMES_FROM_BOOT[Configs.game_version] - 1
+    tracker = FFXRNGTracker(datetime_to_seed(date_time, frame))
+    damage_values = damage_rolls_to_values(get_damage_rolls(tracker))
+    os.makedirs(SEEDS_DIRECTORY_PATH, exist_ok=True)
+    make_seeds_file(
+        SEEDS_FILE_PATHS[Configs.game_version],
+        POSSIBLE_XORED_DATETIMES[Configs.game_version],
+        FRAMES_FROM_BOOT[Configs.game_version],
+        )
+
+    def workload() -> object:
+        return get_seed(damage_values)
+    return workload
+
+
+def setup_make_seeds_file() -> Workload:
+    date_times = POSSIBLE_XORED_DATETIMES[Configs.game_version]
+    file_path = 'seeds_benchmark.dat'
+
+    def workload() -> object:
+        # make_seeds_file does nothing if the file already exists
+        make_seeds_file(file_path, date_times, SEEDS_FILE_FRAMES)
+        os.remove(file_path)
+    return workload
+
+
+def setup_encounters_planner_edit_output() -> Workload:
+    tracker = make_tracker(EncountersPlanner, SEED)
+    tracker.input_widget.set_input(
+        '\n'.join(f'encounter {zone}' for zone in list(ZONES) * 3))
+    output = tracker.parser.parse_to_string(tracker.input_widget.get_input())
+
+    def workload() -> object:
+        return tracker.edit_output(output)
+    return workload
+
+
+def setup_format_monster_data() -> Workload:
+    monsters = list(get_monsters_dict().values())
+
+    def workload() -> object:
+        return [format_monster_data(m) for m in monsters]
+    return workload
+
+
+def setup_status_chance_table() -> Workload:
+    def workload() -> object:
+        return get_status_chance_table(SEED, 1000)
+    return workload
+
+
+@dataclass
+class WorkloadSetup:
+    name: str
+    setup: Callable[[], Workload]
+    game_version: GameVersion
+    category: SpeedrunCategory = SpeedrunCategory.ANYPERCENT
+
+    def apply_configs(self) -> None:
+        Configs.game_version = self.game_version
+        Configs.speedrun_category = self.category
+
+
+def get_workloads() -> list[WorkloadSetup]:
+    workloads = []
+    for game_version in GAME_VERSIONS:
+        for category in SpeedrunCategory:
+            for tracker_type in PARSED_TRACKERS:
+                workloads.append(WorkloadSetup(
+                    f'parse {tracker_type.name} notes'
+                    f' ({category}, {game_version})',
+                    partial(setup_parse, tracker_type),
+                    game_version,
+                    category,
+                    ))
+    workloads.extend((
+        WorkloadSetup(
+            f'SeedFinder.find_seed ({GameVersion.HD})',
+            setup_find_seed,
+            GameVersion.HD,
+            ),
+        WorkloadSetup(
+            f'get_seed ({GameVersion.HD})', setup_get_seed, GameVersion.HD),
+        WorkloadSetup(
+            f'make_seeds_file {SEEDS_FILE_FRAMES} frames'
+            f' ({GameVersion.PS2NA})',
+            setup_make_seeds_file,
+            GameVersion.PS2NA,
+            ),
+        ))
+    for game_version in GAME_VERSIONS:
+        workloads.extend((
+            WorkloadSetup(
+                f'EncountersPlanner.edit_output ({game_version})',
+                setup_encounters_planner_edit_output,
+                game_version,
+                ),
+            WorkloadSetup(
+                f'format_monster_data all monsters ({game_version})',
+                setup_format_monster_data,
+                game_version,
+                ),
+            ))
+    workloads.append(WorkloadSetup(
+        'get_status_chance_table 1000 rolls',
+        setup_status_chance_table,
+        GameVersion.HD,
+        ))
+    return workloads
+
+
+def run_workloads(repeat: int, name_filter: str = '') -> list[WorkloadResult]:
+    Configs.init_configs()
+    results = []
+    for workload_setup in get_workloads():
+        if name_filter.lower() not in workload_setup.name.lower():
+            continue
+        workload_setup.apply_configs()
+        workload = workload_setup.setup()
+        result = WorkloadResult(workload_setup.name, [])
+        for _ in range(repeat):
+            start = time.perf_counter()
+            workload()
+            result.times.append(time.perf_counter() - start)
+        print(f'{result.name:<60} {result.median:>9.4f}s', flush=True)
+        results.append(result)
+    return results
@@ -0,0 +1,103 @@
+"""Benchmarks of the main workloads of the tracker.
+
+Every workload uses fixed seeds and the default notes bundled with
+the tracker, the user files (notes, seeds, data cache) are created
+in a temporary directory; the tracker is only imported after
+switching to it, as its data cache is created on import.
+
+Usage:
+    python -m benchmarks.workloads [--repeat N] [--filter TEXT]
+                                   [--json FILE] [--compare FILE]
+
+The results are printed and can be saved as json, --compare prints
+the ratio between the median times and the ones of a previous run.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_metadata() -> dict[str, str]:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=REPOSITORY_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+            ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = 'unknown'
+    return {
+        'commit': commit,
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+    }
+
+
+def print_comparison(medians: dict[str, float], file_path: str) -> None:
+    with open(file_path) as file_object:
+        old_results = json.load(file_object)
+    old_medians = {r['name']: r['median'] for r in old_results['results']}
+    print(f'\nCompared to commit {old_results['metadata']['commit']}:')
+    for name, median in medians.items():
+        old_median = old_medians.get(name)
+        if old_median is None:
+            continue
+        print(f'{name:<60} {median / old_median:>8.2f}x')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--filter', default='',
+        help='only run the workloads with this text in their name')
+    parser.add_argument('--json', help='file to save the results to')
+    parser.add_argument(
+        '--compare', help='json file with the results of a previous run')
+    args = parser.parse_args()
+
+    # paths given by the user are relative to the current directory
+    json_path = os.path.abspath(args.json) if args.json else None
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+
+    # the missing user files are expected
+    logging.disable(logging.WARNING)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['FFX_RNG_TRACKER_CACHE'] = os.path.join(
+            directory, 'ffx_rng_tracker_cache')
+        os.chdir(directory)
+        try:
+            # imported here so that the data cache and the user files
+            # of the tracker are created in the temporary directory
+            from . import workload_setups
+            results = workload_setups.run_workloads(
+                max(1, args.repeat), args.filter)
+        finally:
+            os.chdir(cwd)
+
+    if json_path:
+        data = {
+            'metadata': get_metadata(),
+            'results': [r.to_dict() for r in results],
+        }
+        with open(json_path, 'w') as file_object:
+            json.dump(data, file_object, indent=2)
+    if compare_path:
+        print_comparison(
+            {r.name: r.median for r in results}, compare_path)
+
+
+if __name__ == '__main__':
+    main()
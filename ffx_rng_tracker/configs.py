@@ -38,6 +38,10 @@ class Configs:
     speedrun_category: SpeedrunCategory | str
     default_theme: str
     font_size: int
+    log_lines: int
+    spill_log_to_file: bool
+    profile_parsing: bool
+    watch_notes: bool
     ui_tags: dict[str, UITagConfigs]
     ui_widgets: dict[UIWidget, UIWidgetConfigs]
     _parser = ConfigParser()
@@ -137,6 +141,12 @@ class Configs:
         section = 'UI'
         cls.default_theme = cls.get(section, 'default theme', 'azure-light')
         cls.font_size = cls.getint(section, 'fontsize', 9)
+        cls.log_lines = max(1, cls.getint(section, 'log lines', 1000))
+        cls.spill_log_to_file = cls.getboolean(
+            section, 'spill log to file', False)
+        cls.profile_parsing = cls.getboolean(
+            section, 'profile parsing', False)
+        cls.watch_notes = cls.getboolean(section, 'watch notes', False)
 
         section = 'Tags'
         cls.ui_tags = {}
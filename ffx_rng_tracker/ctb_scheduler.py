@@ -0,0 +1,156 @@
+from collections.abc import Callable, Iterable
+from heapq import heapify, heappop, heappush
+from itertools import count
+
+from .data.actor import Actor, CharacterActor
+from .data.constants import Stat, Status
+
+# ctb, side (characters first) and two tie breakers,
+# agility and index for characters, index and agility for monsters
+type CTBKey = tuple[int, int, int, int]
+# the most turns shown by a forecast
+MAX_FORECAST_TURNS = 100
+
+
+def get_ctb_key(actor: Actor) -> CTBKey:
+    """Returns the key used to sort actors by turn order."""
+    agility = 256 - actor.stats[Stat.AGILITY]
+    if isinstance(actor, CharacterActor):
+        return actor.ctb, 0, agility, actor.index
+    return actor.ctb, 1, actor.index, agility
+
+
+def get_turn_ctb(actor: Actor, rank: int = 3) -> int:
+    """Returns the ctb added to actor by a turn with an action
+    of the given rank.
+    """
+    ctb = actor.base_ctb * rank
+    if Status.HASTE in actor.statuses:
+        ctb = ctb // 2
+    elif Status.SLOW in actor.statuses:
+        ctb = ctb * 2
+    return ctb
+
+
+class CTBScheduler:
+    """Keeps the actors that take turns in a battle in a heap
+    ordered by their ctb key, so the next actor is found
+    in O(log n) instead of scanning every actor.
+
+    The keys are stored with the ctb elapsed since the last reset,
+    so normalizing the ctbs after every turn doesn't change them.
+    The actors call update through their ctb listener when their
+    ctb changes (turns, delay, icvs with haste or slow), which
+    pushes a new entry in O(log n); outdated entries are discarded
+    lazily when they reach the top of the heap. Actors that stop
+    taking turns according to is_active are set aside until
+    they can again.
+    """
+
+    def __init__(self, is_active: Callable[[Actor], bool]) -> None:
+        self.is_active = is_active
+        self.elapsed_ctb = 0
+        self._counter = count()
+        # key and sequence number of the entry of every actor
+        self._entries: dict[Actor, tuple[CTBKey, int]] = {}
+        self._heap: list[tuple[CTBKey, int, Actor]] = []
+        self._inactive: list[Actor] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_key(self, actor: Actor) -> CTBKey:
+        ctb, *tie_breakers = get_ctb_key(actor)
+        return ctb + self.elapsed_ctb, *tie_breakers
+
+    def _push(self, actor: Actor, key: CTBKey) -> None:
+        sequence = next(self._counter)
+        self._entries[actor] = key, sequence
+        heappush(self._heap, (key, sequence, actor))
+        # rebuild the heap when it's mostly outdated entries
+        if len(self._heap) > 4 * len(self._entries) + 16:
+            self._heap = [(k, s, a) for a, (k, s) in self._entries.items()]
+            heapify(self._heap)
+
+    def reset(self, actors: Iterable[Actor] = ()) -> None:
+        """Schedules only actors."""
+        self.elapsed_ctb = 0
+        self._entries.clear()
+        self._heap.clear()
+        self._inactive.clear()
+        for actor in actors:
+            self._push(actor, self._get_key(actor))
+
+    def update(self, actor: Actor) -> None:
+        """Adds the actor or updates its position after its ctb
+        was changed.
+        """
+        if actor in self._inactive:
+            self._inactive.remove(actor)
+        key = self._get_key(actor)
+        entry = self._entries.get(actor)
+        if entry is None or entry[0] != key:
+            self._push(actor, key)
+
+    def on_ctb_change(self, actor: Actor) -> None:
+        """Updates the actor if it is scheduled, used as the ctb
+        listener of the actors.
+        """
+        if actor in self._entries or actor in self._inactive:
+            self.update(actor)
+
+    def remove(self, actor: Actor) -> None:
+        self._entries.pop(actor, None)
+        if actor in self._inactive:
+            self._inactive.remove(actor)
+
+    def advance(self, ctb: int) -> None:
+        """Registers that the ctbs of the actors were lowered by ctb."""
+        self.elapsed_ctb += ctb
+
+    def peek(self) -> Actor | None:
+        """Returns the actor that will have the next turn."""
+        for actor in [a for a in self._inactive if self.is_active(a)]:
+            self.update(actor)
+        heap = self._heap
+        while heap:
+            key, sequence, actor = heap[0]
+            entry = self._entries.get(actor)
+            if entry is None or entry[1] != sequence:
+                heappop(heap)
+            elif not self.is_active(actor):
+                heappop(heap)
+                del self._entries[actor]
+                self._inactive.append(actor)
+            elif key != self._get_key(actor):
+                # the ctb was changed without calling update
+                heappop(heap)
+                self._push(actor, self._get_key(actor))
+            else:
+                return actor
+        return None
+
+    def get_turn_order(self) -> list[Actor]:
+        """Returns the actors that can take turns sorted by turn order."""
+        self.peek()
+        actors = [a for a in self._entries if self.is_active(a)]
+        return sorted(actors, key=get_ctb_key)
+
+    def forecast(self,
+                 turns: int,
+                 rank: int = 3,
+                 ) -> list[tuple[Actor, int]]:
+        """Returns the actors of the next turns and the ctb at which
+        they act, assuming every turn uses an action of the given rank;
+        the ctbs of the actors are not changed.
+        """
+        # the index breaks the ties between actors with the same key
+        heap = [(get_ctb_key(a), i, a)
+                for i, a in enumerate(self.get_turn_order())]
+        forecast = []
+        while heap and len(forecast) < turns:
+            (ctb, *tie_breakers), index, actor = heappop(heap)
+            forecast.append((actor, ctb))
+            key = (ctb + get_turn_ctb(actor, rank), *tie_breakers)
+            heappush(heap, (key, index, actor))
+        return forecast
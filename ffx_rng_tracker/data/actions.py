@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from itertools import count
 
 from ..utils import add_bytes, open_cp1252, stringify
+from .cache import load_cached_data
 from .constants import (COUNTER_TARGET_TYPES, HIT_CHANCE_FORMULA_TABLE,
                         SUBMENUS, Buff, Character, DamageFormula, DamageType,
                         Element, HitChanceFormula, MonsterSlot, Status,
@@ -330,8 +331,10 @@ def get_target(is_character_action: bool,
     return target
 
 
-def get_character_actions() -> dict[str, Action]:
-    actions_list = ITEM_BIN + COMMAND_BIN
+def get_character_actions(item_bin: list[Action],
+                          command_bin: list[Action],
+                          ) -> dict[str, Action]:
+    actions_list = item_bin + command_bin
     actions: dict[str, Action] = {}
     for index, action in enumerate(actions_list):
         action_id = stringify(action.name)
@@ -439,12 +442,25 @@ def fix_affected_by_alchemy(actions: list[Action]) -> None:
         action.affected_by_alchemy = True
 
 
-ITEM_BIN = parse_actions_file('data_files/ffx_item.csv')
-fix_affected_by_alchemy(ITEM_BIN)
-COMMAND_BIN = parse_actions_file('data_files/ffx_command.csv')
-ACTIONS = get_character_actions()
-MONMAGIC1_BIN = parse_actions_file('data_files/ffx_monmagic1.csv')
-MONMAGIC2_BIN = parse_actions_file('data_files/ffx_monmagic2.csv')
+def _get_actions_data() -> tuple[list[Action],
+                                 list[Action],
+                                 dict[str, Action],
+                                 list[Action],
+                                 list[Action]]:
+    item_bin = parse_actions_file('data_files/ffx_item.csv')
+    fix_affected_by_alchemy(item_bin)
+    command_bin = parse_actions_file('data_files/ffx_command.csv')
+    actions = get_character_actions(item_bin, command_bin)
+    monmagic1_bin = parse_actions_file('data_files/ffx_monmagic1.csv')
+    monmagic2_bin = parse_actions_file('data_files/ffx_monmagic2.csv')
+    return item_bin, command_bin, actions, monmagic1_bin, monmagic2_bin
+
+
+(ITEM_BIN,
+ COMMAND_BIN,
+ ACTIONS,
+ MONMAGIC1_BIN,
+ MONMAGIC2_BIN) = load_cached_data('actions', _get_actions_data)
 
 ACTIONS_FILES_BY_ID = {
     2: ITEM_BIN,
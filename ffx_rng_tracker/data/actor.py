@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Callable
 from typing import Protocol
 
 from .actions import Action
@@ -39,6 +40,8 @@ class Actor(Protocol):
     provoker: "Actor | None"
     last_attacker: "Actor | None"
     last_targets: "list[Actor]"
+    # called after the ctb is changed
+    ctb_listener: "Callable[[Actor], None] | None"
 
     @property
     def index(self) -> int: ...
@@ -101,6 +104,7 @@ class CharacterActor:
         self.character = defaults.character
         self.auto_statuses: list[Status] = []
         self.sos_auto_statuses: list[Status] = []
+        self.ctb_listener: Callable[[Actor], None] | None = None
         self.reset()
 
     def __str__(self) -> str:
@@ -221,6 +225,8 @@ class CharacterActor:
     @ctb.setter
     def ctb(self, value: int) -> None:
         self._ctb = max(0, value)
+        if self.ctb_listener is not None:
+            self.ctb_listener(self)
 
     @property
     def ap(self) -> int:
@@ -339,6 +345,7 @@ class MonsterActor:
         self.weapon_statuses: list[StatusApplication] = []
         self.last_targets: list[Actor] = []
         self.monster = monster
+        self.ctb_listener: Callable[[Actor], None] | None = None
         self.reset()
 
     def __str__(self) -> str:
@@ -433,6 +440,8 @@ class MonsterActor:
     @ctb.setter
     def ctb(self, value: int) -> None:
         self._ctb = max(0, value)
+        if self.ctb_listener is not None:
+            self.ctb_listener(self)
 
     @property
     def bribe_gil_spent(self) -> int:
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import pickle
+import sys
+from collections.abc import Callable, Sequence
+from functools import cache
+from logging import getLogger
+from tempfile import NamedTemporaryFile
+
+from .. import __version__
+from .file_functions import get_resource_path
+
+
+def _get_cache_directory() -> str:
+    """Returns the directory where the cache files are stored,
+    in the cache directory of the user unless it is set
+    with the environment variable FFX_RNG_TRACKER_CACHE.
+    """
+    directory = os.environ.get('FFX_RNG_TRACKER_CACHE')
+    if directory:
+        return os.path.abspath(directory)
+    if sys.platform == 'win32':
+        base_directory = os.environ.get('LOCALAPPDATA')
+    elif sys.platform == 'darwin':
+        base_directory = os.path.expanduser('~/Library/Caches')
+    else:
+        base_directory = os.environ.get('XDG_CACHE_HOME')
+    if not base_directory:
+        base_directory = os.path.expanduser('~/.cache')
+    return os.path.join(base_directory, 'ffx_rng_tracker')
+
+
+CACHE_DIRECTORY = _get_cache_directory()
+# increase when the structure of the cached objects changes
+CACHE_VERSION = 1
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler that stores the shared objects as references."""
+
+    def __init__(self, file, shared: Sequence[object]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared_ids = {id(o): i for i, o in enumerate(shared)}
+
+    def persistent_id(self, obj: object) -> int | None:
+        return self._shared_ids.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler that resolves the references to the shared objects."""
+
+    def __init__(self, file, shared: Sequence[object]) -> None:
+        super().__init__(file)
+        self._shared = shared
+
+    def persistent_load(self, pid: int) -> object:
+        return self._shared[pid]
+
+
+def _hash_files(data_hash, directory: str, extension: str = '') -> None:
+    try:
+        file_names = sorted(os.listdir(directory))
+    except OSError:
+        return
+    for file_name in file_names:
+        file_path = os.path.join(directory, file_name)
+        if not file_name.endswith(extension) or not os.path.isfile(file_path):
+            continue
+        data_hash.update(file_name.encode())
+        with open(file_path, mode='rb') as file_object:
+            data_hash.update(file_object.read())
+
+
+@cache
+def get_data_files_hash() -> str:
+    """Returns a hash of the contents of the data files,
+    of the modules that build the data (when available),
+    of the version of the tracker and of the version of Python.
+    """
+    data_hash = hashlib.sha256()
+    data_hash.update(
+        f'{CACHE_VERSION} {__version__} {sys.version_info[:2]}'.encode())
+    _hash_files(data_hash, get_resource_path('data_files'))
+    _hash_files(data_hash, os.path.dirname(__file__), '.py')
+    return data_hash.hexdigest()[:16]
+
+
+def load_cached_data[T](name: str,
+                        build: Callable[[], T],
+                        shared: Sequence[object] = (),
+                        ) -> T:
+    """Returns the data created by build, using the cached data
+    if it was created from the same data files.
+
+    The objects in shared are not stored in the cache, references
+    to them are resolved with the same sequence when loading.
+    """
+    logger = getLogger(__name__)
+    file_name = f'{name}_{get_data_files_hash()}.pickle'
+    file_path = os.path.join(CACHE_DIRECTORY, file_name)
+    try:
+        with open(file_path, mode='rb') as file_object:
+            return _Unpickler(file_object, shared).load()
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(f'Could not load cache file "{file_path}": {error}')
+
+    data = build()
+    temp_file_path = None
+    try:
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        with NamedTemporaryFile(
+                mode='wb', dir=CACHE_DIRECTORY, delete=False) as file_object:
+            temp_file_path = file_object.name
+            _Pickler(file_object, shared).dump(data)
+        os.replace(temp_file_path, file_path)
+    except Exception as error:
+        logger.warning(f'Could not save cache file "{file_path}": {error}')
+        if temp_file_path is not None and os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+        return data
+    # remove the cache files created from older data files
+    for old_file_name in os.listdir(CACHE_DIRECTORY):
+        if (old_file_name.rpartition('_')[0] == name
+                and old_file_name.endswith('.pickle')
+                and old_file_name != file_name):
+            try:
+                os.remove(os.path.join(CACHE_DIRECTORY, old_file_name))
+            except OSError:
+                pass
+    return data
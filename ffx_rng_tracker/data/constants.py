@@ -4,6 +4,7 @@ from enum import IntEnum, StrEnum
 class UIWidget(StrEnum):
     SEED_INFO = 'Seed info'
     DROPS = 'Drops'
+    DROPS_TABLE = 'Drops Table'
     ENCOUNTERS = 'Encounters'
     STEPS = 'Steps'
     ENCOUNTERS_PLANNER = 'Encounters Planner'
@@ -1,27 +1,74 @@
 import json
+import threading
 from dataclasses import dataclass, field
 
+from ..configs import Configs
 from ..utils import open_cp1252, search_strenum
-from .constants import Character, EncounterCondition
+from .cache import load_cached_data
+from .constants import Character, EncounterCondition, GameVersion
 from .file_functions import get_resource_path
-from .monsters import MONSTERS, MONSTERS_HD, Monster, get_monsters_dict
+from .monsters import Monster, add_monsters_setup_function, get_monsters_dict
+
+_RESOLVE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ResolvedFormation:
+    """Monsters of a formation for a game version."""
+    monsters: tuple[Monster, ...]
+    # rng indexes advanced because of duplicate monsters, in order
+    duplicate_monsters_rng_advances: tuple[int, ...]
+    string: str
 
 
 @dataclass
 class Formation:
     monsters_names: list[str]
     forced_condition: EncounterCondition | None
+    _resolved: dict[GameVersion, ResolvedFormation] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
-        string = ', '.join([str(m) for m in self.monsters])
-        if not string:
-            return 'Empty'
-        return string
+        return self.resolve().string
 
     @property
-    def monsters(self) -> list[Monster]:
-        monsters = get_monsters_dict()
-        return [monsters[m] for m in self.monsters_names]
+    def monsters(self) -> tuple[Monster, ...]:
+        return self.resolve().monsters
+
+    def resolve(self,
+                game_version: GameVersion | None = None,
+                ) -> ResolvedFormation:
+        """Returns the monsters of the formation for game_version
+        (defaults to Configs.game_version), they are looked up
+        on the first call.
+        """
+        if game_version is None:
+            game_version = Configs.game_version
+        try:
+            return self._resolved[game_version]
+        except KeyError:
+            pass
+        # resolved once even if the worker threads ask for it together
+        with _RESOLVE_LOCK:
+            resolved = self._resolved.get(game_version)
+            if resolved is None:
+                resolved = self._resolve(game_version)
+                self._resolved[game_version] = resolved
+        return resolved
+
+    def _resolve(self, game_version: GameVersion) -> ResolvedFormation:
+        monsters_dict = get_monsters_dict(game_version)
+        monsters = tuple([monsters_dict[m] for m in self.monsters_names])
+        rng_advances = []
+        for index, monster in enumerate(monsters):
+            count = monsters.count(monster)
+            if count > 1:
+                if monsters.index(monster) == index:
+                    rng_advances.extend([28 + index] * count)
+                rng_advances.append(28 + index)
+        string = ', '.join([str(m) for m in monsters])
+        return ResolvedFormation(
+            monsters, tuple(rng_advances), string or 'Empty')
 
 
 @dataclass
@@ -115,17 +162,20 @@ def _get_formations(file_path: str) -> Formations:
             encounters,
             data['danger_value'],
         )
-        for formation in zones[zone].formations:
-            for monster_name in formation.monsters_names:
-                monster = MONSTERS[monster_name]
-                if zones[zone].name not in monster.zones:
-                    monster.zones.append(zones[zone].name)
-                monster = MONSTERS_HD[monster_name]
-                if zones[zone].name not in monster.zones:
-                    monster.zones.append(zones[zone].name)
 
     return bosses, simulations, zones
 
 
-BOSSES, SIMULATIONS, ZONES = _get_formations('data_files/formations.json')
+def _add_zones_to_monsters(monsters: dict[str, Monster]) -> None:
+    for zone in ZONES.values():
+        for formation in zone.formations:
+            for monster_name in formation.monsters_names:
+                monster = monsters[monster_name]
+                if zone.name not in monster.zones:
+                    monster.zones.append(zone.name)
+
+
+BOSSES, SIMULATIONS, ZONES = load_cached_data(
+    'formations', lambda: _get_formations('data_files/formations.json'))
+add_monsters_setup_function(_add_zones_to_monsters)
 FORMATIONS = BOSSES | SIMULATIONS | ZONES
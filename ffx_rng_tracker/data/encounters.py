@@ -1,6 +1,7 @@
 import csv
 from dataclasses import dataclass
 
+from .constants import EncounterCondition
 from .notes import get_notes
 
 
@@ -24,6 +25,23 @@ class StepsData:
     continue_previous_zone: bool
 
 
+def condition_from_rng(condition_rng: int,
+                       initiative: bool = False,
+                       ) -> EncounterCondition:
+    """Returns the condition of an encounter without a forced one
+    from the value of rng1.
+    """
+    condition_rng = condition_rng & 255
+    if initiative:
+        condition_rng -= 33
+    if condition_rng < 32:
+        return EncounterCondition.PREEMPTIVE
+    elif condition_rng < 255 - 32:
+        return EncounterCondition.NORMAL
+    else:
+        return EncounterCondition.AMBUSH
+
+
 def get_encounter_notes(file_path: str, seed: int) -> list[EncounterData]:
     encounters_notes = get_notes(file_path, seed)
     encounters = []
@@ -9,6 +9,7 @@ from .autoabilities import (AUTO_STATUSES, DEFENSE_BONUSES, ELEMENTAL_EATERS,
                             MAGIC_BONUSES, MAGIC_DEF_BONUSES, MP_BONUSES,
                             SOS_AUTO_STATUSES, STATUS_PROOFS, STATUS_STRIKES,
                             STATUS_TOUCHES, STRENGTH_BONUSES, Autoability)
+from .cache import load_cached_data
 from .constants import (EQUIPMENT_EMPTY_SLOTS_GIL_MODIFIERS,
                         EQUIPMENT_SLOTS_GIL_MODIFIERS, Character,
                         EquipmentType)
@@ -539,4 +540,7 @@ def get_armor_name(owner: Character,
     return EQUIPMENT_NAMES[EquipmentType.ARMOR][index][owner]
 
 
-EQUIPMENT_NAMES = _get_equipment_names('data_files/equipment_names.json')
+EQUIPMENT_NAMES = load_cached_data(
+    'equipment_names',
+    lambda: _get_equipment_names('data_files/equipment_names.json'),
+    )
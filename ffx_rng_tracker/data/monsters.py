@@ -1,13 +1,18 @@
 import json
+import threading
+from collections.abc import Callable
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import partial
 from itertools import chain, count
 from math import sqrt
 
 from ..configs import Configs
 from ..utils import add_bytes, open_cp1252, stringify
-from .actions import ACTIONS, ACTIONS_FILES_BY_ID, Action
+from .actions import (ACTIONS, ACTIONS_FILES_BY_ID, COMMAND_BIN, ITEM_BIN,
+                      MONMAGIC1_BIN, MONMAGIC2_BIN, Action)
 from .autoabilities import AUTOABILITIES
+from .cache import load_cached_data
 from .constants import (Autoability, Character, Element, ElementalAffinity,
                         EquipmentType, GameVersion, KillType, MonsterSlot,
                         Rarity, Stat, Status, TargetType)
@@ -144,12 +149,14 @@ def parse_monsters_file(file_path: str) -> dict[str, list[int]]:
     return monsters
 
 
-def _patch_monsters_actions(file_path: str) -> None:
+def _patch_monsters_actions(file_path: str,
+                            monsters: dict[str, Monster],
+                            ) -> None:
     absolute_file_path = get_resource_path(file_path)
     with open_cp1252(absolute_file_path) as file_object:
         data: dict[str, list[dict[str, str | int]]] = json.load(file_object)
 
-    for monster in chain(MONSTERS.values(), MONSTERS_HD.values()):
+    for monster in monsters.values():
         index = f'm{monster.index:03}'
         for action_data in data[index]:
             actions_file_id = action_data['actions_file']
@@ -401,10 +408,46 @@ def _get_monsters(monsters_data: dict[str, list[int]]) -> dict[str, Monster]:
     return monsters
 
 
-def get_monsters_dict() -> dict[str, Monster]:
-    if Configs.game_version in (GameVersion.HD, GameVersion.PS2INT):
-        return MONSTERS_HD
-    return MONSTERS
+def get_monsters_dict(game_version: GameVersion | None = None,
+                      ) -> dict[str, Monster]:
+    """Returns the monsters of game_version (defaults to
+    Configs.game_version), they are loaded on the first call.
+    """
+    if game_version is None:
+        game_version = Configs.game_version
+    file_name = MONSTERS_DATA_FILES[game_version]
+    monsters = _MONSTERS_REGISTRY.get(file_name)
+    if monsters is not None:
+        return monsters
+    # the trackers parse in worker threads, the lock makes sure
+    # that a single dict is loaded for every data file
+    with _MONSTERS_LOCK:
+        monsters = _MONSTERS_REGISTRY.get(file_name)
+        if monsters is None:
+            # the monsters share some Action objects
+            # with the actions module
+            monsters = load_cached_data(
+                f'monsters_{file_name.removesuffix('.csv')}',
+                partial(_get_monsters_data, file_name),
+                shared=list(chain(ITEM_BIN, COMMAND_BIN, ACTIONS.values(),
+                                  MONMAGIC1_BIN, MONMAGIC2_BIN)),
+                )
+            for setup_function in _MONSTERS_SETUP_FUNCTIONS:
+                setup_function(monsters)
+            _MONSTERS_REGISTRY[file_name] = monsters
+    return monsters
+
+
+def add_monsters_setup_function(
+        setup_function: Callable[[dict[str, Monster]], None],
+        ) -> None:
+    """Register a function to be called on every monsters dict
+    when it is loaded, including the ones already loaded.
+    """
+    with _MONSTERS_LOCK:
+        _MONSTERS_SETUP_FUNCTIONS.append(setup_function)
+        for monsters in _MONSTERS_REGISTRY.values():
+            setup_function(monsters)
 
 
 MONSTER_NAMES = {
@@ -431,10 +474,19 @@ MONSTER_NAMES = {
 }
 
 
-MON_DATA_BIN = parse_monsters_file('data_files/ffx_mon_data.csv')
-MONSTERS = _get_monsters(MON_DATA_BIN)
+def _get_monsters_data(file_name: str) -> dict[str, Monster]:
+    monsters_data = parse_monsters_file(f'data_files/{file_name}')
+    monsters = _get_monsters(monsters_data)
+    _patch_monsters_actions('data_files/monster_actions.json', monsters)
+    return monsters
 
-MON_DATA_BIN_HD = parse_monsters_file('data_files/ffx_mon_data_hd.csv')
-MONSTERS_HD = _get_monsters(MON_DATA_BIN_HD)
 
-_patch_monsters_actions('data_files/monster_actions.json')
+MONSTERS_DATA_FILES = {
+    GameVersion.PS2JP: 'ffx_mon_data.csv',
+    GameVersion.PS2NA: 'ffx_mon_data.csv',
+    GameVersion.PS2INT: 'ffx_mon_data_hd.csv',
+    GameVersion.HD: 'ffx_mon_data_hd.csv',
+}
+_MONSTERS_REGISTRY: dict[str, dict[str, Monster]] = {}
+_MONSTERS_SETUP_FUNCTIONS: list[Callable[[dict[str, Monster]], None]] = []
+_MONSTERS_LOCK = threading.Lock()
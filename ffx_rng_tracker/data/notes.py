@@ -1,5 +1,6 @@
 import os
 import shutil
+from collections.abc import Callable
 from logging import getLogger
 
 from ..configs import Configs
@@ -8,41 +9,180 @@ from ..utils import open_cp1252, stringify
 from .file_functions import get_resource_path
 
 
-def get_notes(file_name: str, seed: int | None = None) -> str:
-    """Get notes from a file, either custom or default."""
-    logger = getLogger(__name__)
-    if not os.path.exists(NOTES_DIRECTORY):
-        logger.warning('Notes directory not found.')
-        os.mkdir(NOTES_DIRECTORY)
-        logger.info(f'Created notes directory "{NOTES_DIRECTORY}".')
-
-    category = stringify(Configs.speedrun_category)
-    category_dir = f'{NOTES_DIRECTORY}/{category}'
-    if not os.path.exists(category_dir):
-        logger.warning('Notes category subdirectory not found.')
-        os.mkdir(category_dir)
-        logger.info(f'Created notes subdirectory "{category_dir}"')
-
-    default_file_path = f'{category_dir}/{file_name}'
-    if not os.path.exists(default_file_path):
-        logger.warning(f'Default notes file "{file_name}" for category '
-                       f'"{category}" not found.')
-        default_notes_full_path = get_resource_path(
-            f'data_files/notes/{category}/{file_name}')
-        if not os.path.exists(default_notes_full_path):
-            category = stringify(SpeedrunCategory.ANYPERCENT)
+class NotesRepository:
+    """Reads and saves the notes files.
+
+    The notes directories and the default notes files are set up
+    once, the contents of the notes files are cached by path
+    and modification time and the names of the files in every
+    category directory by the directory's modification time.
+
+    When watching, poll is expected to be called periodically
+    to refresh the cache and notify the changed files to the
+    registered callbacks, reading cached notes then does no file I/O.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.watching = False
+        self._default_files_paths: set[str] = set()
+        self._files: dict[str, tuple[int, str]] = {}
+        self._files_names: dict[str, tuple[int, set[str]]] = {}
+        self._callbacks: list[Callable[[str], None]] = []
+
+    def get_category_directory(self) -> str:
+        category = stringify(Configs.speedrun_category)
+        return f'{self.directory}/{category}'
+
+    def _set_up_default_file(self, file_name: str) -> str:
+        """Creates the notes directories and copies the default
+        notes file if needed, returns its path.
+        """
+        category_dir = self.get_category_directory()
+        default_file_path = f'{category_dir}/{file_name}'
+        if default_file_path in self._default_files_paths:
+            return default_file_path
+        logger = getLogger(__name__)
+        if not os.path.exists(self.directory):
+            logger.warning('Notes directory not found.')
+            os.mkdir(self.directory)
+            logger.info(f'Created notes directory "{self.directory}".')
+
+        if not os.path.exists(category_dir):
+            logger.warning('Notes category subdirectory not found.')
+            os.mkdir(category_dir)
+            logger.info(f'Created notes subdirectory "{category_dir}"')
+
+        if not os.path.exists(default_file_path):
+            category = stringify(Configs.speedrun_category)
+            logger.warning(f'Default notes file "{file_name}" for category '
+                           f'"{category}" not found.')
             default_notes_full_path = get_resource_path(
                 f'data_files/notes/{category}/{file_name}')
-        shutil.copyfile(default_notes_full_path, default_file_path)
-        logger.info(f'Copied default notes file to "{default_file_path}".')
+            if not os.path.exists(default_notes_full_path):
+                category = stringify(SpeedrunCategory.ANYPERCENT)
+                default_notes_full_path = get_resource_path(
+                    f'data_files/notes/{category}/{file_name}')
+            shutil.copyfile(default_notes_full_path, default_file_path)
+            logger.info(
+                f'Copied default notes file to "{default_file_path}".')
+            self._files_names.pop(category_dir, None)
+        self._default_files_paths.add(default_file_path)
+        return default_file_path
+
+    def _get_files_names(self, directory: str) -> set[str]:
+        cached = self._files_names.get(directory)
+        if cached is not None and self.watching:
+            return cached[1]
+        mtime = os.stat(directory).st_mtime_ns
+        if cached is None or cached[0] != mtime:
+            cached = mtime, set(os.listdir(directory))
+            self._files_names[directory] = cached
+        return cached[1]
 
-    file_path = f'{category_dir}/{seed}_{file_name}'
-    if not os.path.exists(file_path):
-        file_path = default_file_path
-    with open_cp1252(file_path) as notes_file:
-        notes = notes_file.read()
+    def _read(self, file_path: str) -> str:
+        cached = self._files.get(file_path)
+        if cached is not None and self.watching:
+            return cached[1]
+        mtime = os.stat(file_path).st_mtime_ns
+        if cached is None or cached[0] != mtime:
+            with open_cp1252(file_path) as notes_file:
+                cached = mtime, notes_file.read()
+            self._files[file_path] = cached
+        return cached[1]
 
-    return notes
+    def get_notes_path(self, file_name: str, seed: int | None = None) -> str:
+        """Returns the path of the notes file used for seed,
+        either custom or default.
+        """
+        default_file_path = self._set_up_default_file(file_name)
+        category_dir = self.get_category_directory()
+        if f'{seed}_{file_name}' in self._get_files_names(category_dir):
+            return f'{category_dir}/{seed}_{file_name}'
+        return default_file_path
+
+    def get_notes(self, file_name: str, seed: int | None = None) -> str:
+        """Get notes from a file, either custom or default."""
+        file_path = self.get_notes_path(file_name, seed)
+        try:
+            return self._read(file_path)
+        except FileNotFoundError:
+            # the file was removed after being cached
+            self.clear_cache()
+            return self._read(self.get_notes_path(file_name, seed))
+
+    def save_notes(self,
+                   file_name: str,
+                   seed: int,
+                   notes: str,
+                   /,
+                   force: bool = False,
+                   ) -> None:
+        category_dir = self.get_category_directory()
+        file_path = f'{category_dir}/{seed}_{file_name}'
+        if not force and os.path.exists(file_path):
+            raise FileExistsError(file_path)
+        with open_cp1252(file_path, 'w') as notes_file:
+            notes_file.write(f'{notes.rstrip('\n')}\n')
+        self._files.pop(file_path, None)
+        self._files_names.pop(category_dir, None)
+        getLogger(__name__).info(f'Saved notes file to "{file_path}".')
+
+    def clear_cache(self) -> None:
+        self._default_files_paths.clear()
+        self._files.clear()
+        self._files_names.clear()
+
+    def register_callback(self, callback_func: Callable[[str], None]) -> None:
+        """Registers a function called by poll with the path
+        of every notes file that changed.
+        """
+        self._callbacks.append(callback_func)
+
+    def poll(self) -> list[str]:
+        """Refreshes the cached files and directories, returns the paths
+        of the notes files that were changed, added or removed.
+        """
+        changed_paths = []
+        for directory, (mtime, files_names) in list(
+                self._files_names.items()):
+            try:
+                new_mtime = os.stat(directory).st_mtime_ns
+                if new_mtime == mtime:
+                    continue
+                new_files_names = set(os.listdir(directory))
+            except OSError:
+                self._files_names.pop(directory)
+                continue
+            self._files_names[directory] = new_mtime, new_files_names
+            changed_paths.extend(
+                f'{directory}/{n}' for n in files_names ^ new_files_names)
+        for file_path, (mtime, text) in list(self._files.items()):
+            try:
+                new_mtime = os.stat(file_path).st_mtime_ns
+                if new_mtime == mtime:
+                    continue
+                with open_cp1252(file_path) as notes_file:
+                    new_text = notes_file.read()
+            except OSError:
+                self._files.pop(file_path)
+                self._default_files_paths.discard(file_path)
+                changed_paths.append(file_path)
+                continue
+            self._files[file_path] = new_mtime, new_text
+            if new_text != text:
+                changed_paths.append(file_path)
+        changed_paths = list(dict.fromkeys(changed_paths))
+        for file_path in changed_paths:
+            getLogger(__name__).info(f'Notes file "{file_path}" changed.')
+            for callback_func in self._callbacks:
+                callback_func(file_path)
+        return changed_paths
+
+
+def get_notes(file_name: str, seed: int | None = None) -> str:
+    """Get notes from a file, either custom or default."""
+    return NOTES_REPOSITORY.get_notes(file_name, seed)
 
 
 def save_notes(file_name: str,
@@ -51,13 +191,8 @@ def save_notes(file_name: str,
                /,
                force: bool = False,
                ) -> None:
-    category_dir = stringify(Configs.speedrun_category)
-    file_path = f'{NOTES_DIRECTORY}/{category_dir}/{seed}_{file_name}'
-    if not force and os.path.exists(file_path):
-        raise FileExistsError(file_path)
-    with open_cp1252(file_path, 'w') as notes_file:
-        notes_file.write(f'{notes.rstrip('\n')}\n')
-    getLogger(__name__).info(f'Saved notes file to "{file_path}".')
+    NOTES_REPOSITORY.save_notes(file_name, seed, notes, force=force)
 
 
 NOTES_DIRECTORY = 'ffx_rng_tracker_notes'
+NOTES_REPOSITORY = NotesRepository(NOTES_DIRECTORY)
@@ -0,0 +1,97 @@
+import threading
+from dataclasses import dataclass
+from enum import StrEnum
+
+from ..configs import Configs
+from ..utils import stringify
+from .actions import ACTIONS, YOJIMBO_ACTIONS, Action
+from .constants import (Autoability, Character, Element, ElementalAffinity,
+                        EquipmentType, GameVersion, Item, Stat, Status)
+from .encounter_formations import (BOSSES, SIMULATIONS, ZONES, Boss,
+                                   Simulation, Zone)
+from .monsters import Monster, get_monsters_dict
+
+
+@dataclass(frozen=True)
+class SymbolTable:
+    """Normalized names of the objects that can be used as arguments
+    of the parsing functions.
+    """
+    enums: dict[type[StrEnum], dict[str, StrEnum]]
+    # first letter of the names of the party members
+    characters_initials: dict[str, Character]
+    # every prefix of the names of the aeons
+    aeons_prefixes: dict[str, Character]
+    actions: dict[str, Action]
+    yojimbo_actions: dict[str, Action]
+    monsters: dict[str, Monster]
+    zones: dict[str, Zone]
+    bosses: dict[str, Boss]
+    simulations: dict[str, Simulation]
+
+    def get_enum_member[S: StrEnum](self, enum: type[S], name: str) -> S:
+        """Returns the member of enum with the normalized name,
+        raises KeyError if there is none.
+        """
+        return self.enums[enum][name]
+
+
+def _get_enum_symbols[S: StrEnum](enum: type[S]) -> dict[str, S]:
+    symbols = {}
+    for member in enum:
+        symbols.setdefault(stringify(member), member)
+    return symbols
+
+
+def _get_symbol_table(game_version: GameVersion) -> SymbolTable:
+    enums = {e: _get_enum_symbols(e) for e in SYMBOL_ENUMS}
+    characters_initials = {stringify(c)[0]: c for c in tuple(Character)[:8]}
+    aeons_prefixes = {}
+    for aeon in tuple(Character)[8:]:
+        name = stringify(aeon)
+        for length in range(1, len(name) + 1):
+            aeons_prefixes.setdefault(name[:length], aeon)
+    return SymbolTable(
+        enums=enums,
+        characters_initials=characters_initials,
+        aeons_prefixes=aeons_prefixes,
+        actions=ACTIONS,
+        yojimbo_actions=YOJIMBO_ACTIONS,
+        monsters=get_monsters_dict(game_version),
+        zones=ZONES,
+        bosses=BOSSES,
+        simulations=SIMULATIONS,
+        )
+
+
+def get_symbol_table(game_version: GameVersion | None = None,
+                     ) -> SymbolTable:
+    """Returns the symbol table of game_version (defaults to
+    Configs.game_version), it is built on the first call.
+    """
+    if game_version is None:
+        game_version = Configs.game_version
+    symbol_table = _SYMBOL_TABLES.get(game_version)
+    if symbol_table is not None:
+        return symbol_table
+    # built once even if the worker threads ask for it together
+    with _SYMBOL_TABLES_LOCK:
+        symbol_table = _SYMBOL_TABLES.get(game_version)
+        if symbol_table is None:
+            symbol_table = _get_symbol_table(game_version)
+            _SYMBOL_TABLES[game_version] = symbol_table
+    return symbol_table
+
+
+SYMBOL_ENUMS: tuple[type[StrEnum], ...] = (
+    Autoability,
+    Character,
+    Element,
+    ElementalAffinity,
+    EquipmentType,
+    Item,
+    Stat,
+    Status,
+)
+_SYMBOL_TABLES: dict[GameVersion, SymbolTable] = {}
+_SYMBOL_TABLES_LOCK = threading.Lock()
@@ -0,0 +1,135 @@
+from array import array
+
+from .data.constants import KillType, Rarity, Stat
+from .data.items import ItemDrop
+from .data.monsters import Monster
+from .tracker import FFXRNGTracker
+
+# number of successful steals with a precomputed table,
+# the chance of stealing is halved after every one
+STEAL_TABLES = 4
+
+
+class DropOutcomeTables:
+    """Outcomes of the item drops, steals and bribes of a monster
+    at every position of the rng indexes they use, up to horizon.
+
+    The tables are computed in bulk from the values of rng10 (drop
+    and steal chance), rng11 (rarity) and rng60-67 (bribe chance),
+    looking up an outcome is a single index per rng index instead of
+    simulating the event. Bribes don't take into account the Sleep
+    status of the monster.
+    """
+
+    def __init__(self,
+                 rng_tracker: FFXRNGTracker,
+                 monster: Monster,
+                 horizon: int = 1024,
+                 ) -> None:
+        self.monster = monster
+        self.horizon = horizon
+        drop_rolls = array('B', [v % 255 for v in rng_tracker.get_rng_values(
+            10, 0, horizon)])
+        self.drop_rolls = drop_rolls
+        chance = monster.item_1.drop_chance
+        self.item_1_drops = bytes([chance > r for r in drop_rolls])
+        chance = monster.item_2.drop_chance
+        self.item_2_drops = bytes([chance > r for r in drop_rolls])
+        self.steals = tuple(
+            bytes([monster.steal.base_chance // (2 ** n) > r
+                   for r in drop_rolls])
+            for n in range(STEAL_TABLES))
+        self.rare = bytes([v & 255 < 32 for v in rng_tracker.get_rng_values(
+            11, 0, horizon)])
+        self.bribe_gil: tuple[array, ...] | None = None
+        if monster.bribe.item is not None and not monster.immune_to_bribe:
+            min_gil = self._get_bribe_min_gil()
+            self.bribe_gil = tuple(
+                array('Q', [min_gil[v & 255] for v in
+                            rng_tracker.get_rng_values(i, 0, horizon)])
+                for i in range(60, 68))
+
+    def _get_bribe_min_gil(self) -> list[int]:
+        """Returns the minimum total gil needed to bribe the monster
+        for every value of the bribe chance roll.
+        """
+        hp = self.monster.stats[Stat.HP]
+
+        def is_successful(gil: int, roll: int) -> bool:
+            return int(gil * 256 / hp / 20) - 64 > roll
+
+        min_gil = []
+        for roll in range(256):
+            gil = max(1, -(-(roll + 65) * 20 * hp // 256))
+            # correct rounding errors of the float division
+            while not is_successful(gil, roll):
+                gil += 1
+            while gil > 1 and is_successful(gil - 1, roll):
+                gil -= 1
+            min_gil.append(gil)
+        return min_gil
+
+    def _get_rarity(self, rarity_position: int) -> Rarity:
+        if self.rare[rarity_position]:
+            return Rarity.RARE
+        return Rarity.COMMON
+
+    def get_item_1(self,
+                   drop_position: int,
+                   rarity_position: int,
+                   kill_type: KillType = KillType.NORMAL,
+                   ) -> ItemDrop | None:
+        """Returns the first item dropped with rng10 and rng11
+        at the given positions.
+        """
+        if not self.item_1_drops[drop_position]:
+            return None
+        rarity = self._get_rarity(rarity_position)
+        return self.monster.item_1.items[kill_type, rarity]
+
+    def get_item_2(self,
+                   drop_position: int,
+                   rarity_position: int,
+                   kill_type: KillType = KillType.NORMAL,
+                   ) -> ItemDrop | None:
+        """Returns the second item dropped with rng10 and rng11
+        at the given positions.
+        """
+        if not self.item_2_drops[drop_position]:
+            return None
+        rarity = self._get_rarity(rarity_position)
+        return self.monster.item_2.items[kill_type, rarity]
+
+    def is_steal_successful(self,
+                            steal_position: int,
+                            successful_steals: int = 0,
+                            ) -> bool:
+        if successful_steals < STEAL_TABLES:
+            return bool(self.steals[successful_steals][steal_position])
+        steal_chance = self.monster.steal.base_chance // (
+            2 ** successful_steals)
+        return steal_chance > self.drop_rolls[steal_position]
+
+    def get_steal(self,
+                  steal_position: int,
+                  rarity_position: int,
+                  successful_steals: int = 0,
+                  ) -> ItemDrop | None:
+        """Returns the item stolen with rng10 and rng11
+        at the given positions.
+        """
+        if not self.is_steal_successful(steal_position, successful_steals):
+            return None
+        return self.monster.steal.items[self._get_rarity(rarity_position)]
+
+    def get_bribe_gil(self,
+                      bribe_position: int,
+                      monster_index: int = 0,
+                      ) -> int | None:
+        """Returns the minimum total gil spent needed to bribe
+        the monster in the given slot of the monster party with its
+        rng index at the given position, None if it can't be bribed.
+        """
+        if self.bribe_gil is None:
+            return None
+        return self.bribe_gil[min(monster_index, 7)][bribe_position]
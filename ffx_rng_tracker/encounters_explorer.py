@@ -0,0 +1,192 @@
+from collections import Counter
+from dataclasses import dataclass
+
+from .data.constants import Character, EncounterCondition
+from .data.encounters import EncounterData, get_encounter_notes
+from .events.encounter import Encounter, MultizoneRandomEncounter
+from .events.main import Event
+from .events.parser import EventParser
+from .gamestate import get_aeons_stats_tier
+
+# positions of the rng indexes and party
+type ExplorerState = tuple[tuple[int, ...], tuple[Character, ...]]
+# number of combinations for every preemptives, ambushes
+# and encounters count
+type Distributions = tuple[dict[int, int], dict[int, int], dict[int, int]]
+
+
+def get_condition(event: Event) -> EncounterCondition | None:
+    """Returns the condition of an encounter event, multizone
+    encounters only have one if it is the same in every zone.
+    """
+    if isinstance(event, Encounter):
+        return event.condition
+    if isinstance(event, MultizoneRandomEncounter):
+        conditions = {e.condition for e in event.encounters}
+        if len(conditions) == 1:
+            return conditions.pop()
+    return None
+
+
+@dataclass(frozen=True)
+class EncounterTransition:
+    state: ExplorerState
+    condition: EncounterCondition | None
+    # encounters that increment the encounters count
+    encounters: int
+
+
+@dataclass
+class EncountersDistribution:
+    """Number of combinations of encounters counts that result
+    in every preemptives count, ambushes count, encounters count
+    and aeons stats tier.
+    """
+    preemptives: dict[int, int]
+    ambushes: dict[int, int]
+    encounters_counts: dict[int, int]
+    # number of distinct states after every encounters row
+    states: list[int]
+
+    @property
+    def combinations(self) -> int:
+        return sum(self.encounters_counts.values())
+
+    @property
+    def aeons_stats_tiers(self) -> dict[int, int]:
+        tiers = Counter()
+        for encounters_count, amount in self.encounters_counts.items():
+            tiers[get_aeons_stats_tier(encounters_count)] += amount
+        return dict(tiers)
+
+    def __str__(self) -> str:
+        combinations = self.combinations
+        lines = [f'Combinations: {combinations}',
+                 f'Max states: {max(self.states, default=1)}']
+        for name, distribution in (
+                ('Preemptives', self.preemptives),
+                ('Ambushes', self.ambushes),
+                ('Aeons stats tier', self.aeons_stats_tiers)):
+            lines.append(f'{name}:')
+            for value, amount in sorted(distribution.items()):
+                lines.append(f'    {value:>3}: {amount} '
+                             f'({amount / combinations * 100:.2f}%)')
+        return '\n'.join(lines)
+
+
+@dataclass
+class EncountersExplorer:
+    """Explores every combination of encounters counts between
+    the min and max of every encounters row.
+
+    Paths are merged after every row when they reach the same
+    positions of the rng indexes that affect the outcomes and the
+    same party, as every following encounter would have the same
+    outcome; for every state only the number of combinations for every
+    preemptives, ambushes and encounters count is kept. Formations
+    and conditions only depend on rng1, the other rng indexes advanced
+    by encounters (icvs, duplicate monsters) are ignored.
+
+    Every encounter is parsed once for every line, initiative
+    and state, the result is reused by every path that reaches them.
+    """
+    parser: EventParser
+    encounters: list[EncounterData]
+    rng_indexes: tuple[int, ...] = (1,)
+
+    def __post_init__(self) -> None:
+        self._transitions: dict[
+            tuple[str, bool, ExplorerState], EncounterTransition] = {}
+
+    def _get_state(self) -> ExplorerState:
+        gamestate = self.parser.gamestate
+        positions = gamestate._rng_tracker.rng_current_positions
+        return (tuple([positions[i] for i in self.rng_indexes]),
+                tuple(gamestate.party))
+
+    def _set_state(self, state: ExplorerState) -> None:
+        positions, party = state
+        gamestate = self.parser.gamestate
+        rng_positions = gamestate._rng_tracker.rng_current_positions
+        for index, position in zip(self.rng_indexes, positions):
+            rng_positions[index] = position
+        gamestate.set_party(party)
+
+    def _get_transition(self,
+                        line: str,
+                        initiative: bool,
+                        state: ExplorerState,
+                        ) -> EncounterTransition:
+        key = line, initiative, state
+        transition = self._transitions.get(key)
+        if transition is None:
+            self._set_state(state)
+            gamestate = self.parser.gamestate
+            encounters_count = gamestate.encounters_count
+            condition = get_condition(self.parser.parse_line(line))
+            transition = EncounterTransition(
+                state=self._get_state(),
+                condition=condition,
+                encounters=gamestate.encounters_count - encounters_count,
+            )
+            self._transitions[key] = transition
+        return transition
+
+    def explore(self) -> EncountersDistribution:
+        gamestate = self.parser.gamestate
+        gamestate.reset()
+        frontier: dict[ExplorerState, Distributions] = {
+            self._get_state(): ({0: 1}, {0: 1}, {0: 1})}
+        states = []
+        initiative_equipped = False
+        for data in self.encounters:
+            if data.initiative != initiative_equipped:
+                initiative_equipped = data.initiative
+                if initiative_equipped:
+                    self.parser.parse_line('equip weapon tidus 1 initiative')
+                else:
+                    self.parser.parse_line('equip weapon tidus 1')
+            if ' ' in data.name:
+                line = f'encounter multizone {data.name}'
+            else:
+                line = f'encounter {data.name}'
+            new_frontier: dict[ExplorerState, Distributions] = {}
+            for state, distributions in frontier.items():
+                shifts = [0, 0, 0]
+                for count in range(data.max + 1):
+                    if count >= data.min:
+                        new_distributions = new_frontier.setdefault(
+                            state, ({}, {}, {}))
+                        for distribution, new_distribution, shift in zip(
+                                distributions, new_distributions, shifts):
+                            for value, combinations in distribution.items():
+                                value += shift
+                                new_distribution[value] = (
+                                    new_distribution.get(value, 0)
+                                    + combinations)
+                    if count == data.max:
+                        break
+                    transition = self._get_transition(
+                        line, initiative_equipped, state)
+                    state = transition.state
+                    if transition.condition is EncounterCondition.PREEMPTIVE:
+                        shifts[0] += 1
+                    elif transition.condition is EncounterCondition.AMBUSH:
+                        shifts[1] += 1
+                    shifts[2] += transition.encounters
+            frontier = new_frontier
+            states.append(len(frontier))
+
+        totals = Counter(), Counter(), Counter()
+        for distributions in frontier.values():
+            for total, distribution in zip(totals, distributions):
+                total.update(distribution)
+        return EncountersDistribution(*[dict(t) for t in totals], states)
+
+
+def explore_encounters_notes(parser: EventParser,
+                             notes_file: str = 'encounters_notes.csv',
+                             ) -> EncountersDistribution:
+    """Explores the encounters notes of the seed of the parser."""
+    encounters = get_encounter_notes(notes_file, parser.gamestate.seed)
+    return EncountersExplorer(parser, encounters).explore()
@@ -0,0 +1,40 @@
+from collections.abc import Iterator, Sequence
+from itertools import count, islice
+
+from .events.encounter import MultizoneRandomEncounter, RandomEncounter
+from .gamestate import GameState
+
+type ForecastEncounter = RandomEncounter | MultizoneRandomEncounter
+
+
+def forecast_encounters(gamestate: GameState,
+                        zones: Sequence[str],
+                        amount: int | None = None,
+                        ) -> Iterator[ForecastEncounter]:
+    """Yields the next random encounters in zones, with more than
+    one zone every encounter shows the formation and condition
+    it would have in each of them and the state is advanced
+    by the one in the last zone.
+
+    The encounters are parsed lazily on a fork of gamestate,
+    which is never advanced; amount defaults to no limit.
+    """
+    fork = gamestate.fork()
+    counter = count() if amount is None else range(amount)
+    for _ in counter:
+        if len(zones) == 1:
+            yield RandomEncounter(fork, zones[0])
+        else:
+            yield MultizoneRandomEncounter(fork, zones)
+
+
+def forecast_encounters_chunks(gamestate: GameState,
+                               zones: Sequence[str],
+                               chunk_size: int = 50,
+                               ) -> Iterator[list[ForecastEncounter]]:
+    """Yields the next random encounters in zones in lists
+    of chunk_size, used to page through them on demand.
+    """
+    encounters = forecast_encounters(gamestate, zones)
+    while True:
+        yield list(islice(encounters, chunk_size))
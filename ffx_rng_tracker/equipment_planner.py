@@ -0,0 +1,184 @@
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import count, product
+
+from .data.constants import Autoability, Character, EquipmentType
+from .data.equipment import Equipment, EquipmentDrop
+from .data.symbols import get_symbol_table
+from .events.kill import roll_equipment
+from .tracker import FFXRNGTracker
+from .utils import stringify
+
+# positions of the rng indexes used by kills to roll equipment
+type DropPositions = tuple[int, int, int]
+DROP_RNG_INDEXES = (10, 12, 13)
+
+
+@dataclass(frozen=True)
+class EquipmentTarget:
+    """The wanted equipment, owner and type_ match anything
+    when they are None.
+    """
+    owner: Character | None = None
+    type_: EquipmentType | None = None
+    min_slots: int = 1
+    abilities: frozenset[Autoability] = frozenset()
+
+    def is_satisfied_by(self, equipment: Equipment) -> bool:
+        if self.owner is not None and equipment.owner is not self.owner:
+            return False
+        if self.type_ is not None and equipment.type_ is not self.type_:
+            return False
+        if equipment.slots < self.min_slots:
+            return False
+        return self.abilities.issubset(equipment.abilities)
+
+
+@dataclass(frozen=True)
+class KillOption:
+    """A kill that can be used to roll equipment and the party
+    in battle when the monster is killed.
+    """
+    monster_name: str
+    killer: Character
+    party: tuple[Character, ...]
+    cost: int = 1
+
+    def __str__(self) -> str:
+        initials = ''.join(stringify(c)[0] for c in self.party)
+        return f'{self.monster_name} by {self.killer} ({initials})'
+
+    def to_notes(self) -> str:
+        initials = ''.join(stringify(c)[0] for c in self.party)
+        return (f'party {initials}\n'
+                f'kill {self.monster_name} {stringify(self.killer)}')
+
+
+@dataclass(frozen=True)
+class KillRoll:
+    equipment: EquipmentDrop | None
+    # positions after the kill
+    positions: DropPositions
+
+
+class DropTables:
+    """Equipment rolled by kills, computed once for every kill option
+    and positions of rng10, rng12 and rng13.
+    """
+
+    def __init__(self, rng_tracker: FFXRNGTracker) -> None:
+        self.rng_tracker = rng_tracker
+        self._rolls: dict[KillOption, dict[DropPositions, KillRoll]] = {}
+
+    def get_roll(self,
+                 option: KillOption,
+                 positions: DropPositions,
+                 ) -> KillRoll:
+        table = self._rolls.setdefault(option, {})
+        roll = table.get(positions)
+        if roll is None:
+            roll = self._roll(option, positions)
+            table[positions] = roll
+        return roll
+
+    def _roll(self, option: KillOption, positions: DropPositions) -> KillRoll:
+        monster = get_symbol_table().monsters[option.monster_name]
+        current_positions = dict(zip(DROP_RNG_INDEXES, positions))
+        # the two item drops are rolled first and advance rng10 once each,
+        # their rarity uses rng11 which does not affect equipment
+        current_positions[10] += 2
+
+        def advance_rng(index: int) -> int:
+            position = current_positions[index]
+            current_positions[index] = position + 1
+            return self.rng_tracker.get_rng_values(
+                index, position, position + 1)[0]
+
+        equipment = roll_equipment(
+            monster, option.killer, option.party, advance_rng)
+        return KillRoll(
+            equipment, tuple(current_positions[i] for i in DROP_RNG_INDEXES))
+
+
+@dataclass
+class EquipmentPlan:
+    kills: list[KillOption]
+    cost: int
+    equipment: EquipmentDrop
+
+    def __str__(self) -> str:
+        kills = ', '.join([str(k) for k in self.kills])
+        return f'{kills} -> {self.equipment} (cost {self.cost})'
+
+    def to_notes(self) -> str:
+        return '\n'.join([k.to_notes() for k in self.kills])
+
+
+@dataclass
+class EquipmentPlanner:
+    """Best-first search of the cheapest sequences of kills
+    whose last kill drops equipment that satisfies the target.
+
+    Sequences that share a prefix share its rolls, which are looked
+    up in the drop tables; a sequence that reaches rng positions
+    already reached by a cheaper one is pruned, as every following
+    kill would roll the same equipment. Sequences are at most
+    horizon kills long.
+    """
+    rng_tracker: FFXRNGTracker
+    target: EquipmentTarget
+    options: list[KillOption]
+    horizon: int = 10
+    max_states: int = 100_000
+    drop_tables: DropTables | None = None
+
+    def __post_init__(self) -> None:
+        if self.drop_tables is None:
+            self.drop_tables = DropTables(self.rng_tracker)
+
+    def search(self,
+               amount: int = 1,
+               start: DropPositions | None = None,
+               ) -> list[EquipmentPlan]:
+        """Returns up to amount plans sorted by cost, the search
+        starts from the current rng positions by default.
+        """
+        if start is None:
+            start = tuple(self.rng_tracker.rng_current_positions[i]
+                          for i in DROP_RNG_INDEXES)
+        plans = []
+        # the counter breaks ties between states with the same cost
+        # and number of kills
+        tie_breaker = count()
+        queue = [(0, 0, next(tie_breaker), start, (), None)]
+        visited_positions: set[DropPositions] = set()
+        states = 0
+        while queue and states < self.max_states and len(plans) < amount:
+            cost, n_kills, _, positions, kills, equipment = heapq.heappop(
+                queue)
+            states += 1
+            if equipment and self.target.is_satisfied_by(equipment.equipment):
+                plans.append(EquipmentPlan(list(kills), cost, equipment))
+                continue
+            if positions in visited_positions:
+                continue
+            visited_positions.add(positions)
+            if n_kills >= self.horizon:
+                continue
+            for option in self.options:
+                roll = self.drop_tables.get_roll(option, positions)
+                heapq.heappush(queue, (
+                    cost + option.cost, n_kills + 1, next(tie_breaker),
+                    roll.positions, (*kills, option), roll.equipment))
+        return plans
+
+
+def get_kill_options(monsters_names: Iterable[str],
+                     killers: Iterable[Character],
+                     parties: Iterable[tuple[Character, ...]],
+                     cost: int = 1,
+                     ) -> list[KillOption]:
+    """Returns every combination of monster, killer and party."""
+    return [KillOption(m, k, p, cost)
+            for m, k, p in product(monsters_names, killers, parties)]
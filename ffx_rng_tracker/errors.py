@@ -8,3 +8,7 @@ class InvalidDamageValueError(Exception):
 
 class EventParsingError(Exception):
     """Raised when a string cannot be parsed to instantiate an Event object."""
+
+
+class ParsingCancelledError(Exception):
+    """Raised when parsing is stopped because its result is not needed."""
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from math import sqrt
 
 from ..configs import Configs
+from ..ctb_scheduler import get_turn_ctb
 from ..data.actor import CharacterActor, MonsterActor
 from ..data.constants import GameVersion, KillType, Stat, Status
 from ..data.items import ItemDrop
@@ -90,10 +91,6 @@ class BribeAction(Event):
         self.bribe_gil_spent = self.monster.bribe_gil_spent
 
     def _get_ctb(self) -> int:
-        ctb = self.character.base_ctb * 3
-        if Status.HASTE in self.character.statuses:
-            ctb = ctb // 2
-        elif Status.SLOW in self.character.statuses:
-            ctb = ctb * 2
+        ctb = get_turn_ctb(self.character, rank=3)
         self.character.ctb += ctb
         return ctb
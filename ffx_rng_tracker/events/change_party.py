@@ -10,8 +10,7 @@ class ChangeParty(Event):
 
     def __post_init__(self) -> None:
         self.old_party = self.gamestate.party.copy()
-        self.gamestate.party.clear()
-        self.gamestate.party.extend(self.party)
+        self.gamestate.set_party(self.party)
 
     def __str__(self) -> str:
         return f'Party: {', '.join(self.old_party)} -> {', '.join(self.party)}'
@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from functools import cache
 from typing import Literal
 
+from ..ctb_scheduler import get_turn_ctb
 from ..data.actions import ACTIONS, OD_TIMERS, Action
 from ..data.actor import Actor, CharacterActor, MonsterActor
 from ..data.autoabilities import (DEFENSE_BONUSES, MAGIC_BONUSES,
@@ -579,11 +580,7 @@ class CharacterAction(Event):
             rank = self.action.rank
         else:
             rank = 3
-        ctb = self.user.base_ctb * rank
-        if Status.HASTE in self.user.statuses:
-            ctb = ctb // 2
-        elif Status.SLOW in self.user.statuses:
-            ctb = ctb * 2
+        ctb = get_turn_ctb(self.user, rank)
         self.user.ctb += ctb
         return ctb
 
@@ -5,8 +5,10 @@ from ..data.actor import MonsterActor
 from ..data.constants import (ICV_VARIANCE, Autoability, Character,
                               EncounterCondition, MonsterSlot, Stat, Status)
 from ..data.encounter_formations import (BOSSES, FORMATIONS, SIMULATIONS,
-                                         ZONES, Formation)
-from ..ui_functions import ctb_sorter
+                                         ZONES, Formation, ResolvedFormation)
+from ..data.encounters import condition_from_rng
+from ..gamestate import GameState
+from ..ui_functions import format_ctb
 from .main import Event
 
 
@@ -17,6 +19,7 @@ class Encounter(Event):
     def __post_init__(self) -> None:
         self.gamestate.process_start_of_encounter()
         self.formation = self._get_formation()
+        self.resolved_formation = self.formation.resolve()
         self._update_party()
         self._update_current_monster_formation()
         self.condition = self._get_condition()
@@ -30,7 +33,7 @@ class Encounter(Event):
     def __str__(self) -> str:
         string = (f'Encounter: {self.index:>3} | '
                   f'{FORMATIONS[self.name].name} | '
-                  f'{self.formation} {self.condition} | '
+                  f'{self.resolved_formation.string} {self.condition} | '
                   f'{self.icvs_string}')
         return string
 
@@ -46,38 +49,21 @@ class Encounter(Event):
             return
         boss = BOSSES[self.name]
         if boss.forced_party:
-            self.gamestate.party.clear()
-            self.gamestate.party.extend(boss.forced_party)
+            self.gamestate.set_party(boss.forced_party)
 
     def _update_current_monster_formation(self) -> None:
-        for monster, slot in zip(self.formation.monsters, MonsterSlot):
-            self.gamestate.monster_party.append(MonsterActor(monster, slot))
+        monsters = self.resolved_formation.monsters
+        for monster, slot in zip(monsters, MonsterSlot):
+            self.gamestate.add_monster(MonsterActor(monster, slot))
 
     def _get_condition(self) -> EncounterCondition:
-        condition_rng = self._advance_rng(1) & 255
-        if self.formation.forced_condition is not None:
-            return self.formation.forced_condition
-        for character in self.gamestate.party:
-            actor = self.gamestate.characters[character]
-            if Autoability.INITIATIVE in actor.autoabilities:
-                condition_rng -= 33
-                break
-        if condition_rng < 32:
-            return EncounterCondition.PREEMPTIVE
-        elif condition_rng < 255 - 32:
-            return EncounterCondition.NORMAL
-        else:
-            return EncounterCondition.AMBUSH
+        condition_rng = self._advance_rng(1)
+        return get_encounter_condition(
+            self.formation, condition_rng, self.gamestate)
 
     def _duplicate_monsters_rng_advances(self) -> None:
-        monsters = self.formation.monsters
-        for index, monster in enumerate(monsters):
-            count = monsters.count(monster)
-            if count > 1:
-                if monsters.index(monster) == index:
-                    for _ in range(count):
-                        self._advance_rng(28 + index)
-                self._advance_rng(28 + index)
+        for index in self.resolved_formation.duplicate_monsters_rng_advances:
+            self._advance_rng(index)
 
     def _set_party_icvs(self) -> None:
         if self.condition is EncounterCondition.PREEMPTIVE:
@@ -124,13 +110,13 @@ class Encounter(Event):
                 variance = 100 - (variance_rng % 11)
                 actor.ctb = (actor.base_ctb * 3 * 100) // variance
             # empty monster party slots still advance rng
-            for index in range(28 + len(self.formation.monsters), 36):
+            monsters = self.resolved_formation.monsters
+            for index in range(28 + len(monsters), 36):
                 self._advance_rng(index)
 
     def _get_icvs_string(self) -> str:
-        characters = [actor for c, actor in self.gamestate.characters.items()
-                      if c in self.gamestate.party]
-        return ctb_sorter(characters, self.gamestate.monster_party)
+        actors = self.gamestate.ctb_scheduler.get_turn_order()
+        return ' '.join([format_ctb(a, a.ctb) for a in actors])
 
 
 @dataclass
@@ -178,8 +164,25 @@ class RandomEncounter(Encounter):
         return index
 
 
+@dataclass(frozen=True)
+class ZoneEncounter:
+    """Formation and condition of a random encounter in a zone
+    that was not chosen by a multizone random encounter.
+    """
+    name: str
+    zone_index: int
+    formation: Formation
+    resolved_formation: ResolvedFormation
+    condition: EncounterCondition
+
+
 @dataclass
 class MultizoneRandomEncounter(Event):
+    """Random encounter that shows the formation and condition
+    it would have in every zone, the rng values used to determine
+    them are drawn once and the state is only advanced by the
+    encounter in the last zone.
+    """
     zones: Iterable[str]
 
     def __post_init__(self) -> None:
@@ -191,27 +194,57 @@ class MultizoneRandomEncounter(Event):
         formations = []
         for count, enc in enumerate(self.encounters, 1):
             if count == 1:
-                string += str(enc).split('|')[0]
+                if isinstance(enc, ZoneEncounter):
+                    last = self.encounters[-1]
+                    string += (f'Random Encounter: {last.index:>3} '
+                               f'{last.random_index:>3} '
+                               f'{enc.zone_index:>3} ')
+                else:
+                    string += str(enc).split('|')[0]
             zone_name = ZONES[enc.name].name
             zones_names.append(zone_name)
-            formation = f'{enc.formation} {enc.condition}'
+            formation = f'{enc.resolved_formation.string} {enc.condition}'
             formations.append(formation)
         string += (f' | {'/'.join(zones_names)} | '
                    f'{' | '.join(formations)} | '
                    f'{enc.icvs_string}')
         return string
 
-    def _get_encounters(self) -> list[RandomEncounter]:
+    def _get_encounters(self) -> list[ZoneEncounter | RandomEncounter]:
+        *zones, last_zone = self.zones
         encounters = []
-        self.gamestate.save_rng()
-        for count, zone in enumerate(self.zones, 1):
-            encounter = RandomEncounter(
-                gamestate=self.gamestate,
-                name=zone,
-            )
-            encounters.append(encounter)
-            if count < len(self.zones):
-                self.gamestate.encounters_count -= 1
-                self.gamestate.random_encounters_count -= 1
-                self.gamestate.restore_rng()
+        if zones:
+            rng_tracker = self.gamestate._rng_tracker
+            position = rng_tracker.rng_current_positions[1]
+            formation_rng, condition_rng = rng_tracker.get_rng_values(
+                1, position, position + 2)
+            zone_counts = self.gamestate.zone_encounters_counts
+            for zone in zones:
+                formations = ZONES[zone].formations
+                formation = formations[formation_rng % len(formations)]
+                zone_counts[zone] = zone_counts.get(zone, 0) + 1
+                encounters.append(ZoneEncounter(
+                    name=zone,
+                    zone_index=zone_counts[zone],
+                    formation=formation,
+                    resolved_formation=formation.resolve(),
+                    condition=get_encounter_condition(
+                        formation, condition_rng, self.gamestate),
+                ))
+        encounters.append(RandomEncounter(self.gamestate, last_zone))
         return encounters
+
+
+def get_encounter_condition(formation: Formation,
+                            condition_rng: int,
+                            gamestate: GameState,
+                            ) -> EncounterCondition:
+    """Returns the condition of an encounter with formation
+    from the value of rng1.
+    """
+    if formation.forced_condition is not None:
+        return formation.forced_condition
+    initiative = any(
+        Autoability.INITIATIVE in gamestate.characters[c].autoabilities
+        for c in gamestate.party)
+    return condition_from_rng(condition_rng, initiative)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from ..ctb_scheduler import get_turn_ctb
 from ..data.actor import CharacterActor
 from ..data.constants import Status
 from .main import Event
@@ -30,10 +31,6 @@ class Escape(Event):
         return escape
 
     def _get_ctb(self) -> int:
-        ctb = self.character.base_ctb
-        if Status.HASTE in self.character.statuses:
-            ctb = ctb // 2
-        elif Status.SLOW in self.character.statuses:
-            ctb = ctb * 2
+        ctb = get_turn_ctb(self.character, rank=1)
         self.character.ctb += ctb
         return ctb
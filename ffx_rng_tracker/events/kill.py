@@ -1,3 +1,4 @@
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 
 from ..configs import Configs
@@ -83,85 +84,97 @@ class Kill(Event):
         """Returns equipment obtained from killing a monster
         at the current rng position and advances rng accordingly.
         """
-        rng_equipment_drop = self._advance_rng(10) % 255
-        if self.monster.equipment.drop_chance <= rng_equipment_drop:
-            return
-
-        possible_owners = [c for c in tuple(Character)[:7]
-                           if c in self.gamestate.party]
-        rng_equipment_owner = self._advance_rng(12)
-
-        killer_bonus_chance = KILLER_BONUS_CHANCE[Configs.game_version]
-
-        # check if killing with a party member
-        # always gives the equipment to that character
-        test_owner_index = (rng_equipment_owner
-                            % (len(possible_owners) + killer_bonus_chance))
-        killer_is_owner = test_owner_index >= len(possible_owners)
-
-        # if the killer is a party member (0-6)
-        # it gives them a bonus chance for the equipment to be theirs
-        if tuple(Character).index(self.killer) < 7:
-            for _ in range(killer_bonus_chance):
-                possible_owners.append(self.killer)
-
-        rng_equipment_owner = rng_equipment_owner % len(possible_owners)
-        owner = possible_owners[rng_equipment_owner]
-
-        rng_weapon_or_armor = self._advance_rng(12) & 1
-        if rng_weapon_or_armor == 0:
-            type_ = EquipmentType.WEAPON
-        else:
-            type_ = EquipmentType.ARMOR
-
-        rng_number_of_slots = self._advance_rng(12) & 7
-        number_of_slots = self.monster.equipment.slots_range[rng_number_of_slots]
-
-        # get number of abilities
-        rng_number_of_abilities = self._advance_rng(12) & 7
-        number_of_abilities = self.monster.equipment.max_ability_rolls_range[rng_number_of_abilities]
-
-        abilities_list = self.monster.equipment.ability_lists[type_][owner]
-
-        abilities = []
-
-        forced_ability = abilities_list[0]
-        if forced_ability:
-            abilities.append(forced_ability)
-
-        for _ in range(number_of_abilities):
-            # if all the slots are filled break
-            if len(abilities) >= number_of_slots:
-                break
-            rng_ability_index = self._advance_rng(13) % 7 + 1
-            ability = abilities_list[rng_ability_index]
-            # if the ability is not null and not a duplicate add it
-            if ability and ability not in abilities:
-                abilities.append(ability)
-
-        # other equipment information
-        base_weapon_damage = self.monster.equipment.base_weapon_damage
-        bonus_crit = self.monster.equipment.bonus_critical_chance
-
-        equipment = Equipment(
-            owner=owner,
-            type_=type_,
-            slots=number_of_slots,
-            abilities=abilities,
-            base_weapon_damage=base_weapon_damage,
-            bonus_crit=bonus_crit,
-        )
-        equipment_drop = EquipmentDrop(
-            equipment=equipment,
-            killer=self.killer,
-            monster=self.monster,
-            killer_is_owner=killer_is_owner,
-        )
-
-        return equipment_drop
+        return roll_equipment(
+            self.monster, self.killer, self.gamestate.party,
+            self._advance_rng)
 
     def _get_equipment_index(self) -> int | None:
         if not self.equipment:
             return None
         self.gamestate.equipment_drops += 1
         return self.gamestate.equipment_drops
+
+
+def roll_equipment(monster: Monster,
+                   killer: Character,
+                   party: Iterable[Character],
+                   advance_rng: Callable[[int], int],
+                   ) -> EquipmentDrop | None:
+    """Returns the equipment dropped by monster when killed by killer,
+    rng values are obtained by calling advance_rng with their index.
+    """
+    rng_equipment_drop = advance_rng(10) % 255
+    if monster.equipment.drop_chance <= rng_equipment_drop:
+        return
+
+    possible_owners = [c for c in tuple(Character)[:7] if c in party]
+    rng_equipment_owner = advance_rng(12)
+
+    killer_bonus_chance = KILLER_BONUS_CHANCE[Configs.game_version]
+
+    # check if killing with a party member
+    # always gives the equipment to that character
+    test_owner_index = (rng_equipment_owner
+                        % (len(possible_owners) + killer_bonus_chance))
+    killer_is_owner = test_owner_index >= len(possible_owners)
+
+    # if the killer is a party member (0-6)
+    # it gives them a bonus chance for the equipment to be theirs
+    if tuple(Character).index(killer) < 7:
+        for _ in range(killer_bonus_chance):
+            possible_owners.append(killer)
+
+    rng_equipment_owner = rng_equipment_owner % len(possible_owners)
+    owner = possible_owners[rng_equipment_owner]
+
+    rng_weapon_or_armor = advance_rng(12) & 1
+    if rng_weapon_or_armor == 0:
+        type_ = EquipmentType.WEAPON
+    else:
+        type_ = EquipmentType.ARMOR
+
+    rng_number_of_slots = advance_rng(12) & 7
+    number_of_slots = monster.equipment.slots_range[rng_number_of_slots]
+
+    # get number of abilities
+    rng_number_of_abilities = advance_rng(12) & 7
+    number_of_abilities = monster.equipment.max_ability_rolls_range[rng_number_of_abilities]
+
+    abilities_list = monster.equipment.ability_lists[type_][owner]
+
+    abilities = []
+
+    forced_ability = abilities_list[0]
+    if forced_ability:
+        abilities.append(forced_ability)
+
+    for _ in range(number_of_abilities):
+        # if all the slots are filled break
+        if len(abilities) >= number_of_slots:
+            break
+        rng_ability_index = advance_rng(13) % 7 + 1
+        ability = abilities_list[rng_ability_index]
+        # if the ability is not null and not a duplicate add it
+        if ability and ability not in abilities:
+            abilities.append(ability)
+
+    # other equipment information
+    base_weapon_damage = monster.equipment.base_weapon_damage
+    bonus_crit = monster.equipment.bonus_critical_chance
+
+    equipment = Equipment(
+        owner=owner,
+        type_=type_,
+        slots=number_of_slots,
+        abilities=abilities,
+        base_weapon_damage=base_weapon_damage,
+        bonus_crit=bonus_crit,
+    )
+    equipment_drop = EquipmentDrop(
+        equipment=equipment,
+        killer=killer,
+        monster=monster,
+        killer_is_owner=killer_is_owner,
+    )
+
+    return equipment_drop
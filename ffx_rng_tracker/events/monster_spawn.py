@@ -21,10 +21,7 @@ class MonsterSpawn(Event):
 
     def _spawn_monster(self) -> MonsterActor:
         actor = MonsterActor(self.monster, self.slot)
-        if self.slot < len(self.gamestate.monster_party):
-            self.gamestate.monster_party[self.slot] = actor
-        else:
-            self.gamestate.monster_party.append(actor)
+        self.gamestate.add_monster(actor)
         return actor
 
     def _calc_ctb(self) -> int:
@@ -1,17 +1,29 @@
-from ..errors import EventParsingError
+from collections.abc import Callable
+from time import perf_counter
+
+from ..errors import EventParsingError, ParsingCancelledError
 from ..gamestate import GameState
+from ..tracker import RNGLedger
 from .comment import Comment
 from .main import Event
 from .parsing_functions import USAGE, ParsingFunction, parse_roll
+from .profiler import ParserProfiler
 
 
 class EventParser:
     """Helper class used to convert strings to events."""
 
-    def __init__(self, gamestate: GameState) -> None:
+    def __init__(self,
+                 gamestate: GameState,
+                 profiler: ParserProfiler | None = None,
+                 ) -> None:
         self.gamestate = gamestate
         self.parsing_functions: dict[str, ParsingFunction] = {}
         self.macros: dict[str, str] = {}
+        # when set every parsed line is recorded by the profiler
+        self.profiler = profiler
+        # when set the rng positions after every line are recorded
+        self.rng_ledger: RNGLedger | None = None
         self.build_usage_text()
 
     def build_usage_text(self) -> None:
@@ -45,23 +57,44 @@ class EventParser:
         text = text[1:-1]
         return text
 
-    def parse_to_string(self, text: str) -> str:
-        return '\n'.join([str(e) for e in self.parse(text)])
+    def parse_to_string(self,
+                        text: str,
+                        is_cancelled: Callable[[], bool] | None = None,
+                        ) -> str:
+        return '\n'.join([str(e) for e in self.parse(text, is_cancelled)])
+
+    def parse(self,
+              text: str,
+              is_cancelled: Callable[[], bool] | None = None,
+              ) -> list[Event]:
+        """Parse through the input text and returns a list of events.
 
-    def parse(self, text: str) -> list[Event]:
-        """Parse through the input text and returns a list of events."""
+        If is_cancelled is provided it will be called before parsing
+        every line, if it returns True ParsingCancelledError is raised.
+        """
         text = self.apply_macros(text)
+        if self.profiler is None:
+            parse_line = self.parse_line
+        else:
+            parse_line = self.profile_line
+        rng_ledger = self.rng_ledger
+        if rng_ledger is not None:
+            rng_ledger.start()
 
         lines = text.splitlines()
         events = []
         multiline_comment = False
         for i, line in enumerate(lines):
+            if is_cancelled is not None and is_cancelled():
+                raise ParsingCancelledError()
             if line.startswith('/*'):
                 multiline_comment = True
             if multiline_comment:
                 if line.endswith('*/'):
                     multiline_comment = False
                 events.append(Comment(self.gamestate, f'# {line}'))
+                if rng_ledger is not None:
+                    rng_ledger.record(line)
                 continue
 
             if line == '/repeat' or line.startswith('/repeat '):
@@ -78,10 +111,31 @@ class EventParser:
                     for j in range(min(i, n_of_lines)):
                         lines.insert(i + 1, lines[i - 1 - j])
 
-            event = self.parse_line(line)
+            event = parse_line(line)
             events.append(event)
+            if rng_ledger is not None:
+                rng_ledger.record(line)
         return events
 
+    def profile_line(self, line: str) -> Event:
+        """Parse the input line and records the time spent
+        and the rng advanced with the profiler.
+        """
+        words = line.lower().split()
+        function = None
+        if words and not line.startswith(('#', '/')):
+            function = self.parsing_functions.get(words[0])
+        function_name = '(none)' if function is None else function.__name__
+        rng_tracker = self.gamestate._rng_tracker
+        rng_before = sum(rng_tracker.rng_current_positions)
+        start = perf_counter()
+        event = self.parse_line(line)
+        seconds = perf_counter() - start
+        rng_advances = sum(rng_tracker.rng_current_positions) - rng_before
+        self.profiler.record(
+            type(event).__name__, function_name, seconds, rng_advances)
+        return event
+
     def parse_line(self, line: str) -> Event:
         """Parse the input line and returns an event."""
         words = line.lower().split()
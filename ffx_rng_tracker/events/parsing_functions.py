@@ -2,20 +2,20 @@ from enum import StrEnum
 from typing import Protocol
 
 from ..configs import Configs
-from ..data.actions import ACTIONS, YOJIMBO_ACTIONS
+from ..ctb_scheduler import MAX_FORECAST_TURNS
 from ..data.actor import Actor, MonsterActor
 from ..data.characters import s_lv_to_total_ap
 from ..data.constants import (SHORT_STATS_NAMES, Autoability, Character,
                               Element, ElementalAffinity, EquipmentType,
                               GameVersion, Item, KillType, MonsterSlot, Stat,
                               TargetType)
-from ..data.encounter_formations import BOSSES, SIMULATIONS, ZONES
 from ..data.equipment import Equipment
 from ..data.items import ITEM_PRICES
-from ..data.monsters import get_monsters_dict
+from ..data.symbols import get_symbol_table
 from ..errors import EventParsingError
 from ..gamestate import GameState
-from ..utils import search_strenum, stringify
+from ..ui_functions import format_ctb
+from ..utils import stringify
 from .advance_rng import AdvanceRNG
 from .bribe import BribeAction, BribeDrop
 from .change_equipment import ChangeEquipment
@@ -70,10 +70,11 @@ def parse_enum_member[S: StrEnum](member_name: str,
                                   enum: type[S],
                                   enum_name: str = 'member',
                                   ) -> S:
+    members = get_symbol_table().enums[enum]
     try:
-        return search_strenum(enum, member_name)
-    except ValueError:
-        enum_members = ', '.join([stringify(m) for m in enum])
+        return members[member_name]
+    except KeyError:
+        enum_members = ', '.join(members)
         text = f'{enum_name} can only be one of these values: {enum_members}'
         raise EventParsingError(text)
 
@@ -92,12 +93,10 @@ def parse_monster_slot(gs: GameState, slot: str) -> MonsterActor:
 def parse_party_members_initials(party_members_initials: str,
                                  ) -> list[Character]:
     party_members = []
-    initials = {stringify(c)[0]: c for c in tuple(Character)[:8]}
+    initials = get_symbol_table().characters_initials
     for letter in party_members_initials:
-        for initial in initials:
-            if letter == initial:
-                party_members.append(initials[initial])
-                break
+        if letter in initials:
+            party_members.append(initials[letter])
     # remove duplicates and keep order
     return list(dict.fromkeys(party_members))
 
@@ -142,17 +141,18 @@ def parse_equipment(equipment_type_name: str = '',
 
 
 def parse_target(gs: GameState, target_name: str) -> Actor:
+    symbols = get_symbol_table()
     if target_name in ('m1', 'm2', 'm3', 'm4', 'm5', 'm6', 'm7', 'm8'):
         return parse_monster_slot(gs, target_name)
     elif target_name.endswith('_c'):
         char_name = target_name[:-2]
-    elif target_name in get_monsters_dict():
-        return MonsterActor(get_monsters_dict()[target_name])
+    elif target_name in symbols.monsters:
+        return MonsterActor(symbols.monsters[target_name])
     else:
         char_name = target_name
     try:
-        char = search_strenum(Character, char_name)
-    except ValueError:
+        char = symbols.get_enum_member(Character, char_name)
+    except KeyError:
         raise EventParsingError(f'"{target_name}" is not a valid target')
     return gs.characters[char]
 
@@ -172,17 +172,18 @@ def parse_encounter(gs: GameState,
     elif 'ambush'.startswith(name):
         name = 'dummy_ambush'
 
-    if name in BOSSES:
+    symbols = get_symbol_table()
+    if name in symbols.bosses:
         encounter_type = Encounter
-    elif name in ZONES:
+    elif name in symbols.zones:
         encounter_type = RandomEncounter
-    elif name in SIMULATIONS:
+    elif name in symbols.simulations:
         encounter_type = SimulatedEncounter
     elif name == 'multizone':
         if not zones:
             raise EventParsingError
         for zone in zones:
-            if zone not in ZONES:
+            if zone not in symbols.zones:
                 raise EventParsingError(f'No zone named "{zone}"')
         return MultizoneRandomEncounter(gs, zones)
     else:
@@ -204,10 +205,10 @@ def parse_encounter_count_change(gs: GameState,
         count = parse_amount(amount, gs.random_encounters_count)
         gs.random_encounters_count = count
         count_name = 'Random'
-    elif name in ZONES:
+    elif name in get_symbol_table().zones:
         count = parse_amount(amount, gs.zone_encounters_counts[name])
         gs.zone_encounters_counts[name] = count
-        count_name = ZONES[name].name
+        count_name = get_symbol_table().zones[name].name
     else:
         raise EventParsingError
     return Comment(gs, f'{count_name} encounters count set to {count}')
@@ -220,7 +221,8 @@ def parse_steal(gs: GameState,
                 ) -> Steal:
     if not monster_name:
         raise EventParsingError
-    monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
+    monster = parse_dict_key(
+        monster_name, get_symbol_table().monsters, 'monster')
     try:
         successful_steals = int(successful_steals)
     except ValueError:
@@ -240,7 +242,8 @@ def parse_kill(gs: GameState,
                ) -> Kill:
     if not monster_name or not killer_name:
         raise EventParsingError
-    monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
+    monster = parse_dict_key(
+        monster_name, get_symbol_table().monsters, 'monster')
     killer = parse_enum_member(killer_name, Character, 'killer')
     ap_characters = parse_party_members_initials(ap_characters_string)
     if overkill in ('overkill', 'ok'):
@@ -258,7 +261,8 @@ def parse_bribe(gs: GameState,
                 ) -> BribeDrop:
     if not monster_name or not user_name:
         raise EventParsingError
-    monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
+    monster = parse_dict_key(
+        monster_name, get_symbol_table().monsters, 'monster')
     user = parse_enum_member(user_name, Character, 'user')
     ap_characters = parse_party_members_initials(ap_characters_string)
     return BribeDrop(gs, monster, user, ap_characters)
@@ -266,8 +270,9 @@ def parse_bribe(gs: GameState,
 
 def parse_death(gs: GameState, character_name: str = 'unknown', *_) -> Death:
     try:
-        character = search_strenum(Character, character_name)
-    except ValueError:
+        character = get_symbol_table().get_enum_member(
+            Character, character_name)
+    except KeyError:
         character = Character.UNKNOWN
     return Death(gs, character)
 
@@ -320,12 +325,9 @@ def parse_summon(gs: GameState, aeon_name: str = '', *_) -> ChangeParty:
         for m in gs.magus_sisters.values():
             m.on_summon()
     else:
-        for aeon in tuple(Character)[8:]:
-            if stringify(aeon).startswith(aeon_name):
-                party_formation = [aeon]
-                break
-        else:
-            raise EventParsingError(f'No aeon named "{aeon_name}"')
+        aeon = parse_dict_key(
+            aeon_name, get_symbol_table().aeons_prefixes, 'aeon')
+        party_formation = [aeon]
     return ChangeParty(gs, party_formation)
 
 
@@ -345,7 +347,8 @@ def parse_action(gs: GameState,
     if action_name == 'escape':
         return Escape(gs, actor)
 
-    action = parse_dict_key(action_name, ACTIONS, 'action')
+    symbols = get_symbol_table()
+    action = parse_dict_key(action_name, symbols.actions, 'action')
     if not action.can_use_in_combat:
         raise EventParsingError(f'Action {action} can\'t be used in battle')
 
@@ -377,7 +380,7 @@ def parse_action(gs: GameState,
                 target = parse_monster_slot(gs, target_name)
             else:
                 monster = parse_dict_key(
-                    target_name, get_monsters_dict(), 'monster name or slot')
+                    target_name, symbols.monsters, 'monster name or slot')
                 target = MonsterActor(monster)
         case TargetType.PARTY:
             if target_name == 'party':
@@ -461,8 +464,8 @@ def parse_stat_update(gs: GameState,
         actor = parse_monster_slot(gs, actor_name)
     else:
         try:
-            actor = search_strenum(Character, actor_name)
-        except ValueError:
+            actor = get_symbol_table().get_enum_member(Character, actor_name)
+        except KeyError:
             raise EventParsingError(f'"{actor_name}" is not a valid actor')
         actor = gs.characters[actor]
     if not stat_name and not amount:
@@ -485,8 +488,10 @@ def parse_yojimbo_action(gs: GameState,
                          ) -> YojimboTurn:
     if not action_name or not monster_name:
         raise EventParsingError
-    action = parse_dict_key(action_name, YOJIMBO_ACTIONS, 'yojimbo action')
-    monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
+    symbols = get_symbol_table()
+    action = parse_dict_key(
+        action_name, symbols.yojimbo_actions, 'yojimbo action')
+    monster = parse_dict_key(monster_name, symbols.monsters, 'monster')
     overdrive = overdrive == 'overdrive'
     return YojimboTurn(gs, action, monster, overdrive)
 
@@ -589,14 +594,15 @@ def parse_monster_action(gs: GameState,
     if not monster_name:
         raise EventParsingError
 
+    symbols = get_symbol_table()
     if monster_name in ('m1', 'm2', 'm3', 'm4', 'm5', 'm6', 'm7', 'm8'):
         actor = parse_monster_slot(gs, monster_name)
     else:
         monster = parse_dict_key(
-            monster_name, get_monsters_dict(), 'monster name or slot')
+            monster_name, symbols.monsters, 'monster name or slot')
         actor = MonsterActor(monster)
     if action_name == 'does_nothing':
-        action = ACTIONS['does_nothing']
+        action = symbols.actions['does_nothing']
     elif action_name == 'forced_action':
         action = actor.monster.forced_action
     elif not action_name and len(actor.monster.actions) == 1:
@@ -687,8 +693,9 @@ def parse_actor_status(gs: GameState,
         actor = parse_monster_slot(gs, actor_name)
     else:
         try:
-            character = search_strenum(Character, actor_name)
-        except ValueError:
+            character = get_symbol_table().get_enum_member(
+                Character, actor_name)
+        except KeyError:
             raise EventParsingError(f'"{actor_name}" is not a valid actor')
         actor = gs.characters[character]
     text = f'Status: {actor} {actor.current_hp}/{actor.max_hp} HP'
@@ -701,6 +708,21 @@ def parse_actor_status(gs: GameState,
     return Comment(gs, text)
 
 
+def parse_turns_forecast(gs: GameState,
+                         amount: str = '10',
+                         *_) -> Comment:
+    try:
+        turns = int(amount)
+    except ValueError:
+        raise EventParsingError('Amount needs to be an integer')
+    if not 1 <= turns <= MAX_FORECAST_TURNS:
+        raise EventParsingError(
+            f'Amount needs to be between 1 and {MAX_FORECAST_TURNS}')
+    forecast = gs.ctb_scheduler.forecast(turns)
+    text = ' '.join([format_ctb(actor, ctb) for actor, ctb in forecast])
+    return Comment(gs, f'Turns: {text or '-'}')
+
+
 def parse_monster_spawn(gs: GameState,
                         monster_name: str = '',
                         slot: str = '',
@@ -708,7 +730,8 @@ def parse_monster_spawn(gs: GameState,
                         *_) -> Comment:
     if not monster_name or not slot:
         raise EventParsingError
-    monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
+    monster = parse_dict_key(
+        monster_name, get_symbol_table().monsters, 'monster')
     try:
         slot = int(slot)
     except ValueError:
@@ -747,7 +770,7 @@ def parse_encounter_checks(gs: GameState,
     if not zone_name or not steps:
         raise EventParsingError
 
-    zone = parse_dict_key(zone_name, ZONES, 'zone')
+    zone = parse_dict_key(zone_name, get_symbol_table().zones, 'zone')
     try:
         distance = int(steps) * 10
     except ValueError:
@@ -962,6 +985,9 @@ USAGE: dict[ParsingFunction, list[str]] = {
     parse_actor_status: [
         'status [character/monster slot]',
     ],
+    parse_turns_forecast: [
+        'turns (amount)',
+    ],
     parse_monster_spawn: [
         'spawn [monster name] [slot] (forced ctb)',
     ],
@@ -0,0 +1,91 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class ProfilerEntry:
+    calls: int = 0
+    seconds: float = 0.0
+    rng_advances: int = 0
+
+    def add(self, seconds: float, rng_advances: int) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.rng_advances += rng_advances
+
+
+class ParserProfiler:
+    """Aggregates the time spent parsing lines and the rng advanced
+    by them, grouped by event class and by parsing function.
+
+    Lines that are not parsed by a parsing function (comments,
+    commands, unknown events) are grouped under "(none)".
+    """
+
+    def __init__(self) -> None:
+        # parsing can happen in worker threads
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.events: dict[str, ProfilerEntry] = {}
+            self.parsing_functions: dict[str, ProfilerEntry] = {}
+
+    def record(self,
+               event_name: str,
+               function_name: str,
+               seconds: float,
+               rng_advances: int,
+               ) -> None:
+        with self._lock:
+            for entries, name in ((self.events, event_name),
+                                  (self.parsing_functions, function_name)):
+                if name not in entries:
+                    entries[name] = ProfilerEntry()
+                entries[name].add(seconds, rng_advances)
+
+    def get_stats(self) -> dict[str, dict[str, ProfilerEntry]]:
+        """Returns copies of the entries grouped by event class
+        and by parsing function.
+        """
+        with self._lock:
+            return {
+                'events': {k: ProfilerEntry(**vars(v))
+                           for k, v in self.events.items()},
+                'parsing functions': {
+                    k: ProfilerEntry(**vars(v))
+                    for k, v in self.parsing_functions.items()},
+            }
+
+    def report(self) -> str:
+        """Returns a table of the entries sorted by total time."""
+        stats = self.get_stats()
+        if not stats['events']:
+            return 'No lines parsed while profiling.'
+        lines = []
+        for group, entries in stats.items():
+            total_seconds = sum(e.seconds for e in entries.values())
+            width = max([len(group), *map(len, entries)])
+            lines.append(
+                f'{group.capitalize():<{width}} | {'Calls':>8} | '
+                f'{'Time (ms)':>10} | {'%':>5} | {'Per call (us)':>13} | '
+                f'{'Rng advances':>12}')
+            for name, entry in sorted(
+                    entries.items(), key=lambda e: e[1].seconds,
+                    reverse=True):
+                if total_seconds:
+                    percentage = entry.seconds / total_seconds * 100
+                else:
+                    percentage = 0
+                per_call = entry.seconds / entry.calls * 1_000_000
+                lines.append(
+                    f'{name:<{width}} | {entry.calls:>8} | '
+                    f'{entry.seconds * 1000:>10.2f} | {percentage:>5.1f} | '
+                    f'{per_call:>13.1f} | {entry.rng_advances:>12}')
+            lines.append('')
+        return '\n'.join(lines).rstrip()
+
+
+# profiler shared by the parsers of the ui when profiling is enabled
+PARSER_PROFILER = ParserProfiler()
@@ -1,13 +1,21 @@
 import math
+from bisect import bisect_left
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache
 
 from ..configs import Configs
 from ..data.actions import YOJIMBO_ACTIONS, YojimboAction
 from ..data.constants import (COMPATIBILITY_MODIFIER, GIL_MOTIVATION_MODIFIER,
-                              OVERDRIVE_MOTIVATION, ZANMATO_RESISTANCES)
+                              OVERDRIVE_MOTIVATION, ZANMATO_RESISTANCES,
+                              GameVersion)
 from ..data.monsters import Monster
 from .main import Event
 
+# number of times the gil offered can be doubled, enough to reach
+# any motivation with the lowest modifier and zanmato resistance
+GIL_DOUBLINGS = 128
+
 
 @dataclass
 class YojimboTurn(Event):
@@ -43,52 +51,15 @@ class YojimboTurn(Event):
         return string
 
     def _free_attack_check(self) -> bool:
-        rng = self._advance_rng(17) & 255
-        compatibility = self.gamestate.compatibility // 4
-        return compatibility > rng
+        return is_attack_free(self.gamestate.compatibility, self._advance_rng)
 
     def _get_free_attack(self) -> tuple[YojimboAction, int]:
-        base_motivation = self.gamestate.compatibility // 4
-        rng = self._advance_rng(17) & 0x3f
-        motivation = base_motivation + rng
-        attacks = [a for a in YOJIMBO_ACTIONS.values()
-                   if a.needed_motivation is not None]
-        attacks.sort(key=lambda a: a.needed_motivation)
-        for a in attacks:
-            if motivation >= a.needed_motivation:
-                attack = a
-
-        if (attack == YOJIMBO_ACTIONS['zanmato']
-                and self.monster.zanmato_level > 0):
-            attack = YOJIMBO_ACTIONS['wakizashi_mt']
-        return attack, motivation
+        return roll_free_attack(
+            self.gamestate.compatibility, self.monster, self._advance_rng)
 
     def _get_gil(self) -> tuple[int, int]:
-        """"""
-        base_motivation = (self.gamestate.compatibility
-                           // COMPATIBILITY_MODIFIER[Configs.game_version])
-        zanmato_resistance = ZANMATO_RESISTANCES[self.monster.zanmato_level]
-        rng_motivation = self._advance_rng(17) & 0x3f
-        # the zanmato level of the monster is only used to check for zanmato
-        # if the desired attack is not zanmato then a second calculation is
-        # made using the lowest zanmato level
-        if (self.action != YOJIMBO_ACTIONS['zanmato']
-                and self.monster.zanmato_level > 0):
-            zanmato_resistance = ZANMATO_RESISTANCES[0]
-            rng_motivation = self._advance_rng(17) & 0x3f
-        fixed_motivation = int(base_motivation * zanmato_resistance)
-        fixed_motivation += rng_motivation
-        if self.overdrive:
-            fixed_motivation += OVERDRIVE_MOTIVATION[Configs.game_version]
-
-        motivation = fixed_motivation
-        gil = 1
-        while motivation < self.action.needed_motivation:
-            gil = gil * 2
-            gil_motivation = self.gil_to_motivation(gil)
-            gil_motivation = int(gil_motivation * zanmato_resistance)
-            motivation = fixed_motivation + gil_motivation
-        return gil, motivation
+        return roll_gil(self.gamestate.compatibility, self.action,
+                        self.monster, self.overdrive, self._advance_rng)
 
     def _update_compatibility(self) -> int:
         modifier = self.action.compatibility_modifier
@@ -96,7 +67,87 @@ class YojimboTurn(Event):
         return self.gamestate.compatibility
 
     @staticmethod
-    def gil_to_motivation(gil: int) -> int:
-        modifier = GIL_MOTIVATION_MODIFIER[Configs.game_version]
+    def gil_to_motivation(gil: int,
+                          game_version: GameVersion | None = None,
+                          ) -> int:
+        if game_version is None:
+            game_version = Configs.game_version
+        modifier = GIL_MOTIVATION_MODIFIER[game_version]
         motivation = int(math.log(gil / modifier, 2)) * modifier
         return max(motivation, 0)
+
+
+@cache
+def get_gil_motivations(game_version: GameVersion,
+                        zanmato_resistance: float,
+                        ) -> tuple[int, ...]:
+    """Returns the motivation given by 2 ** index gil for
+    every index up to GIL_DOUBLINGS, reduced by the zanmato resistance.
+    """
+    motivations = [0]
+    for index in range(1, GIL_DOUBLINGS + 1):
+        motivation = YojimboTurn.gil_to_motivation(2 ** index, game_version)
+        motivations.append(int(motivation * zanmato_resistance))
+    return tuple(motivations)
+
+
+def is_attack_free(compatibility: int,
+                   advance_rng: Callable[[int], int],
+                   ) -> bool:
+    rng = advance_rng(17) & 255
+    return compatibility // 4 > rng
+
+
+def roll_free_attack(compatibility: int,
+                     monster: Monster,
+                     advance_rng: Callable[[int], int],
+                     ) -> tuple[YojimboAction, int]:
+    base_motivation = compatibility // 4
+    rng = advance_rng(17) & 0x3f
+    motivation = base_motivation + rng
+    attacks = [a for a in YOJIMBO_ACTIONS.values()
+               if a.needed_motivation is not None]
+    attacks.sort(key=lambda a: a.needed_motivation)
+    for a in attacks:
+        if motivation >= a.needed_motivation:
+            attack = a
+
+    if (attack == YOJIMBO_ACTIONS['zanmato']
+            and monster.zanmato_level > 0):
+        attack = YOJIMBO_ACTIONS['wakizashi_mt']
+    return attack, motivation
+
+
+def roll_gil(compatibility: int,
+             action: YojimboAction,
+             monster: Monster,
+             overdrive: bool,
+             advance_rng: Callable[[int], int],
+             ) -> tuple[int, int]:
+    """Returns the lowest amount of gil (a power of 2) needed
+    for the action and the resulting motivation.
+    """
+    game_version = Configs.game_version
+    base_motivation = compatibility // COMPATIBILITY_MODIFIER[game_version]
+    zanmato_resistance = ZANMATO_RESISTANCES[monster.zanmato_level]
+    rng_motivation = advance_rng(17) & 0x3f
+    # the zanmato level of the monster is only used to check for zanmato
+    # if the desired attack is not zanmato then a second calculation is
+    # made using the lowest zanmato level
+    if (action != YOJIMBO_ACTIONS['zanmato']
+            and monster.zanmato_level > 0):
+        zanmato_resistance = ZANMATO_RESISTANCES[0]
+        rng_motivation = advance_rng(17) & 0x3f
+    fixed_motivation = int(base_motivation * zanmato_resistance)
+    fixed_motivation += rng_motivation
+    if overdrive:
+        fixed_motivation += OVERDRIVE_MOTIVATION[game_version]
+
+    if fixed_motivation >= action.needed_motivation:
+        return 1, fixed_motivation
+    gil_motivations = get_gil_motivations(game_version, zanmato_resistance)
+    index = bisect_left(gil_motivations,
+                        action.needed_motivation - fixed_motivation, lo=1)
+    # the motivation can't be reached, the most gil is used instead
+    index = min(index, GIL_DOUBLINGS)
+    return 2 ** index, fixed_motivation + gil_motivations[index]
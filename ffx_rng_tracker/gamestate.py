@@ -1,7 +1,12 @@
+from collections.abc import Iterable, Iterator
+from copy import deepcopy
 from itertools import chain
+from typing import Self
 
 from .configs import Configs
-from .data.actions import Action
+from .ctb_scheduler import CTBScheduler
+from .data.actions import (ACTIONS, COMMAND_BIN, ITEM_BIN, MONMAGIC1_BIN,
+                           MONMAGIC2_BIN, Action)
 from .data.actor import Actor, CharacterActor, MonsterActor
 from .data.characters import CHARACTERS_DEFAULTS, calculate_power_base
 from .data.constants import (AEONS_STATS_CONSTANTS, BASE_COMPATIBILITY,
@@ -23,6 +28,7 @@ class GameState:
         self._rng_tracker = rng_tracker
         self.save_rng()
         self._default_party = Character.TIDUS, Character.AURON
+        self.ctb_scheduler = CTBScheduler(self.is_ctb_actor)
         self.characters = self._get_characters()
         self.bonus_aeon_stats = {character: {stat: 0 for stat in Stat}
                                  for character in tuple(Character)[7:]}
@@ -37,7 +43,9 @@ class GameState:
     def _get_characters(self) -> dict[Character, CharacterActor]:
         characters = {}
         for character, defaults in CHARACTERS_DEFAULTS.items():
-            characters[character] = CharacterActor(defaults)
+            actor = CharacterActor(defaults)
+            actor.ctb_listener = self.ctb_scheduler.on_ctb_change
+            characters[character] = actor
         return characters
 
     def _get_magus_sisters(self) -> dict[Character, MagusSister]:
@@ -53,6 +61,26 @@ class GameState:
             )
         return magus_sisters
 
+    def fork(self) -> Self:
+        """Returns a copy of the gamestate that can be advanced
+        without changing this one, their rng trackers share
+        the cached rng values.
+        """
+        memo = {id(self._rng_tracker): self._rng_tracker.fork()}
+        # the data objects are shared instead of copied
+        for obj in self._get_shared_objects():
+            memo[id(obj)] = obj
+        return deepcopy(self, memo)
+
+    def _get_shared_objects(self) -> Iterator[object]:
+        yield from chain(ITEM_BIN, COMMAND_BIN, ACTIONS.values(),
+                         MONMAGIC1_BIN, MONMAGIC2_BIN,
+                         CHARACTERS_DEFAULTS.values())
+        for actor in self.monster_party:
+            yield actor.monster
+            yield actor.monster.forced_action
+            yield from actor.monster.actions.values()
+
     def save_rng(self) -> None:
         self._saved_rng = self._rng_tracker.rng_current_positions.copy()
 
@@ -60,24 +88,55 @@ class GameState:
         self._rng_tracker.rng_current_positions.clear()
         self._rng_tracker.rng_current_positions.extend(self._saved_rng)
 
+    def is_ctb_actor(self, actor: Actor) -> bool:
+        """Returns True if actor is in battle and can have turns."""
+        if (Status.DEATH in actor.statuses
+                or Status.EJECT in actor.statuses
+                or Status.PETRIFY in actor.statuses):
+            return False
+        if isinstance(actor, CharacterActor):
+            return actor.character in self.party
+        return actor in self.monster_party
+
+    def get_ctb_actors(self) -> list[Actor]:
+        """Returns the actors in battle that can have turns."""
+        actors = chain([self.characters[c] for c in self.party],
+                       self.monster_party)
+        return [a for a in actors if self.is_ctb_actor(a)]
+
+    def set_party(self, party: Iterable[Character]) -> None:
+        old_party = [self.characters[c] for c in self.party]
+        self.party.clear()
+        self.party.extend(party)
+        for actor in old_party:
+            if actor.character not in self.party:
+                self.ctb_scheduler.remove(actor)
+        for character in self.party:
+            self.ctb_scheduler.update(self.characters[character])
+
+    def add_monster(self, actor: MonsterActor) -> None:
+        """Adds actor to the monster party in the slot of its index."""
+        actor.ctb_listener = self.ctb_scheduler.on_ctb_change
+        if actor.index < len(self.monster_party):
+            self.ctb_scheduler.remove(self.monster_party[actor.index])
+            self.monster_party[actor.index] = actor
+        else:
+            self.monster_party.append(actor)
+        self.ctb_scheduler.update(actor)
+
     def get_min_ctb(self) -> int:
-        ctbs = set()
-        actors = [self.characters[c] for c in self.party] + self.monster_party
-        for actor in actors:
-            if (Status.DEATH in actor.statuses
-                    or Status.EJECT in actor.statuses
-                    or Status.PETRIFY in actor.statuses):
-                continue
-            ctbs.add(actor.ctb)
-        if not ctbs:
+        actor = self.ctb_scheduler.peek()
+        if actor is None:
             # TODO
             # should this raise an error?
             return 0
-        return min(ctbs)
+        return actor.ctb
 
     def normalize_ctbs(self, min_ctb: int) -> None:
         if min_ctb == 0:
             return
+        # the scheduled keys don't change when the ctbs are lowered
+        self.ctb_scheduler.advance(min_ctb)
         actors = [self.characters[c] for c in self.party] + self.monster_party
         for actor in actors:
             if Status.PETRIFY in actor.statuses:
@@ -105,7 +164,7 @@ class GameState:
         yuna_stats = self.characters[Character.YUNA].stats.copy()
         yuna_stats[Stat.HP] = min(yuna_stats[Stat.HP], 9999)
         yuna_stats[Stat.MP] = min(yuna_stats[Stat.MP], 999)
-        enc_tier = min(max(0, (self.encounters_count - 30) // 30), 19)
+        enc_tier = get_aeons_stats_tier(self.encounters_count)
 
         check = tuple([enc_tier] + [v for v in yuna_stats.values()])
         if self.calculate_aeon_stats_cache == check:
@@ -182,6 +241,7 @@ class GameState:
             actor.buffs.clear()
             actor.last_action = None
         self.monster_party.clear()
+        self.ctb_scheduler.reset(self.get_ctb_actors())
         self.calculate_aeon_stats()
         for magus_sister in self.magus_sisters.values():
             magus_sister.reset()
@@ -222,6 +282,7 @@ class GameState:
         self.live_distance = 0
         for actor in self.characters.values():
             actor.reset()
+        self.ctb_scheduler.reset(self.get_ctb_actors())
         empty_bonus_stats = {stat: 0 for stat in Stat}
         for stats in self.bonus_aeon_stats.values():
             stats.clear()
@@ -257,3 +318,8 @@ class GameState:
     @seed.setter
     def seed(self, seed: int) -> None:
         self._rng_tracker.__init__(seed)
+
+
+def get_aeons_stats_tier(encounters_count: int) -> int:
+    """Returns the tier of the encounters bonus to the aeons' stats."""
+    return min(max(0, (encounters_count - 30) // 30), 19)
@@ -1,26 +1,81 @@
 import logging
 import sys
+from collections import deque
 from functools import wraps
+from heapq import merge
+from itertools import count
 from traceback import format_exception
 from types import TracebackType
 
 from .ui_abstract.output_widget import OutputWidget
 
+LOG_FILE_PATH = 'ffx_rng_tracker_log.log'
+# lowest level of the records written to the log file
+FILE_LOG_LEVEL = logging.INFO
+
 
 class UIHandler(logging.Handler):
-    """Handler to log records into an OutputWidget."""
+    """Handler to log records into an OutputWidget.
+
+    Only the most recent formatted records of every level are kept,
+    so records of a level don't push out the ones of other levels;
+    they are printed to the widget when flush is called.
+    If spill_handler is provided the records that don't fit
+    in the buffer anymore are passed to it.
+    """
 
-    def __init__(self, output_widget: OutputWidget) -> None:
+    def __init__(self,
+                 output_widget: OutputWidget,
+                 capacity: int = 1000,
+                 spill_handler: logging.Handler | None = None,
+                 ) -> None:
         super().__init__()
         self.output_widget = output_widget
-        self.log = ''
+        self.capacity = capacity
+        # sequence number, record and message of every level
+        self.records: dict[
+            int, deque[tuple[int, logging.LogRecord, str]]] = {}
+        self.spill_handler = spill_handler
+        self.shown_level = logging.NOTSET
+        self._counter = count()
+        self._changed = False
 
     def emit(self, record: logging.LogRecord) -> None:
         msg = self.format(record)
         if not msg.endswith('\n'):
             msg += '\n'
-        self.log += msg
-        self.output_widget.print_output(self.log)
+        records = self.records.get(record.levelno)
+        if records is None:
+            records = deque(maxlen=self.capacity)
+            self.records[record.levelno] = records
+        if (self.spill_handler is not None
+                and len(records) == records.maxlen):
+            self.spill_handler.handle(records[0][1])
+        records.append((next(self._counter), record, msg))
+        self._changed = True
+
+    def set_shown_level(self, level: int) -> None:
+        """Only show records with level or higher."""
+        self.shown_level = level
+        self._changed = True
+
+    def flush(self) -> None:
+        """Print the records to the output widget
+        if they changed since the last call.
+        """
+        with self.lock:
+            if not self._changed:
+                return
+            self._changed = False
+            shown_records = [list(r) for level, r in self.records.items()
+                             if level >= self.shown_level]
+        messages = [m for _, _, m in merge(*shown_records)]
+        self.output_widget.print_output(''.join(messages))
+
+    def close(self) -> None:
+        if self.spill_handler is not None:
+            self.spill_handler.close()
+        super().close()
 
 
 def log_exceptions(logger: logging.Logger | None = None):
@@ -41,6 +96,15 @@ def log_exceptions(logger: logging.Logger | None = None):
     return decorator
 
 
+def get_main_formatter() -> logging.Formatter:
+    """Returns the formatter used by the main logger's handlers."""
+    return logging.Formatter(
+        fmt='{asctime} - {name} - {levelname} - {message}',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        style='{',
+        )
+
+
 def setup_main_logger(use_console_handler: bool = True,
                       use_file_handler: bool = True,
                       ) -> None:
@@ -49,11 +113,7 @@ def setup_main_logger(use_console_handler: bool = True,
 
     logger.setLevel(logging.DEBUG)
 
-    formatter = logging.Formatter(
-        fmt='{asctime} - {name} - {levelname} - {message}',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        style='{',
-        )
+    formatter = get_main_formatter()
     if use_console_handler:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
@@ -61,9 +121,9 @@ def setup_main_logger(use_console_handler: bool = True,
         logger.addHandler(console_handler)
 
     if use_file_handler:
-        file_handler = logging.FileHandler('ffx_rng_tracker_log.log')
+        file_handler = logging.FileHandler(LOG_FILE_PATH)
         file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.INFO)
+        file_handler.setLevel(FILE_LOG_LEVEL)
         logger.addHandler(file_handler)
 
 
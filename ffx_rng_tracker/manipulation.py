@@ -0,0 +1,187 @@
+import heapq
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import chain, count
+
+from .data.constants import EncounterCondition
+from .data.equipment import Equipment
+from .data.items import ItemDrop
+from .events.encounter import Encounter
+from .events.kill import Kill
+from .events.main import Event
+from .events.parser import EventParser
+from .events.parsing_functions import USAGE
+from .events.steal import Steal
+from .gamestate import GameState
+from .tracker import FFXRNGTracker
+
+type TargetPredicate = Callable[[list[Event]], bool]
+type StateKey = tuple[object, ...]
+
+
+@dataclass(frozen=True)
+class ManipulationAction:
+    """Notes lines that can be added to the route to advance rng,
+    like an escape, an extra attack or a "roll rng# amount" line
+    for a screen transition.
+    """
+    name: str
+    lines: str
+    cost: int = 1
+
+
+@dataclass
+class ManipulationPlan:
+    actions: list[tuple[ManipulationAction, int]]
+    cost: int
+    # events of the target lines
+    events: list[Event] = field(repr=False)
+
+    def __str__(self) -> str:
+        if not self.actions:
+            return 'No manipulation needed'
+        actions = ', '.join([f'{a.name} x{n}' for a, n in self.actions])
+        return f'{actions} (cost {self.cost})'
+
+    def to_notes(self) -> str:
+        """Returns the lines to add before the target lines."""
+        return '\n'.join([a.lines for a, n in self.actions for _ in range(n)])
+
+
+@dataclass
+class ManipulationSearch:
+    """Best-first search of the cheapest combination of actions
+    that makes the events of the target lines satisfy a predicate.
+
+    The setup lines are parsed once from a reset gamestate, every
+    state is then reached by forking the gamestate of the state
+    it was expanded from and parsing the lines of one more action
+    (the actions are grouped in the order of the menu); the target
+    lines are parsed on a fork of it. States that result in
+    a gamestate that was already reached are skipped.
+    """
+    parser: EventParser
+    menu: list[ManipulationAction]
+    target: str
+    is_target_reached: TargetPredicate
+    setup: str = ''
+    max_cost: int = 30
+    max_states: int = 5000
+
+    def _parse(self, gamestate: GameState, text: str) -> list[Event]:
+        """Parses text advancing gamestate in place of the one
+        of the parser.
+        """
+        parser_gamestate = self.parser.gamestate
+        self.parser.gamestate = gamestate
+        try:
+            return self.parser.parse(text)
+        finally:
+            self.parser.gamestate = parser_gamestate
+
+    def search(self) -> ManipulationPlan | None:
+        """Returns the cheapest plan found or None if there is
+        none within max_cost and max_states.
+        """
+        gamestate = self.parser.gamestate
+        gamestate.reset()
+        self._parse(gamestate, self.setup)
+        start = tuple(0 for _ in self.menu)
+        # the counter breaks ties between states with the same cost
+        tie_breaker = count()
+        # the last index avoids generating the same counts twice,
+        # the action at that index is applied to the gamestate
+        # of the previous state when the state is reached
+        queue = [(0, next(tie_breaker), start, 0, None)]
+        visited_states: set[StateKey] = set()
+        states = 0
+        while queue and states < self.max_states:
+            cost, _, counts, last_index, previous = heapq.heappop(queue)
+            if previous is None:
+                state = gamestate
+            else:
+                state = previous.fork()
+                self._parse(state, self.menu[last_index].lines)
+            state_key = get_state_key(state)
+            if state_key in visited_states:
+                continue
+            visited_states.add(state_key)
+            states += 1
+            events = self._parse(state.fork(), self.target)
+            if self.is_target_reached(events):
+                actions = [(a, n) for a, n in zip(self.menu, counts) if n]
+                return ManipulationPlan(actions, cost, events)
+            for index in range(last_index, len(self.menu)):
+                new_cost = cost + self.menu[index].cost
+                if new_cost > self.max_cost:
+                    continue
+                new_counts = list(counts)
+                new_counts[index] += 1
+                heapq.heappush(queue, (
+                    new_cost, next(tie_breaker), tuple(new_counts), index,
+                    state))
+        return None
+
+
+def get_state_key(gamestate: GameState) -> StateKey:
+    """Returns the parts of gamestate that can be changed
+    by the actions and can change the events of the target lines.
+    """
+    actors = chain(gamestate.characters.values(), gamestate.monster_party)
+    return (
+        tuple(gamestate._rng_tracker.rng_current_positions),
+        tuple(gamestate.party),
+        tuple(str(m.monster) for m in gamestate.monster_party),
+        tuple((a.current_hp, a.current_mp, a.current_od, a.ctb,
+               tuple(a.statuses.items()), tuple(a.buffs.items()))
+              for a in actors),
+        tuple(gamestate.inventory),
+        len(gamestate.equipment_inventory),
+        gamestate.ctb_since_last_action,
+        gamestate.compatibility,
+        gamestate.gil,
+        gamestate.encounters_count,
+        gamestate.random_encounters_count,
+        tuple(gamestate.zone_encounters_counts.items()),
+        gamestate.equipment_drops,
+        gamestate.live_distance,
+    )
+
+
+def make_parser(seed: int) -> EventParser:
+    """Returns a parser for seed with every parsing function."""
+    parser = EventParser(GameState(FFXRNGTracker(seed)))
+    for function, usages in USAGE.items():
+        for usage in usages:
+            parser.parsing_functions[usage.split()[0]] = function
+    parser.build_usage_text()
+    return parser
+
+
+def drops_equipment(is_wanted: Callable[[Equipment], bool] = lambda _: True,
+                    ) -> TargetPredicate:
+    """The target lines drop a wanted equipment."""
+    def predicate(events: list[Event]) -> bool:
+        return any(isinstance(e, Kill) and e.equipment
+                   and is_wanted(e.equipment.equipment)
+                   for e in events)
+    return predicate
+
+
+def steals_item(is_wanted: Callable[[ItemDrop], bool] = lambda _: True,
+                ) -> TargetPredicate:
+    """The target lines steal a wanted item."""
+    def predicate(events: list[Event]) -> bool:
+        return any(isinstance(e, Steal) and e.item and is_wanted(e.item)
+                   for e in events)
+    return predicate
+
+
+def has_encounter_condition(condition: EncounterCondition,
+                            ) -> TargetPredicate:
+    """The encounters of the target lines have condition."""
+    def predicate(events: list[Event]) -> bool:
+        encounters = [e for e in events if isinstance(e, Encounter)]
+        return bool(encounters) and all(
+            e.condition is condition for e in encounters)
+    return predicate
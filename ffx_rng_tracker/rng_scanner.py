@@ -0,0 +1,102 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from itertools import compress, count
+
+from .data.constants import EncounterCondition
+from .data.encounters import condition_from_rng
+from .tracker import FFXRNGTracker
+
+type RNGPredicate = Callable[[int], bool]
+
+
+@dataclass
+class RNGScanner:
+    """Finds the positions of the values of the rng indexes
+    of a tracker that satisfy a predicate.
+
+    Positions are absolute (0 is the first value generated from
+    the seed) and default to the current position of the index,
+    so the first position returned is the one used by the next
+    advance of that index. The values are generated and scanned
+    in chunks of chunk_size, up to max_position.
+    """
+    rng_tracker: FFXRNGTracker
+    chunk_size: int = 4096
+    max_position: int = 1_000_000
+
+    def iter_positions(self,
+                       rng_index: int,
+                       predicate: RNGPredicate,
+                       start: int | None = None,
+                       ) -> Iterator[int]:
+        if start is None:
+            start = self.rng_tracker.rng_current_positions[rng_index]
+        while start < self.max_position:
+            stop = min(start + self.chunk_size, self.max_position)
+            values = self.rng_tracker.get_rng_values(rng_index, start, stop)
+            yield from compress(count(start), map(predicate, values))
+            start = stop
+
+    def find(self,
+             rng_index: int,
+             predicate: RNGPredicate,
+             amount: int = 1,
+             start: int | None = None,
+             ) -> list[int]:
+        """Returns the first amount positions whose values satisfy
+        predicate, less if max_position is reached.
+        """
+        positions = []
+        if amount < 1:
+            return positions
+        for position in self.iter_positions(rng_index, predicate, start):
+            positions.append(position)
+            if len(positions) == amount:
+                break
+        return positions
+
+    def find_next(self,
+                  rng_index: int,
+                  predicate: RNGPredicate,
+                  start: int | None = None,
+                  ) -> int | None:
+        """Returns the first position whose value satisfies predicate."""
+        return next(self.iter_positions(rng_index, predicate, start), None)
+
+    def get_advances_to_next(self,
+                             rng_index: int,
+                             predicate: RNGPredicate,
+                             ) -> int | None:
+        """Returns the number of times the rng index needs to be
+        advanced before its next value satisfies predicate.
+        """
+        position = self.find_next(rng_index, predicate)
+        if position is None:
+            return None
+        return position - self.rng_tracker.rng_current_positions[rng_index]
+
+
+def is_encounter_condition(condition: EncounterCondition,
+                           initiative: bool = False,
+                           ) -> RNGPredicate:
+    """Predicate for rng1 values used to roll the condition
+    of an encounter.
+    """
+    return lambda value: condition_from_rng(value, initiative) is condition
+
+
+def is_below_drop_chance(drop_chance: int) -> RNGPredicate:
+    """Predicate for rng10 values used to roll item drops,
+    equipment drops and steals.
+    """
+    return lambda value: drop_chance > value % 255
+
+
+def is_rare_item(value: int) -> bool:
+    """Predicate for rng11 values used to roll the rarity of items."""
+    return value & 255 < 32
+
+
+def is_yojimbo_attack_free(compatibility: int) -> RNGPredicate:
+    """Predicate for rng17 values used to roll Yojimbo's free attacks."""
+    return lambda value: compatibility // 4 > value & 255
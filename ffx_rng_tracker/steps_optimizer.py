@@ -0,0 +1,216 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .data.encounter_formations import Zone
+from .data.encounters import StepsData, get_steps_notes
+from .data.symbols import get_symbol_table
+from .tracker import FFXRNGTracker
+
+# rng0 position, steps walked since the last encounter
+# and encounters count
+type StepsState = tuple[int, int, int]
+# rng0 advances, encounters and steps walked since the last encounter
+type WalkResult = tuple[int, int, int]
+
+
+@dataclass
+class StepsPlan:
+    steps_datas: list[StepsData]
+    steps: list[int]
+    encounters: int
+
+    @property
+    def deviation(self) -> int:
+        """Total difference from the default steps."""
+        return sum(abs(s - d.default)
+                   for s, d in zip(self.steps, self.steps_datas))
+
+    def __str__(self) -> str:
+        lines = [f'{self.encounters} Encounters, '
+                 f'{self.deviation} steps from the default']
+        for steps_data, steps in zip(self.steps_datas, self.steps):
+            difference = steps - steps_data.default
+            label = steps_data.label or steps_data.zone
+            lines.append(f'{label}: {steps} ({difference:+})')
+        return '\n'.join(lines)
+
+    def to_notes(self) -> str:
+        """Returns the lines used by the steps tracker."""
+        lines = []
+        for steps_data, steps in zip(self.steps_datas, self.steps):
+            cpz = ' cpz' if steps_data.continue_previous_zone else ''
+            lines.append(f'walk {steps_data.zone} {steps}{cpz}')
+        return '\n'.join(lines)
+
+
+class StepsOptimizer:
+    """Searches the steps to walk in every zone of the steps notes,
+    between their min and max, that minimize the number
+    of encounters or get closest to a target number of encounters,
+    ties are broken by the difference from the default steps.
+
+    Walking in a zone is evaluated for every number of steps at once
+    from the rolls of rng0, as the checks of the first steps
+    don't depend on the ones after them. The search is a dynamic
+    programming over the rows of the notes where the states are
+    the rng0 position, the steps walked since the last encounter
+    when the next row continues the previous zone and, with a target,
+    the encounters count; when there are more than max_states states
+    only the best ones are kept, with a target the best ones
+    for every encounters count.
+    """
+
+    def __init__(self,
+                 rng_tracker: FFXRNGTracker,
+                 steps_datas: list[StepsData],
+                 max_states: int = 500,
+                 ) -> None:
+        self.rng_tracker = rng_tracker
+        self.steps_datas = steps_datas
+        self.max_states = max_states
+        self._rolls = bytearray()
+
+    def _get_rolls(self, stop: int) -> bytearray:
+        """Returns the rng0 rolls used by encounter checks,
+        computed up to position stop.
+        """
+        if stop > len(self._rolls):
+            stop = max(stop, len(self._rolls) * 2)
+            values = self.rng_tracker.get_rng_values(
+                0, len(self._rolls), stop)
+            self._rolls.extend([v & 255 for v in values])
+        return self._rolls
+
+    def walk(self,
+             zone: Zone,
+             position: int,
+             live_steps: int,
+             max_steps: int,
+             ) -> list[WalkResult]:
+        """Returns the result of walking every number of steps
+        from 0 to max_steps in zone, starting from the rng0 position
+        and the steps walked since the last encounter.
+        """
+        # every step can roll rng0 once
+        rolls = self._get_rolls(position + max_steps)
+        grace_period = zone.grace_period
+        threat_modifier = zone.threat_modifier
+        advances = encounters = 0
+        last_encounter = 0
+        results = [(0, 0, live_steps)]
+        for walked in range(1, max_steps + 1):
+            # steps counted by the encounter check, after the grace period
+            steps = live_steps + walked - last_encounter - grace_period
+            if steps >= 1:
+                roll = rolls[position + advances]
+                advances += 1
+                if roll < steps * 256 // threat_modifier:
+                    encounters += 1
+                    last_encounter = walked
+                    live_steps = 0
+            # an encounter check without encounters sets the steps
+            # since the last encounter to the steps it walked
+            results.append((advances, encounters, walked - last_encounter))
+        return results
+
+    def search(self,
+               target: int | None = None,
+               start: int | None = None,
+               ) -> StepsPlan | None:
+        """Returns the best plan found, the search starts from
+        the current rng0 position by default.
+        """
+        if start is None:
+            start = self.rng_tracker.rng_current_positions[0]
+        zones = get_symbol_table().zones
+        # encounters, deviation, previous state and steps of every state
+        frontier: dict[StepsState, tuple] = {
+            (start, 0, 0): (0, 0, None, 0)}
+        sort_key = self._get_sort_key(target)
+        history = []
+        for index, steps_data in enumerate(self.steps_datas):
+            zone = zones[steps_data.zone]
+            if index + 1 < len(self.steps_datas):
+                next_cpz = self.steps_datas[index + 1].continue_previous_zone
+            else:
+                next_cpz = False
+            new_frontier: dict[StepsState, tuple] = {}
+            steps_range = range(steps_data.min, steps_data.max + 1)
+            deviations = [abs(s - steps_data.default) for s in steps_range]
+            for key, (encounters, deviation, _, _) in frontier.items():
+                position, live_steps, _ = key
+                if not steps_data.continue_previous_zone:
+                    live_steps = 0
+                results = self.walk(
+                    zone, position, live_steps, steps_data.max)
+                for steps, steps_deviation in zip(steps_range, deviations):
+                    advances, new_encounters, new_live_steps = results[steps]
+                    new_encounters += encounters
+                    if target is None:
+                        new_key = (position + advances,
+                                   new_live_steps if next_cpz else 0,
+                                   0)
+                    elif new_encounters > target:
+                        break
+                    else:
+                        new_key = (position + advances,
+                                   new_live_steps if next_cpz else 0,
+                                   new_encounters)
+                    new_deviation = deviation + steps_deviation
+                    old_value = new_frontier.get(new_key)
+                    if (old_value is None
+                            or (new_encounters, new_deviation)
+                            < (old_value[0], old_value[1])):
+                        new_frontier[new_key] = (
+                            new_encounters, new_deviation, key, steps)
+            if len(new_frontier) > self.max_states:
+                new_frontier = self._prune(new_frontier, target)
+            history.append(new_frontier)
+            frontier = new_frontier
+        if not frontier:
+            return None
+
+        key, (encounters, *_) = min(frontier.items(), key=sort_key)
+        steps_list = []
+        for states in reversed(history):
+            _, _, previous_key, steps = states[key]
+            steps_list.append(steps)
+            key = previous_key
+        steps_list.reverse()
+        return StepsPlan(self.steps_datas, steps_list, encounters)
+
+    def _prune(self,
+               frontier: dict[StepsState, tuple],
+               target: int | None,
+               ) -> dict[StepsState, tuple]:
+        if target is None:
+            best = sorted(frontier.items(), key=lambda item: item[1][:2])
+            return dict(best[:self.max_states])
+        counts: dict[int, list[tuple[StepsState, tuple]]] = {}
+        for item in frontier.items():
+            counts.setdefault(item[1][0], []).append(item)
+        amount = max(1, self.max_states // len(counts))
+        pruned = {}
+        for items in counts.values():
+            items.sort(key=lambda item: item[1][1])
+            pruned.update(items[:amount])
+        return pruned
+
+    def _get_sort_key(self,
+                      target: int | None,
+                      ) -> Callable[[tuple[StepsState, tuple]], tuple]:
+        """Returns the key used to sort the states from the best,
+        encounters are never higher than the target.
+        """
+        if target is None:
+            return lambda item: item[1][:2]
+        return lambda item: (target - item[1][0], item[1][1])
+
+
+def optimize_steps_notes(rng_tracker: FFXRNGTracker,
+                         target: int | None = None,
+                         notes_file: str = 'steps_notes.csv',
+                         ) -> StepsPlan | None:
+    """Optimizes the steps notes of the seed of the rng tracker."""
+    steps_datas = get_steps_notes(notes_file, rng_tracker.seed)
+    return StepsOptimizer(rng_tracker, steps_datas).search(target)
@@ -1,4 +1,8 @@
+from array import array
 from collections.abc import Iterator
+from copy import copy
+from itertools import islice
+from typing import Self
 
 from .data.constants import RNG_CONSTANTS_1, RNG_CONSTANTS_2
 
@@ -83,7 +87,93 @@ class FFXRNGTracker:
             array.append(rng_value)
         return rng_value
 
+    def get_rng_values(self, index: int, start: int, stop: int) -> list[int]:
+        """Returns the values of the given rng index from position
+        start to position stop (excluded) without advancing it.
+        """
+        array = self._rng_arrays[index]
+        if stop > len(array):
+            array.extend(
+                islice(self._rng_generators[index], stop - len(array)))
+        return array[start:stop]
+
+    def fork(self) -> Self:
+        """Returns a tracker with the same seed and positions,
+        the rng values cached by either one are shared.
+        """
+        fork = copy(self)
+        fork.rng_current_positions = self.rng_current_positions.copy()
+        return fork
+
     def reset(self) -> None:
         """Reset the position of the rng arrays."""
         self.rng_current_positions.clear()
         self.rng_current_positions.extend(0 for _ in range(68))
+
+
+class RNGLedger:
+    """Records the positions of the rng indexes of a tracker
+    after every parsed line, used to find which lines advanced
+    a given rng index and by how much.
+
+    The positions are stored in a preallocated array that doubles
+    in size when full; advances are the difference between the
+    positions before and after a line, so they can be negative
+    when a line restores previously saved positions.
+    """
+    _RNG_INDEXES = 68
+
+    def __init__(self,
+                 rng_tracker: FFXRNGTracker,
+                 capacity: int = 1024,
+                 ) -> None:
+        self.rng_tracker = rng_tracker
+        self._capacity = max(1, capacity)
+        self._positions = array('q', bytes(
+            8 * self._RNG_INDEXES * (self._capacity + 1)))
+        self.lines: list[str] = []
+
+    def start(self) -> None:
+        """Removes the recorded lines and stores the current positions
+        as the starting point.
+        """
+        self.lines.clear()
+        self._positions[0:self._RNG_INDEXES] = array(
+            'q', self.rng_tracker.rng_current_positions)
+
+    def record(self, line: str) -> None:
+        """Stores the current positions as the ones after line."""
+        if len(self.lines) == self._capacity:
+            self._positions.extend(array('q', bytes(
+                8 * self._RNG_INDEXES * self._capacity)))
+            self._capacity *= 2
+        self.lines.append(line)
+        start = len(self.lines) * self._RNG_INDEXES
+        self._positions[start:start + self._RNG_INDEXES] = array(
+            'q', self.rng_tracker.rng_current_positions)
+
+    def get_advances(self, line_index: int) -> list[int]:
+        """Returns the advances of every rng index for a line."""
+        if not 0 <= line_index < len(self.lines):
+            raise IndexError(f'No line recorded at index {line_index}')
+        start = line_index * self._RNG_INDEXES
+        end = start + self._RNG_INDEXES
+        before = self._positions[start:end]
+        after = self._positions[end:end + self._RNG_INDEXES]
+        return [a - b for a, b in zip(after, before)]
+
+    def get_lines_using(self, rng_index: int) -> list[tuple[int, str, int]]:
+        """Returns the index, the text and the advances of every line
+        that changed the position of rng_index.
+        """
+        if not 0 <= rng_index < self._RNG_INDEXES:
+            raise IndexError(f'Rng index out of range: {rng_index}')
+        lines = []
+        position = self._positions[rng_index]
+        for line_index, line in enumerate(self.lines, 1):
+            new_position = self._positions[
+                line_index * self._RNG_INDEXES + rng_index]
+            if new_position != position:
+                lines.append((line_index - 1, line, new_position - position))
+            position = new_position
+        return lines
@@ -5,7 +5,8 @@ from ..events.parsing_functions import (
     parse_encounter_count_change, parse_end_encounter, parse_equipment_change,
     parse_heal, parse_magus_sister_action, parse_monster_action,
     parse_monster_elemental_affinities_change, parse_monster_spawn,
-    parse_party_change, parse_roll, parse_stat_update, parse_summon)
+    parse_party_change, parse_roll, parse_stat_update, parse_summon,
+    parse_turns_forecast)
 from ..utils import stringify
 from .base_tracker import TrackerUI
 
@@ -44,6 +45,7 @@ class ActionsTracker(TrackerUI):
             parse_monster_elemental_affinities_change,
             parse_monster_spawn,
             parse_stat_update,
+            parse_turns_forecast,
         ]
         return parsing_functions
 
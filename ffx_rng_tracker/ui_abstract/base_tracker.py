@@ -2,14 +2,17 @@ import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import partial
+from logging import getLogger
 
 from ..configs import REGEX_NEVER_MATCH, UITagConfigs, UIWidgetConfigs
 from ..data.constants import UIWidget
-from ..data.notes import get_notes, save_notes
+from ..data.notes import NOTES_REPOSITORY, get_notes, save_notes
 from ..events.parser import EventParser
 from ..events.parsing_functions import USAGE, ParsingFunction, parse_roll
 from .input_widget import InputWidget
 from .output_widget import ConfirmPopup, OutputWidget, WarningPopup
+from .task_runner import IsCancelled, SynchronousTaskRunner, TaskRunner
 
 
 @dataclass
@@ -21,6 +24,8 @@ class TrackerUI(ABC):
     search_bar: InputWidget
     warning_popup: WarningPopup
     confirmation_popup: ConfirmPopup
+    task_runner: TaskRunner = field(
+        default_factory=SynchronousTaskRunner, repr=False)
     name: UIWidget = field(init=False, repr=False)
     notes_file: str = field(init=False, repr=False)
 
@@ -37,7 +42,7 @@ class TrackerUI(ABC):
         self.parser.macros.update((k, self.edit_input(v))
                                   for k, v in self.configs.macros.items())
 
-        self.input_widget.set_input(self.get_default_input_data())
+        self.load_default_input_data()
         self.input_widget.register_callback(self.callback)
 
         for name in self.configs.tag_names:
@@ -57,15 +62,43 @@ class TrackerUI(ABC):
         """Returns the default input data."""
         return get_notes(self.notes_file, self.parser.gamestate.seed)
 
+    def load_default_input_data(self) -> None:
+        self.default_input_data = self.get_default_input_data()
+        self.input_widget.set_input(self.default_input_data)
+
     @abstractmethod
     def get_parsing_functions(self) -> list[ParsingFunction]:
         """Returns a list of parsing functions."""
 
     def change_seed(self, seed: int, reload_notes: bool) -> None:
+        # the gamestate can't be changed while a task is using it
+        self.task_runner.cancel()
         self.parser.gamestate.seed = seed
         self.previous_edited_input = ''
         if reload_notes:
-            self.input_widget.set_input(self.get_default_input_data())
+            self.load_default_input_data()
+        self.callback()
+
+    def on_notes_changed(self, file_path: str) -> None:
+        """Reloads the notes if file_path is one of the notes files
+        of the current seed and the input was not edited.
+        """
+        category_dir = NOTES_REPOSITORY.get_category_directory()
+        seed = self.parser.gamestate.seed
+        if file_path not in (f'{category_dir}/{self.notes_file}',
+                             f'{category_dir}/{seed}_{self.notes_file}'):
+            return
+        default_input_data = self.get_default_input_data()
+        if default_input_data == self.default_input_data:
+            return
+        input_data = self.input_widget.get_input()
+        if input_data.rstrip('\n') != self.default_input_data.rstrip('\n'):
+            getLogger(__name__).warning(
+                f'Notes file "{file_path}" changed but was not reloaded '
+                f'in the {self.name} tab because its input was edited.')
+            return
+        self.default_input_data = default_input_data
+        self.input_widget.set_input(default_input_data)
         self.callback()
 
     @abstractmethod
@@ -122,22 +155,33 @@ class TrackerUI(ABC):
     def callback(self) -> None:
         """Method called as a ui callback to parse the input
         and print it to screen.
-        If the input has not changed since the last time this method
-        was called it does nothing.
-        If the output has not changed since the last time this method
-        was called it will not be sent to the output widget.
+        The parsing is done by the task runner, only the output
+        of the most recent input will be sent to the output widget.
         """
         edited_input = self.edit_input(self.input_widget.get_input())
+        self.task_runner.submit(
+            partial(self.get_output, edited_input),
+            self.output_widget.print_output,
+            )
+
+    def get_output(self,
+                   edited_input: str,
+                   is_cancelled: IsCancelled | None = None,
+                   ) -> str:
+        """Parse the edited input and return the edited output.
+        If the input has not changed since the last time this method
+        was called the previous output is returned.
+        """
         if self.previous_edited_input == edited_input:
-            edited_output = self.previous_edited_output
-        else:
-            self.previous_edited_input = edited_input
-            self.parser.gamestate.reset()
-            output = self.parser.parse_to_string(edited_input)
-            padding = '\nCommand: /nopadding\n' not in f'\n{output}\n'
-            edited_output = self.edit_output(output, padding)
-            self.previous_edited_output = edited_output
-        self.output_widget.print_output(edited_output)
+            return self.previous_edited_output
+        self.parser.gamestate.reset()
+        output = self.parser.parse_to_string(edited_input, is_cancelled)
+        padding = '\nCommand: /nopadding\n' not in f'\n{output}\n'
+        edited_output = self.edit_output(output, padding)
+        # only update the cache if the parsing was not cancelled
+        self.previous_edited_input = edited_input
+        self.previous_edited_output = edited_output
+        return edited_output
 
     def search_callback(self) -> None:
         search = self.search_bar.get_input()
@@ -0,0 +1,165 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from ..configs import Configs
+from ..data.constants import GameVersion, UIWidget
+from ..data.items import ItemDrop
+from ..data.monsters import get_monsters_dict
+from ..drop_tables import DropOutcomeTables
+from ..events.parsing_functions import ParsingFunction
+from .base_tracker import TrackerUI
+from .task_runner import IsCancelled
+
+# options of the input and their default values
+DROPS_TABLE_OPTIONS = {
+    'monster': '',
+    'rows': '50',
+    'rng10': '0',
+    'rng11': '0',
+    'bribe rng': '0',
+    'monster slot': '1',
+}
+
+
+@dataclass
+class DropsTable(TrackerUI):
+    """Widget used to show the item drops, steals and bribes
+    of a monster for a range of rng positions.
+
+    The input is made of "option: value" lines, the table is
+    looked up in precomputed outcome tables instead of being parsed.
+    The input is a short query rather than notes about a run,
+    so it has no notes file and is never loaded from or saved to one.
+    """
+    name = UIWidget.DROPS_TABLE
+    # number of monsters whose tables are kept in memory
+    max_tables: int = field(default=32, repr=False)
+    _tables: dict[tuple[int, GameVersion, str], DropOutcomeTables] = field(
+        default_factory=dict, init=False, repr=False)
+
+    def get_default_input_data(self) -> str:
+        """Returns an empty input, the table has no notes file."""
+        return ''
+
+    def on_notes_changed(self, file_path: str) -> None:
+        return
+
+    def get_parsing_functions(self) -> list[ParsingFunction]:
+        return []
+
+    def edit_input(self, input_text: str) -> str:
+        return input_text
+
+    def get_tables(self, monster_name: str, horizon: int) -> DropOutcomeTables:
+        """Returns the outcome tables of the monster for the current
+        seed, they are computed again if horizon is higher than theirs.
+        """
+        key = self.parser.gamestate.seed, Configs.game_version, monster_name
+        tables = self._tables.get(key)
+        if tables is None or tables.horizon < horizon:
+            if tables is not None:
+                horizon = max(horizon, tables.horizon * 2)
+            elif len(self._tables) >= self.max_tables:
+                self._tables.clear()
+            tables = DropOutcomeTables(
+                self.parser.gamestate._rng_tracker,
+                get_monsters_dict()[monster_name],
+                horizon,
+                )
+            self._tables[key] = tables
+        return tables
+
+    def get_output(self,
+                   edited_input: str,
+                   is_cancelled: IsCancelled | None = None,
+                   ) -> str:
+        if self.previous_edited_input == edited_input:
+            return self.previous_edited_output
+        options = dict(DROPS_TABLE_OPTIONS)
+        for line in edited_input.splitlines():
+            option, _, value = line.partition(':')
+            if option.strip() in options:
+                options[option.strip()] = value.strip()
+        monster_name = options.pop('monster')
+        if not monster_name:
+            output = ''
+        elif monster_name not in get_monsters_dict():
+            output = f'Error: No monster named "{monster_name}"'
+        else:
+            try:
+                rows, *positions = [int(v) for v in options.values()]
+            except ValueError:
+                output = 'Error: rows and positions need to be integers'
+            else:
+                output = self.get_table(monster_name, rows, *positions)
+        edited_output = self.edit_output(output)
+        self.previous_edited_input = edited_input
+        self.previous_edited_output = edited_output
+        return edited_output
+
+    def get_table(self,
+                  monster_name: str,
+                  rows: int,
+                  drop_position: int,
+                  rarity_position: int,
+                  bribe_position: int,
+                  monster_slot: int,
+                  ) -> str:
+        """Returns a table of the outcomes with every row
+        advancing the position of every rng index by 1.
+        """
+        rows = max(0, rows)
+        positions = drop_position, rarity_position, bribe_position
+        if min(positions) < 0:
+            return 'Error: positions need to be greater or equal to 0'
+        monster_index = min(max(0, monster_slot - 1), 7)
+        tables = self.get_tables(monster_name, max(positions) + rows)
+        monster = tables.monster
+        lines = [
+            f'Monster: {monster}',
+            f'Item 1: {monster.item_1.drop_chance}/255 | '
+            f'{_get_items_string(monster.item_1.items.values())}',
+            f'Item 2: {monster.item_2.drop_chance}/255 | '
+            f'{_get_items_string(monster.item_2.items.values())}',
+            f'Steal: {monster.steal.base_chance}/255 | '
+            f'{_get_items_string(monster.steal.items.values())}',
+            f'Bribe: {monster.bribe.item or '-'}',
+            '',
+        ]
+        columns = ('Roll', 'Item 1', 'Item 2', 'Steal', '2nd Steal',
+                   'Rarity', f'Bribe gil (Mon{monster_index + 1})')
+        table = []
+        for row in range(rows):
+            drop = drop_position + row
+            table.append((
+                str(row),
+                'Drop' if tables.item_1_drops[drop] else '-',
+                'Drop' if tables.item_2_drops[drop] else '-',
+                'Success' if tables.is_steal_successful(drop) else '-',
+                'Success' if tables.is_steal_successful(drop, 1) else '-',
+                'Rare' if tables.rare[rarity_position + row] else 'Common',
+                str(tables.get_bribe_gil(
+                    bribe_position + row, monster_index) or '-'),
+            ))
+        widths = [max(len(c) for c in cells) for cells in zip(columns, *table)]
+        header = f'| {' | '.join(
+            [f'{c:{w}}' for c, w in zip(columns, widths)])} |'
+        spacer = '-' * len(header)
+        lines.extend([spacer, header, spacer])
+        for cells in table:
+            lines.append(f'| {' | '.join(
+                [f'{c:>{w}}' for c, w in zip(cells, widths)])} |')
+        lines.append(spacer)
+        return '\n'.join(lines)
+
+    def edit_output(self, output: str, padding: bool = False) -> str:
+        return output
+
+    def save_input_data(self) -> None:
+        """Does nothing, the table has no notes file to save to."""
+        return
+
+
+def _get_items_string(items: Iterable[ItemDrop | None]) -> str:
+    names = dict.fromkeys([str(i) for i in items if i is not None])
+    return ', '.join(names) or '-'
@@ -1,13 +1,18 @@
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from ..configs import REGEX_NEVER_MATCH, UITagConfigs, UIWidgetConfigs
 from ..data.constants import UIWidget
-from ..data.monsters import get_monsters_dict
+from ..data.monsters import Monster, get_monsters_dict
 from ..ui_functions import format_monster_data
 from .input_widget import InputWidget
 from .output_widget import OutputWidget
 
+# longest substrings of the pages' words in the search index
+SEARCH_NGRAM_SIZE = 3
+
 
 @dataclass
 class MonsterDataViewer:
@@ -17,17 +22,25 @@ class MonsterDataViewer:
     monster_selection_widget: InputWidget
     output_widget: OutputWidget
     search_bar: InputWidget
-    monster_data: dict[str, str] = field(init=False, repr=False)
+    monsters: dict[str, Monster] = field(init=False, repr=False)
+    # number of formatted pages kept in memory
+    cache_size: int = field(default=64, repr=False)
+    get_monster_data: Callable[[str], str] = field(init=False, repr=False)
     name: UIWidget = field(default=UIWidget.MONSTER_DATA, init=False, repr=False)
+    _search_index: dict[str, set[str]] | None = field(
+        default=None, init=False, repr=False)
+    _search_pages: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        monsters = get_monsters_dict()
-        self.monster_data = {k: format_monster_data(v)
-                             for k, v in monsters.items()}
+        self.monsters = get_monsters_dict()
+        # the pages are formatted when they are first shown or searched
+        self.get_monster_data = lru_cache(maxsize=self.cache_size)(
+            self._format_monster_data)
         for name in self.configs.tag_names:
             self.output_widget.register_tag(name)
         # set input expects the selection as the first item
-        monsters = '|'.join([''] + sorted(self.monster_data))
+        monsters = '|'.join([''] + sorted(self.monsters))
         self.monster_selection_widget.set_input(monsters)
         self.monster_selection_widget.register_callback(self.callback)
         self.output_widget.register_tag(
@@ -42,18 +55,67 @@ class MonsterDataViewer:
 
     def callback(self) -> None:
         monster_name = self.monster_selection_widget.get_input()
-        monster_data = self.monster_data.get(monster_name, '')
+        monster_data = self.get_monster_data(monster_name)
         self.output_widget.print_output(monster_data)
         self.output_widget.seek(self.search_bar.get_input())
 
+    def _format_monster_data(self, monster_name: str) -> str:
+        monster = self.monsters.get(monster_name)
+        if monster is None:
+            return ''
+        return format_monster_data(monster)
+
+    def _get_search_index(self) -> dict[str, set[str]]:
+        """Returns a dictionary of the lowercase substrings of up
+        to SEARCH_NGRAM_SIZE characters of the words of every
+        monster's name and page to the names of those monsters.
+        """
+        if self._search_index is None:
+            self._search_index = {}
+            for monster_name in self.monsters:
+                page = self._format_monster_data(monster_name).lower()
+                text = f'{monster_name.lower()}\n{page}'
+                self._search_pages[monster_name] = text
+                ngrams = set()
+                for word in set(text.split()):
+                    for size in range(1, SEARCH_NGRAM_SIZE + 1):
+                        ngrams.update([word[i:i + size]
+                                       for i in range(len(word) - size + 1)])
+                for ngram in ngrams:
+                    names = self._search_index.setdefault(ngram, set())
+                    names.add(monster_name)
+        return self._search_index
+
+    def get_matching_monsters(self, filter: str) -> set[str]:
+        """Returns the names of the monsters with filter
+        in their name or page, case insensitive.
+        """
+        filter = filter.lower()
+        if not filter:
+            return set(self.monsters)
+        # the pages with filter contain every ngram of its words
+        # so the candidates are the intersection of their lookups
+        search_index = self._get_search_index()
+        size = SEARCH_NGRAM_SIZE
+        candidates = set(self.monsters)
+        for filter_word in set(filter.split()):
+            ngrams = {filter_word[i:i + size]
+                      for i in range(max(1, len(filter_word) - size + 1))}
+            for ngram in ngrams:
+                candidates &= search_index.get(ngram, set())
+                if not candidates:
+                    return candidates
+        # a filter that is a single ngram is matched exactly,
+        # otherwise the candidates are checked on the whole page
+        if filter.split() == [filter] and len(filter) <= size:
+            return candidates
+        return {name for name in candidates
+                if filter in self._search_pages[name]}
+
     def filter_monsters(self) -> None:
         old_selection = self.monster_selection_widget.get_input()
-        filter = self.search_bar.get_input().lower()
-        monsters_names = [name
-                          for name, data in self.monster_data.items()
-                          if filter in name or filter in data.lower()
-                          ]
-        monsters_names.sort()
+        filter = self.search_bar.get_input()
+        monsters_names = sorted(self.get_matching_monsters(filter))
         monsters_names.insert(0, old_selection)
         self.monster_selection_widget.set_input('|'.join(monsters_names))
 
@@ -15,6 +15,8 @@ class SeedFinder(ActionsTracker):
     notes_file = 'seedfinder_notes.txt'
 
     def find_seed(self) -> int | None:
+        # the gamestate can't be shared with a running task
+        self.task_runner.cancel()
         # first 2 lines are always input dvs and "///"
         input_dvs, _, *input_lines = self.input_widget.get_input().splitlines()
         input_text = '\n'.join(input_lines)
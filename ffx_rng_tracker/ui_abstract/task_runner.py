@@ -0,0 +1,34 @@
+from collections.abc import Callable
+from typing import Protocol
+
+type IsCancelled = Callable[[], bool]
+type Task[T] = Callable[[IsCancelled], T]
+
+
+class TaskRunner(Protocol):
+    """Protocol class for objects used to run the parsing tasks
+    of the trackers.
+    """
+
+    def submit[T](self, task: Task[T], callback: Callable[[T], None]) -> None:
+        """Run task and call callback with its result.
+
+        Task is called with a function that returns True when
+        the task has been superseded by a newer one, in that case
+        the task can stop early and its callback will not be called.
+        """
+
+    def cancel(self) -> None:
+        """Cancel all the pending tasks and wait for the running one
+        to stop.
+        """
+
+
+class SynchronousTaskRunner:
+    """Runs the tasks as soon as they are submitted."""
+
+    def submit[T](self, task: Task[T], callback: Callable[[T], None]) -> None:
+        callback(task(lambda: False))
+
+    def cancel(self) -> None:
+        return
@@ -1,7 +1,8 @@
 from itertools import batched, chain
 
-from .data.actor import CharacterActor, MonsterActor
-from .data.constants import Character, EquipmentType, KillType, Stat
+from .ctb_scheduler import get_ctb_key
+from .data.actor import Actor, CharacterActor, MonsterActor
+from .data.constants import Character, EquipmentType, KillType
 from .data.monsters import Monster
 from .tracker import FFXRNGTracker
 
@@ -241,22 +242,14 @@ def format_monster_data(monster: Monster) -> str:
     return '\n'.join(data)
 
 
+def format_ctb(actor: Actor, ctb: int) -> str:
+    if isinstance(actor, CharacterActor):
+        return f'{actor.character[:2]:2}[{ctb}]'
+    return f'M{actor.index + 1}[{ctb}]'
+
+
 def ctb_sorter(characters: list[CharacterActor],
                monsters: list[MonsterActor],
                ) -> str:
-    ctbs: list[tuple[str, str]] = []
-
-    for c in characters:
-        sort_key = f'{c.ctb:03}0{256 - c.stats[Stat.AGILITY]:03}{c.index:02}'
-        string = f'{c.character[:2]:2}[{c.ctb}]'
-        ctbs.append((sort_key, string))
-
-    for m in monsters:
-        sort_key = f'{m.ctb:03}1{m.index:02}{256 - m.stats[Stat.AGILITY]:03}'
-        string = f'M{m.index + 1}[{m.ctb}]'
-        ctbs.append((sort_key, string))
-
-    # sorting by icv, then by party, then by agility and index (for characters)
-    # or index and agility (for monsters)
-    ctbs.sort(key=lambda v: v[0])
-    return ' '.join([v[1] for v in ctbs])
+    actors = sorted([*characters, *monsters], key=get_ctb_key)
+    return ' '.join([format_ctb(a, a.ctb) for a in actors])
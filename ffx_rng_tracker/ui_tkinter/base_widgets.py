@@ -1,11 +1,51 @@
 import re
 import tkinter as tk
-from collections.abc import Callable
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
 from tkinter import messagebox, ttk
 
 from .tkinter_utils import create_command_proxy
 
 
+class Highlighter:
+    """Applies tags to the matches of patterns in a text
+    shown in a Text widget.
+
+    The text has to start at the beginning of the line first_line,
+    the offsets of the matches are converted to Tk indexes
+    using a table of the offsets where each line starts.
+    """
+
+    def __init__(self,
+                 widget: tk.Text,
+                 text: str,
+                 first_line: int = 1,
+                 ) -> None:
+        self.widget = widget
+        self.text = text
+        self.first_line = first_line
+        self._line_starts = [0]
+        self._line_starts.extend(m.end() for m in re.finditer('\n', text))
+
+    def index(self, offset: int) -> str:
+        """Returns the Tk index of the character at offset."""
+        line = bisect_right(self._line_starts, offset) - 1
+        return f'{line + self.first_line}.{offset - self._line_starts[line]}'
+
+    def highlight(self, tag_name: str, pattern: re.Pattern) -> None:
+        """Apply the tag named tag_name to all occurrences
+        of the pattern with a single tag_add call.
+        """
+        index = self.index
+        indexes: list[str] = []
+        for m in pattern.finditer(self.text):
+            start, end = m.span()
+            indexes.append(index(start))
+            indexes.append(index(end))
+        if indexes:
+            self.widget.tag_add(tag_name, *indexes)
+
+
 class ScrollableText(ttk.Frame):
     """Frame widget with a Text and a vertical Scrollbar
     and an optional horizontal Scrollbar.
@@ -55,51 +95,57 @@ class ScrollableText(ttk.Frame):
                           tag_name: str,
                           pattern: re.Pattern,
                           text: str | None = None,
+                          first_line: int = 1,
                           ) -> None:
         """Apply the tag named tag_name to all occurrences
         of the pattern.
 
         Tk implementation: accepts a text parameter, if text is
         not provided self.text.get() will be called.
+        If text is only part of the content it has to start at
+        the beginning of the line first_line.
+        """
+        self.highlight_patterns([(tag_name, pattern)], text, first_line)
+
+    def highlight_patterns(self,
+                           patterns: Iterable[tuple[str, re.Pattern]],
+                           text: str | None = None,
+                           first_line: int = 1,
+                           ) -> None:
+        """Apply each tag to all occurrences of its pattern,
+        in order, sharing the same index table between them.
         """
         if text is None:
             text = self.text.get('1.0', 'end')
-        indexes: list[int] = []
-        for m in pattern.finditer(text):
-            indexes.extend(m.span())
-        if not indexes:
-            return
-        post = text
-        line = 1
-        char = 0
-        last_index = 0
-        str_indexes: list[str] = []
-        for index in indexes:
-            pre, post = post[:index - last_index], post[index - last_index:]
-            last_index = index
-            new_lines = pre.count('\n')
-            if new_lines > 0:
-                line += new_lines
-                char = len(pre.rsplit('\n', 2)[-1])
-            else:
-                char += len(pre)
-            str_indexes.append(f'{line}.{char}')
-        self.text.tag_add(tag_name, *str_indexes)
+            first_line = 1
+        highlighter = Highlighter(self.text, text, first_line)
+        for tag_name, pattern in patterns:
+            highlighter.highlight(tag_name, pattern)
+
+    def is_last_line_visible(self) -> bool:
+        """Returns True if the last line of the text is visible
+        and the text has at least 2 lines.
+        """
+        last_line, last_char = self.text.index('end-1c').split('.')
+        number_of_lines = int(last_line)
+        # a trailing empty line is not counted
+        if last_char == '0' and number_of_lines > 1:
+            number_of_lines -= 1
+        visible_line = self.text.index(f'@0,{self.winfo_height()}')
+        line_index = int(visible_line.split('.')[0])
+        return line_index == number_of_lines and line_index > 1
 
     def set(self, text: str) -> None:
         """Replaces the previous text and scrolls back to
         the previous position.
         """
-        current_text = self.text.get('1.0', 'end')[:-1]
-        current_number_of_lines = len(current_text.splitlines())
-        last_line = self.text.index(f'@0,{self.winfo_height()}')
-        line_index = int(last_line.split('.')[0])
+        scroll_to_end = self.is_last_line_visible()
 
         self.text.replace(1.0, 'end', text)
 
         # scroll down if the last line of the text was visible
         # but only if there was at least 1 line
-        if line_index == current_number_of_lines and line_index > 1:
+        if scroll_to_end:
             self.text.yview_pickplace('end')
 
     def seek(self, text: str) -> None:
@@ -1,14 +1,19 @@
 import logging
 import re
+import tkinter as tk
 from dataclasses import is_dataclass
 from tkinter import ttk
 from typing import Any, Iterable
 
 from ..configs import Configs, UIWidgetConfigs
 from ..data.constants import UIWidget
-from ..logger import UIHandler
+from ..events.profiler import PARSER_PROFILER
+from ..logger import (FILE_LOG_LEVEL, LOG_FILE_PATH, UIHandler,
+                      get_main_formatter)
 from .output_widget import TkOutputWidget
 
+LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
 
 def add_dict_to_treeview(treeview: ttk.Treeview,
                          k_v_pairs: Iterable[tuple[str | int, Any]],
@@ -56,6 +61,8 @@ def add_dict_to_treeview(treeview: ttk.Treeview,
 class TkConfigsLogViewer(ttk.Frame):
     """Widget that shows the loaded configuration and the log."""
     name = UIWidget.CONFIGS
+    # milliseconds between updates of the log
+    flush_interval = 200
 
     def __init__(self,
                  parent,
@@ -66,7 +73,24 @@ class TkConfigsLogViewer(ttk.Frame):
         super().__init__(parent, *args, **kwargs)
 
         ttk.Label(self, text='Configs').grid(row=0, column=0)
-        ttk.Label(self, text='Log').grid(row=0, column=1)
+        log_header = ttk.Frame(self)
+        log_header.grid(row=0, column=1)
+        ttk.Label(log_header, text='Log').pack(side='left')
+        self.shown_level = tk.StringVar(self, value='INFO')
+        ttk.Combobox(
+            log_header, values=LOG_LEVELS, state='readonly', width=10,
+            textvariable=self.shown_level,
+            ).pack(side='left')
+        self.shown_level.trace_add('write', self.on_shown_level_changed)
+        if Configs.profile_parsing:
+            ttk.Button(
+                log_header, text='Log parsing profile',
+                command=self.log_parsing_profile,
+                ).pack(side='left')
+            ttk.Button(
+                log_header, text='Reset parsing profile',
+                command=PARSER_PROFILER.reset,
+                ).pack(side='left')
         self.rowconfigure(1, weight=1)
         self.columnconfigure(0, weight=1)
         self.columnconfigure(1, weight=1)
@@ -82,12 +106,36 @@ class TkConfigsLogViewer(ttk.Frame):
             self.logger.register_tag(name)
         self.logger.grid(row=1, column=1, sticky='nsew')
 
-        self.handler = UIHandler(self.logger)
+        if Configs.spill_log_to_file:
+            spill_handler = logging.FileHandler(LOG_FILE_PATH)
+            spill_handler.setFormatter(get_main_formatter())
+            # records with higher levels are already in the log file
+            spill_handler.addFilter(
+                lambda record: record.levelno < FILE_LOG_LEVEL)
+        else:
+            spill_handler = None
+        self.handler = UIHandler(
+            self.logger, Configs.log_lines, spill_handler)
         formatter = logging.Formatter(
             fmt='{asctime} - {levelname} - {message}',
             datefmt='%H:%M:%S',
             style='{',
             )
         self.handler.setFormatter(formatter)
-        self.handler.setLevel(logging.INFO)
+        self.handler.setLevel(logging.DEBUG)
+        self.handler.set_shown_level(logging.INFO)
         logging.getLogger(__name__.split('.')[0]).addHandler(self.handler)
+        self.flush_log()
+
+    def flush_log(self) -> None:
+        """Print the new log records, called periodically."""
+        self.handler.flush()
+        self.after(self.flush_interval, self.flush_log)
+
+    def log_parsing_profile(self) -> None:
+        logging.getLogger(__name__).info(
+            f'Parsing profile:\n{PARSER_PROFILER.report()}')
+
+    def on_shown_level_changed(self, *_) -> None:
+        level = logging.getLevelNamesMapping()[self.shown_level.get()]
+        self.handler.set_shown_level(level)
@@ -0,0 +1,84 @@
+from collections.abc import Callable
+from tkinter import ttk
+from typing import Literal
+
+from ..configs import UIWidgetConfigs
+from ..data.monsters import get_monsters_dict
+from ..events.parser import EventParser
+from ..ui_abstract.drops_table import DropsTable
+from .base_widgets import BetterSpinbox
+from .monster_data_viewer import TkMonsterSelectionWidget
+from .tktracker import TkTracker
+
+
+class TkDropsTableInputWidget(ttk.Frame):
+    """"""
+    def __init__(self, parent, *args, **kwargs) -> None:
+        super().__init__(parent, *args, **kwargs)
+
+        ttk.Label(self, text='Rows to show').grid(row=0, column=0)
+        self.rows = BetterSpinbox(self, from_=0, to=2000)
+        self.rows.grid(row=0, column=1, sticky='w')
+        self.rows.set(50)
+
+        ttk.Label(self, text='Drop/Steal rolls (rng10)').grid(row=1, column=0)
+        self.drop_position = BetterSpinbox(self, from_=0, to=10000)
+        self.drop_position.grid(row=1, column=1, sticky='w')
+
+        ttk.Label(self, text='Rarity rolls (rng11)').grid(row=2, column=0)
+        self.rarity_position = BetterSpinbox(self, from_=0, to=10000)
+        self.rarity_position.grid(row=2, column=1, sticky='w')
+
+        ttk.Label(self, text='Bribe rolls').grid(row=3, column=0)
+        self.bribe_position = BetterSpinbox(self, from_=0, to=10000)
+        self.bribe_position.grid(row=3, column=1, sticky='w')
+
+        ttk.Label(self, text='Monster slot').grid(row=4, column=0)
+        self.monster_slot = BetterSpinbox(self, from_=1, to=8)
+        self.monster_slot.grid(row=4, column=1, sticky='w')
+        self.monster_slot.set(1)
+
+        self.monster_selection = TkMonsterSelectionWidget(self)
+        self.monster_selection.grid(
+            row=10, column=0, columnspan=2, sticky='nsew')
+        self.monster_selection.set_input(
+            '|'.join([''] + sorted(get_monsters_dict())))
+        self.rowconfigure(10, weight=1)
+        self.columnconfigure(1, weight=1)
+
+    def get_input(self) -> str:
+        input_data = [
+            f'monster: {self.monster_selection.get_input()}',
+            f'rows: {self.rows.get()}',
+            f'rng10: {self.drop_position.get()}',
+            f'rng11: {self.rarity_position.get()}',
+            f'bribe rng: {self.bribe_position.get()}',
+            f'monster slot: {self.monster_slot.get()}',
+        ]
+        return '\n'.join(input_data)
+
+    def set_input(self, text: str) -> None:
+        return
+
+    def register_callback(self, callback_func: Callable[[], None]) -> None:
+        self.monster_selection.register_callback(callback_func)
+        self.rows.register_callback(callback_func)
+        self.drop_position.register_callback(callback_func)
+        self.rarity_position.register_callback(callback_func)
+        self.bribe_position.register_callback(callback_func)
+        self.monster_slot.register_callback(callback_func)
+
+
+class TkDropsTable(TkTracker):
+    tracker_type = DropsTable
+    input_widget_type = TkDropsTableInputWidget
+
+    def __init__(self,
+                 parent,
+                 parser: EventParser,
+                 configs: UIWidgetConfigs,
+                 orient: Literal['vertical', 'horizontal'] = 'horizontal',
+                 ) -> None:
+        super().__init__(parent, parser, configs, orient)
+        self.output_widget.text.config(wrap='none')
+        self.output_widget.add_h_scrollbar()
@@ -68,6 +68,18 @@ HELP_TEXTS: dict[UIWidget, str] = {
         a Kill and if that was an Overkill or not and which Character the Death
         has to attributed to is not RNG-related information.
         """,
+    UIWidget.DROPS_TABLE: """is used to look at the Item Drops, Steals and
+        Bribes of a Monster for a range of RNG Rolls.\n\nThe Input consists of
+        a Search Box to search the Output, Spinboxes to choose the number of
+        rows and the first Drop/Steal (rng10), Rarity (rng11) and Bribe RNG
+        Rolls, the Monster Slot used for Bribes and the list of Monsters.
+        \n\nThe Output is a readonly Text that will show for every Roll if the
+        Items would be Dropped or Stolen (the second Steal is after one
+        successful Steal), if the Item would be Rare and the minimum amount of
+        total Gil needed for the Bribe to succeed.\n\nEvery Kill uses 2
+        Drop/Steal Rolls (one for each Item) and every Steal uses 1, Rarity
+        Rolls are only used when an Item is Dropped or Stolen.
+        """,
     UIWidget.ENCOUNTERS: """is used to track and predict Encounters.\n\nThe
         Input consists of a Search Box to search the Output, a Sentry button
         that enables Initiative when applicable, a Padding button that enables
@@ -5,6 +5,7 @@ from .. import __version__
 from ..configs import Configs
 from ..data.constants import UIWidget
 from ..events.parser import EventParser
+from ..events.profiler import PARSER_PROFILER
 from ..gamestate import GameState
 from ..logger import log_exceptions, log_tkinter_error
 from ..tracker import FFXRNGTracker
@@ -52,7 +53,8 @@ def main(*,
         ui.pack(expand=True, fill='both')
 
         def callback_func(seed: int, _: bool) -> None:
-            parser = EventParser(GameState(FFXRNGTracker(seed)))
+            profiler = PARSER_PROFILER if Configs.profile_parsing else None
+            parser = EventParser(GameState(FFXRNGTracker(seed)), profiler)
             name = widget.tracker_type.name
             configs = Configs.ui_widgets[name]
             new_ui = widget(root, parser, configs)
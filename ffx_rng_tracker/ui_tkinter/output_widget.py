@@ -1,3 +1,7 @@
+import re
+import tkinter as tk
+from itertools import chain
+
 from ..configs import Configs, UITagConfigs
 from .base_widgets import ScrollableText
 from .tkinter_utils import get_default_font
@@ -12,14 +16,85 @@ class TkOutputWidget(ScrollableText):
         super().__init__(parent, *args, **kwargs)
         self.text.tag_configure('wrap margin', lmargin2='1c')
         self.tags: dict[str, UITagConfigs] = {}
+        # lines of the text currently shown,
+        # None if the whole text needs to be redrawn
+        self._lines: list[str] | None = None
+        # patterns used to highlight the text currently shown
+        self._patterns: dict[str, re.Pattern] = {}
 
     def print_output(self, output: str) -> None:
+        """Replace the text with output, only the lines that changed
+        since the last call are replaced and highlighted again.
+        """
+        lines = output.split('\n')
         self.text.config(state='normal')
-        self.set(output)
-        self.text.tag_add('wrap margin', '1.0', 'end')
-        for name, tag in self.tags.items():
-            self.highlight_pattern(name, tag.regex_pattern, output)
+        if self._lines is None:
+            self.set(output)
+            self.text.tag_add('wrap margin', '1.0', 'end')
+            self.highlight_patterns(
+                [(n, t.regex_pattern) for n, t in self.tags.items()], output)
+        else:
+            self._update_lines(lines)
+            # tags with a different pattern need to be applied
+            # to the whole text again
+            changed_patterns = [
+                (n, t.regex_pattern) for n, t in self.tags.items()
+                if t.regex_pattern is not self._patterns.get(n)]
+            for name, _ in changed_patterns:
+                self.clean_tag(name)
+            if changed_patterns:
+                self.highlight_patterns(changed_patterns, output)
         self.text.config(state='disabled')
+        self._lines = lines
+        self._patterns = {n: t.regex_pattern for n, t in self.tags.items()}
+
+    def _update_lines(self, lines: list[str]) -> None:
+        """Replace only the lines that changed and highlight them."""
+        old_lines = self._lines
+        max_common = min(len(old_lines), len(lines))
+        prefix = 0
+        while prefix < max_common and old_lines[prefix] == lines[prefix]:
+            prefix += 1
+        if prefix == len(old_lines) == len(lines):
+            return
+        max_common -= prefix
+        suffix = 0
+        while (suffix < max_common
+               and old_lines[-1 - suffix] == lines[-1 - suffix]):
+            suffix += 1
+        changed_lines = lines[prefix:len(lines) - suffix]
+
+        scroll_to_end = self.is_last_line_visible()
+        # tk line indexes start from 1 and the text always
+        # has an additional newline at the end
+        if suffix > 0:
+            start = f'{prefix + 1}.0'
+            end = f'{len(old_lines) - suffix + 1}.0'
+            chunk = ''.join(f'{line}\n' for line in changed_lines)
+        elif prefix > 0:
+            start = f'{prefix}.end'
+            end = 'end'
+            chunk = ''.join(f'\n{line}' for line in changed_lines)
+        else:
+            start = '1.0'
+            end = 'end'
+            chunk = '\n'.join(changed_lines)
+        self.text.replace(start, end, chunk)
+        if scroll_to_end:
+            self.text.yview_pickplace('end')
+
+        if not changed_lines:
+            return
+        first_line = prefix + 1
+        start = f'{first_line}.0'
+        end = f'{first_line + len(changed_lines)}.0'
+        for name in self.tags:
+            self.text.tag_remove(name, start, end)
+        self.text.tag_add('wrap margin', start, end)
+        patterns = [(n, t.regex_pattern) for n, t in self.tags.items()
+                    if t.regex_pattern is self._patterns.get(n)]
+        self.highlight_patterns(
+            patterns, '\n'.join(changed_lines), first_line)
 
     def clean_tag(self, tag_name: str) -> None:
         self.text.tag_remove(tag_name, '1.0', 'end')
@@ -38,6 +113,7 @@ class TkOutputWidget(ScrollableText):
             if tag is None:
                 return
         self.tags[tag_name] = tag
+        self._lines = None
         self.text.tag_configure(
             tagName=tag_name,
             foreground=tag.foreground,
@@ -45,3 +121,160 @@ class TkOutputWidget(ScrollableText):
             selectforeground=tag.select_foreground,
             selectbackground=tag.select_background,
             )
+
+
+class TkVirtualOutputWidget(TkOutputWidget):
+    """Output widget that keeps the whole output as a list of lines
+    and only shows a window of them in the Text widget.
+
+    The window is moved when the view gets close to one of its edges,
+    tags are applied only to the lines in the window.
+    The scrollbar, seek and copying the whole text (Ctrl+A, Ctrl+C)
+    use the full output.
+    """
+    # lines rendered above and below the visible ones
+    margin = 200
+    window_size = 600
+
+    def __init__(self, parent, *args, **kwargs) -> None:
+        super().__init__(parent, *args, **kwargs)
+        self.model: list[str] = []
+        self._window_start = 0
+        self._window_length = 0
+        self._recenter_pending = False
+        self._old_seek_position = (0, 0)
+        self.text.configure(yscrollcommand=self._on_text_scroll)
+        self.v_scrollbar.configure(command=self._on_scrollbar)
+        self.text.bind('<<Copy>>', self._on_copy)
+        self.text.bind('<Control-a>', self._on_select_all)
+
+    def print_output(self, output: str) -> None:
+        at_end = self._is_model_end_visible()
+        top = self._get_visible_lines()[0]
+        self.model = output.split('\n')
+        if at_end:
+            start = max(0, len(self.model) - self.window_size)
+            self._render(start)
+            self.text.yview_pickplace('end')
+        else:
+            self.show_line(top)
+
+    def is_last_line_visible(self) -> bool:
+        # the scroll position is restored by print_output
+        return False
+
+    def show_line(self, line: int) -> None:
+        """Render the window around the line of the output
+        and scroll it to the top of the view.
+        """
+        line = max(0, min(line, len(self.model) - 1))
+        start = max(0, line - self.margin)
+        if start + self.window_size > len(self.model):
+            start = max(0, len(self.model) - self.window_size)
+        self._render(start)
+        self.text.yview(f'{line - start + 1}.0')
+
+    def seek(self, text: str) -> None:
+        self.text.tag_remove('#seek', '1.0', 'end')
+        if not text:
+            self._old_seek_text = ''
+            return
+        if text == self._old_seek_text:
+            line, char = self._old_seek_position
+        else:
+            line, char = self._get_visible_lines()[0], 0
+            self._old_seek_text = text
+        position = self._find(text.lower(), line, char)
+        if position is None:
+            return
+        line, char = position
+        self._old_seek_position = (line, char + 1)
+        if not (self._window_start
+                <= line
+                < self._window_start + self._window_length):
+            self.show_line(line)
+        index = f'{line - self._window_start + 1}.{char}'
+        self.text.see(index)
+        self.text.tag_add('#seek', index, f'{index}+{len(text)}c')
+
+    def _find(self, text: str, line: int, char: int) -> tuple[int, int] | None:
+        """Returns the position of the first occurrence of text
+        after line and char, wrapping around the end of the output.
+        """
+        if line >= len(self.model):
+            line, char = 0, 0
+        index = self.model[line].lower().find(text, char)
+        if index >= 0:
+            return line, index
+        lines = chain(range(line + 1, len(self.model)), range(line + 1))
+        for line in lines:
+            index = self.model[line].lower().find(text)
+            if index >= 0:
+                return line, index
+        return None
+
+    def _render(self, start: int) -> None:
+        lines = self.model[start:start + self.window_size]
+        self._window_start = start
+        self._window_length = len(lines)
+        super().print_output('\n'.join(lines))
+
+    def _get_visible_lines(self) -> tuple[int, int]:
+        """Returns the indexes of the first and last
+        lines of the output that are visible.
+        """
+        first = self.text.index('@0,0')
+        last = self.text.index(f'@0,{self.winfo_height()}')
+        start = self._window_start - 1
+        return start + int(first.split('.')[0]), start + int(last.split('.')[0])
+
+    def _is_model_end_visible(self) -> bool:
+        if self._window_start + self._window_length < len(self.model):
+            return False
+        return super().is_last_line_visible()
+
+    def _on_text_scroll(self, *_: str) -> None:
+        total = len(self.model)
+        if total <= self._window_length:
+            self.v_scrollbar.set(*self.text.yview())
+            return
+        first, last = self._get_visible_lines()
+        self.v_scrollbar.set(first / total, min(1, (last + 1) / total))
+        if self._recenter_pending:
+            return
+        window_end = self._window_start + self._window_length
+        threshold = self.margin // 2
+        if ((first - self._window_start < threshold
+                and self._window_start > 0)
+                or (window_end - last < threshold and window_end < total)):
+            self._recenter_pending = True
+            self.after_idle(self._recenter, first)
+
+    def _recenter(self, line: int) -> None:
+        self._recenter_pending = False
+        self.show_line(line)
+
+    def _on_scrollbar(self, *args: str) -> None:
+        if args[0] == 'moveto' and len(self.model) > self._window_length:
+            self.show_line(int(float(args[1]) * len(self.model)))
+        else:
+            self.text.yview(*args)
+
+    def _on_select_all(self, _: tk.Event) -> str:
+        self.text.event_generate('<<SelectAll>>')
+        return 'break'
+
+    def _on_copy(self, _: tk.Event) -> str | None:
+        """Copy the whole output if the whole window is selected."""
+        try:
+            first = self.text.index('sel.first')
+            last = self.text.index('sel.last')
+        except tk.TclError:
+            return None
+        if (first != '1.0'
+                or self.text.compare(last, '<', 'end-1c')
+                or len(self.model) <= self._window_length):
+            return None
+        self.clipboard_clear()
+        self.clipboard_append('\n'.join(self.model))
+        return 'break'
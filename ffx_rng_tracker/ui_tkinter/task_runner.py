@@ -0,0 +1,97 @@
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from queue import Empty, SimpleQueue
+
+from ..errors import ParsingCancelledError
+from ..ui_abstract.task_runner import Task
+
+
+class TkTaskRunner:
+    """Runs the tasks in a worker thread and calls the callbacks
+    in the tkinter main loop.
+
+    Only the most recently submitted task is kept, older pending
+    tasks are discarded and a running task is asked to stop
+    as soon as a newer one is submitted.
+    """
+
+    def __init__(self, widget: tk.Misc, poll_interval: int = 10) -> None:
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self._condition = threading.Condition()
+        self._running = threading.Lock()
+        self._pending: tuple[int, Task, Callable] | None = None
+        self._generation = 0
+        self._results: SimpleQueue[tuple[int, Callable, object, bool]]
+        self._results = SimpleQueue()
+        self._polling = False
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def submit[T](self, task: Task[T], callback: Callable[[T], None]) -> None:
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, task, callback)
+            self._condition.notify()
+        self._start_polling()
+
+    def cancel(self) -> None:
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+        # wait for the running task to notice it was cancelled
+        with self._running:
+            pass
+
+    def _is_outdated(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                generation, task, callback = self._pending
+                self._pending = None
+                self._running.acquire()
+            try:
+                result = task(lambda: self._is_outdated(generation))
+            except ParsingCancelledError:
+                continue
+            except Exception as error:
+                self._results.put((generation, callback, error, True))
+            else:
+                self._results.put((generation, callback, result, False))
+            finally:
+                self._running.release()
+
+    def _start_polling(self) -> None:
+        if self._polling:
+            return
+        self._polling = True
+        self.widget.after(self.poll_interval, self._poll)
+
+    def _poll(self) -> None:
+        try:
+            self._process_results()
+        finally:
+            with self._condition:
+                idle = self._pending is None and not self._running.locked()
+            if idle and self._results.empty():
+                self._polling = False
+            else:
+                self.widget.after(self.poll_interval, self._poll)
+
+    def _process_results(self) -> None:
+        while True:
+            try:
+                generation, callback, result, failed = self._results.get_nowait()
+            except Empty:
+                return
+            if self._is_outdated(generation):
+                continue
+            if failed:
+                # re-raised in the main loop so that it gets reported
+                # like the errors of any other callback
+                raise result
+            callback(result)
@@ -7,14 +7,15 @@ from ..events.parser import EventParser
 from ..ui_abstract.base_tracker import TrackerUI
 from .base_widgets import TkConfirmPopup, TkWarningPopup
 from .input_widget import TkInputWidget, TkSearchBarWidget
-from .output_widget import TkOutputWidget
+from .output_widget import TkVirtualOutputWidget
+from .task_runner import TkTaskRunner
 from .tkinter_utils import bind_all_children
 
 
 class TkTracker(ttk.PanedWindow):
     tracker_type: type[TrackerUI]
     input_widget_type = TkInputWidget
-    output_widget_type = TkOutputWidget
+    output_widget_type = TkVirtualOutputWidget
 
     def __init__(self,
                  parent,
@@ -54,4 +55,5 @@ class TkTracker(ttk.PanedWindow):
             search_bar=self.search_bar,
             warning_popup=TkWarningPopup(),
             confirmation_popup=TkConfirmPopup(),
+            task_runner=TkTaskRunner(self),
             )
@@ -4,11 +4,14 @@ from tkinter import ttk
 
 from ..configs import Configs
 from ..data.constants import UIWidget
+from ..data.notes import NOTES_REPOSITORY
 from ..events.parser import EventParser
+from ..events.profiler import PARSER_PROFILER
 from ..gamestate import GameState
 from ..tracker import FFXRNGTracker
 from .actions_tracker import TkActionsTracker
 from .configslog import TkConfigsLogViewer
+from .drops_table import TkDropsTable
 from .drops_tracker import TkDropsTracker
 from .encounters_planner import TkEncountersPlanner
 from .encounters_table import TkEncountersTable
@@ -22,6 +25,9 @@ from .yojimbo_tracker import TkYojimboTracker
 
 
 class TkTrackersNotebook(ttk.Notebook):
+    # milliseconds between checks of the notes files when watching them
+    notes_poll_interval = 1000
+
     def __init__(self, parent, *args, **kwargs) -> None:
         super().__init__(parent, *args, **kwargs)
 
@@ -75,6 +81,21 @@ class TkTrackersNotebook(ttk.Notebook):
         if self.configs_log is not None:
             self.insert('end', self.configs_log)
         self.seed_info.register_callback(self.reload_seed_callback_func)
+        if Configs.watch_notes:
+            for tracker in self.trackers:
+                NOTES_REPOSITORY.register_callback(
+                    tracker.tracker.on_notes_changed)
+            NOTES_REPOSITORY.watching = True
+            self.poll_notes()
+
+    def poll_notes(self) -> None:
+        """Reloads the notes files edited outside of the tracker,
+        called periodically when watching the notes.
+        """
+        try:
+            NOTES_REPOSITORY.poll()
+        finally:
+            self.after(self.notes_poll_interval, self.poll_notes)
 
     def reload_seed_callback_func(self, seed: int, reload_notes: bool) -> None:
         root = self.winfo_toplevel()
@@ -96,7 +117,8 @@ class TkTrackersNotebook(ttk.Notebook):
         configs = Configs.ui_widgets[name]
         if not configs.shown:
             return
-        parser = EventParser(GameState(FFXRNGTracker(seed)))
+        profiler = PARSER_PROFILER if Configs.profile_parsing else None
+        parser = EventParser(GameState(FFXRNGTracker(seed)), profiler)
         if configs.windowed:
             window = self.make_new_toplevel(name)
             tracker = tracker_type(window, parser, configs)
@@ -109,6 +131,7 @@ class TkTrackersNotebook(ttk.Notebook):
 
 TRACKERS: tuple[type[TkTracker], ...] = (
     TkDropsTracker,
+    TkDropsTable,
     TkEncountersTracker,
     TkStepsTracker,
     TkEncountersPlanner,
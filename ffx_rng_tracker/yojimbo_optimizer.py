@@ -0,0 +1,188 @@
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+
+from .data.actions import YOJIMBO_ACTIONS, YojimboAction
+from .data.monsters import Monster, get_monsters_dict
+from .events.yojimbo_turn import is_attack_free, roll_free_attack, roll_gil
+from .tracker import FFXRNGTracker
+
+# rng17 position, compatibility and overdrive availability
+type YojimboState = tuple[int, int, bool]
+# the most rng17 values used by a turn
+RNG17_PER_TURN = 3
+
+
+@dataclass(frozen=True)
+class YojimboTurnOutcome:
+    requested: YojimboAction
+    overdrive: bool
+    action: YojimboAction
+    gil: int
+    motivation: int
+    is_attack_free: bool
+
+    def __str__(self) -> str:
+        cost = 'free' if self.is_attack_free else f'{self.gil} gil'
+        overdrive = ' (OD used)' if self.overdrive else ''
+        return f'{self.action}: {cost}{overdrive} [{self.motivation}]'
+
+
+@dataclass
+class YojimboPlan:
+    turns: list[YojimboTurnOutcome]
+    gil: int
+    monster_name: str
+
+    def __str__(self) -> str:
+        lines = [f'Total gil: {self.gil}']
+        lines.extend([f'{i}: {t}' for i, t in enumerate(self.turns, 1)])
+        return '\n'.join(lines)
+
+    def to_notes(self) -> str:
+        """Returns the lines used by the yojimbo tracker."""
+        lines = []
+        for turn in self.turns:
+            action_name = next(k for k, v in YOJIMBO_ACTIONS.items()
+                               if v == turn.requested)
+            overdrive = ' overdrive' if turn.overdrive else ''
+            lines.append(f'{action_name} {self.monster_name}{overdrive}')
+        return '\n'.join(lines)
+
+
+class _RNGCursor:
+    """Reads the values of rng17 from a position,
+    used in place of advancing the tracker.
+    """
+
+    def __init__(self, values: list[int], position: int) -> None:
+        self.values = values
+        self.position = position
+
+    def __call__(self, index: int) -> int:
+        value = self.values[self.position]
+        self.position += 1
+        return value
+
+
+@dataclass
+class YojimboOptimizer:
+    """Searches the yojimbo turns that result in the target
+    attack (or a stronger one) for the lowest total gil,
+    within horizon turns.
+
+    Every turn either is a free attack, which only depends on
+    the state, or is one outcome for every requested action
+    and use of the overdrive. The search is best-first on the
+    gil spent and states (rng17 position, compatibility and
+    overdrive availability) are only expanded again when reached
+    in fewer turns, so turns that reach the same state share
+    the branches after them.
+    """
+    rng_tracker: FFXRNGTracker
+    monster_name: str
+    target: YojimboAction = YOJIMBO_ACTIONS['zanmato']
+    horizon: int = 10
+    max_states: int = 100_000
+    monster: Monster = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.monster = get_monsters_dict()[self.monster_name]
+        self._values: list[int] = []
+
+    def _get_cursor(self, position: int) -> _RNGCursor:
+        stop = position + RNG17_PER_TURN
+        if stop > len(self._values):
+            self._values = self.rng_tracker.get_rng_values(17, 0, stop * 2)
+        return _RNGCursor(self._values, position)
+
+    def get_outcomes(self,
+                     state: YojimboState,
+                     first_turn: bool,
+                     ) -> list[tuple[YojimboTurnOutcome, YojimboState]]:
+        """Returns the outcome of every choice for a turn
+        and the state after it.
+        """
+        position, compatibility, overdrive = state
+        cursor = self._get_cursor(position)
+        if is_attack_free(compatibility, cursor):
+            action, motivation = roll_free_attack(
+                compatibility, self.monster, cursor)
+            outcome = YojimboTurnOutcome(
+                YOJIMBO_ACTIONS['dismiss'], False, action, 0, motivation,
+                True)
+            new_state = (cursor.position,
+                         _add_compatibility(
+                             compatibility, action.compatibility_modifier),
+                         overdrive)
+            return [(outcome, new_state)]
+        free_check_position = cursor.position
+        outcomes = []
+        for name, action in YOJIMBO_ACTIONS.items():
+            if name == 'autodismiss':
+                continue
+            if name == 'first_turn_dismiss' and not first_turn:
+                continue
+            new_compatibility = _add_compatibility(
+                compatibility, action.compatibility_modifier)
+            if action.needed_motivation is None:
+                outcome = YojimboTurnOutcome(
+                    action, False, action, 0, 0, False)
+                new_state = (free_check_position, new_compatibility, overdrive)
+                outcomes.append((outcome, new_state))
+                continue
+            for use_overdrive in (False, True) if overdrive else (False,):
+                cursor.position = free_check_position
+                gil, motivation = roll_gil(
+                    compatibility, action, self.monster, use_overdrive, cursor)
+                outcome = YojimboTurnOutcome(
+                    action, use_overdrive, action, gil, motivation, False)
+                new_state = (cursor.position,
+                             new_compatibility,
+                             overdrive and not use_overdrive)
+                outcomes.append((outcome, new_state))
+        return outcomes
+
+    def search(self,
+               compatibility: int,
+               overdrive: bool = False,
+               start: int | None = None,
+               ) -> YojimboPlan | None:
+        """Returns the cheapest plan, the search starts from
+        the current rng17 position by default.
+        """
+        if start is None:
+            start = self.rng_tracker.rng_current_positions[17]
+        compatibility = _add_compatibility(compatibility, 0)
+        target_motivation = self.target.needed_motivation
+        tie = count()
+        # gil, turns, tie, state, turns outcomes, target reached
+        queue = [(0, 0, next(tie), (start, compatibility, overdrive), (),
+                  False)]
+        # fewest turns used to reach every expanded state
+        expanded: dict[YojimboState, int] = {}
+        while queue and len(expanded) < self.max_states:
+            gil, n_turns, _, state, turns, reached = heapq.heappop(queue)
+            if reached:
+                return YojimboPlan(list(turns), gil, self.monster_name)
+            if (n_turns >= self.horizon
+                    or expanded.get(state, self.horizon) <= n_turns):
+                continue
+            expanded[state] = n_turns
+            for outcome, new_state in self.get_outcomes(state, n_turns == 0):
+                needed_motivation = outcome.action.needed_motivation
+                heapq.heappush(queue, (
+                    gil + outcome.gil,
+                    n_turns + 1,
+                    next(tie),
+                    new_state,
+                    (*turns, outcome),
+                    (needed_motivation is not None
+                     and needed_motivation >= target_motivation),
+                ))
+        return None
+
+
+def _add_compatibility(compatibility: int, modifier: int) -> int:
+    """Returns the compatibility clamped like the gamestate does."""
+    return min(max(0, compatibility + modifier), 255)